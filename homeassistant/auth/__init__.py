@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import OrderedDict
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from datetime import timedelta
 import time
 from typing import Any, cast
@@ -23,6 +23,11 @@ EVENT_USER_ADDED = "user_added"
 EVENT_USER_UPDATED = "user_updated"
 EVENT_USER_REMOVED = "user_removed"
 
+# Upper bound of validated access tokens remembered by the auth manager
+ACCESS_TOKEN_CACHE_SIZE = 256
+# Leeway in seconds allowed for the time claims of access tokens
+ACCESS_TOKEN_LEEWAY = 10
+
 _MfaModuleDict = dict[str, MultiFactorAuthModule]
 _ProviderKey = tuple[str, str | None]
 _ProviderDict = dict[_ProviderKey, AuthProvider]
@@ -158,6 +163,11 @@ class AuthManager:
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
         self._revoke_callbacks: dict[str, list[CALLBACK_TYPE]] = {}
+        # Access token -> refresh token, iat and exp of tokens which have
+        # been validated, so validating them again skips the signature check
+        self._validated_access_tokens: OrderedDict[
+            str, tuple[models.RefreshToken, float, float]
+        ] = OrderedDict()
 
     @property
     def auth_providers(self) -> list[AuthProvider]:
@@ -310,6 +320,7 @@ class AuthManager:
             await asyncio.gather(*tasks)
 
         await self._store.async_remove_user(user)
+        self._async_forget_access_tokens(lambda token: token.user is user)
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
 
@@ -350,6 +361,7 @@ class AuthManager:
         if user.is_owner:
             raise ValueError("Unable to deactivate the owner")
         await self._store.async_deactivate_user(user)
+        self._async_forget_access_tokens(lambda token: token.user is user)
 
     async def async_remove_credentials(self, credentials: models.Credentials) -> None:
         """Remove credentials."""
@@ -473,6 +485,7 @@ class AuthManager:
     ) -> None:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
+        self._async_forget_access_tokens(lambda token: token is refresh_token)
 
         callbacks = self._revoke_callbacks.pop(refresh_token.id, [])
         for revoke_callback in callbacks:
@@ -551,10 +564,32 @@ class AuthManager:
         if provider := self._async_resolve_provider(refresh_token):
             provider.async_validate_refresh_token(refresh_token, remote_ip)
 
+    @callback
+    def _async_forget_access_tokens(
+        self, predicate: Callable[[models.RefreshToken], bool]
+    ) -> None:
+        """Forget the validated access tokens of matching refresh tokens."""
+        for access_token, (refresh_token, _, _) in list(
+            self._validated_access_tokens.items()
+        ):
+            if predicate(refresh_token):
+                del self._validated_access_tokens[access_token]
+
     async def async_validate_access_token(
         self, token: str
     ) -> models.RefreshToken | None:
         """Return refresh token if an access token is valid."""
+        validated_access_tokens = self._validated_access_tokens
+        if (validated := validated_access_tokens.get(token)) is not None:
+            refresh_token, issued_at, expires_at = validated
+            if (
+                issued_at - ACCESS_TOKEN_LEEWAY <= time.time() < expires_at
+                and refresh_token.user.is_active
+            ):
+                validated_access_tokens.move_to_end(token)
+                return refresh_token
+            del validated_access_tokens[token]
+
         try:
             unverif_claims = jwt_wrapper.unverified_hs256_token_decode(token)
         except jwt.InvalidTokenError:
@@ -572,8 +607,12 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt_wrapper.verify_and_decode(
-                token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
+            claims = jwt_wrapper.verify_and_decode(
+                token,
+                jwt_key,
+                leeway=ACCESS_TOKEN_LEEWAY,
+                issuer=issuer,
+                algorithms=["HS256"],
             )
         except jwt.InvalidTokenError:
             return None
@@ -581,6 +620,9 @@ class AuthManager:
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        validated_access_tokens[token] = (refresh_token, claims["iat"], claims["exp"])
+        if len(validated_access_tokens) > ACCESS_TOKEN_CACHE_SIZE:
+            validated_access_tokens.popitem(last=False)
         return refresh_token
 
     @callback
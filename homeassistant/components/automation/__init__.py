@@ -6,6 +6,7 @@ import asyncio
 from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 import logging
+import time
 from typing import Any, Protocol, cast
 
 import voluptuous as vol
@@ -96,6 +97,7 @@ from .const import (
     CONF_TRACE,
     CONF_TRIGGER,
     CONF_TRIGGER_VARIABLES,
+    DATA_RELOAD_STATISTICS,
     DEFAULT_INITIAL_STATE,
     DOMAIN,
     LOGGER,
@@ -283,10 +285,14 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     async def reload_service_handler(service_call: ServiceCall) -> None:
         """Remove all automations and load new ones from config."""
+        start = time.monotonic()
         await async_get_blueprints(hass).async_reset_cache()
         if (conf := await component.async_prepare_reload(skip_reset=True)) is None:
             return
         await _async_process_config(hass, conf, component)
+        duration = time.monotonic() - start
+        hass.data[DATA_RELOAD_STATISTICS]["reload_duration"] = round(duration, 3)
+        LOGGER.debug("Reloaded automations in %.3f seconds", duration)
         hass.bus.async_fire(EVENT_AUTOMATION_RELOADED, context=service_call.context)
 
     reload_helper = ReloadServiceHelper(reload_service_handler)
@@ -955,6 +961,18 @@ async def _async_process_config(
     # Find automations and configurations which have matches
     automation_matches, config_matches = find_matches(automations, automation_configs)
 
+    hass.data[DATA_RELOAD_STATISTICS] = reload_statistics = {
+        "kept": len(automation_matches),
+        "removed": len(automations) - len(automation_matches),
+        "created": len(automation_configs) - len(config_matches),
+    }
+    LOGGER.debug(
+        "Keeping %d unchanged automations, removing %d and creating %d",
+        reload_statistics["kept"],
+        reload_statistics["removed"],
+        reload_statistics["created"],
+    )
+
     # Remove automations which have changed config or no longer exist
     tasks = [
         automation.async_remove()
@@ -4,6 +4,8 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Mapping
 from contextlib import suppress
+from copy import deepcopy
+from dataclasses import dataclass
 from typing import Any
 
 import voluptuous as vol
@@ -23,6 +25,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_per_platform, config_validation as cv, script
 from homeassistant.helpers.condition import async_validate_conditions_config
+from homeassistant.helpers.reload import async_forget_on_registry_update
 from homeassistant.helpers.trigger import async_validate_trigger_config
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.yaml.input import UndefinedSubstitution
@@ -41,6 +44,8 @@ from .helpers import async_get_blueprints
 
 PACKAGE_MERGE_HINT = "list"
 
+DATA_VALIDATED_CONFIGS = "automation_validated_configs"
+
 _MINIMAL_PLATFORM_SCHEMA = vol.Schema(
     {
         CONF_ID: str,
@@ -233,16 +238,50 @@ class AutomationConfig(dict):
     validation_failed: bool = False
 
 
+@dataclass(slots=True)
+class _ValidatedConfigItem:
+    """A validated config item and the config it was validated from."""
+
+    config: Any
+    blueprint_data: dict[str, Any] | None
+    validated_config: AutomationConfig
+
+
 async def _try_async_validate_config_item(
     hass: HomeAssistant,
     config: dict[str, Any],
+    previous_items: dict[Any, list[_ValidatedConfigItem]],
+    validated_items: dict[Any, list[_ValidatedConfigItem]],
 ) -> AutomationConfig | None:
-    """Validate config item."""
+    """Validate config item.
+
+    The validated config of the previous run is reused if neither the config
+    item nor the blueprint it uses has changed.
+    """
+    key = config.get(CONF_ID) if isinstance(config, Mapping) else None
+    if not isinstance(key, str):
+        key = None
+    blueprint_data = await async_get_blueprints(hass).async_get_blueprint_data(config)
+
+    candidates = previous_items.get(key, [])
+    for idx, item in enumerate(candidates):
+        if item.config == config and item.blueprint_data == blueprint_data:
+            # Every cached item is only reused once
+            del candidates[idx]
+            validated_items.setdefault(key, []).append(item)
+            return item.validated_config
+
     try:
-        return await _async_validate_config_item(hass, config, False, True)
+        validated_config = await _async_validate_config_item(hass, config, False, True)
     except (vol.Invalid, HomeAssistantError):
         return None
 
+    if not validated_config.validation_failed:
+        validated_items.setdefault(key, []).append(
+            _ValidatedConfigItem(deepcopy(config), blueprint_data, validated_config)
+        )
+    return validated_config
+
 
 async def async_validate_config_item(
     hass: HomeAssistant,
@@ -255,17 +294,26 @@ async def async_validate_config_item(
 
 async def async_validate_config(hass: HomeAssistant, config: ConfigType) -> ConfigType:
     """Validate config."""
+    previous_items: dict[Any, list[_ValidatedConfigItem]] = hass.data.get(
+        DATA_VALIDATED_CONFIGS, {}
+    )
+    validated_items: dict[Any, list[_ValidatedConfigItem]] = {}
     automations = list(
         filter(
             lambda x: x is not None,
             await asyncio.gather(
                 *(
-                    _try_async_validate_config_item(hass, p_config)
+                    _try_async_validate_config_item(
+                        hass, p_config, previous_items, validated_items
+                    )
                     for _, p_config in config_per_platform(config, DOMAIN)
                 )
             ),
         )
     )
+    if DATA_VALIDATED_CONFIGS not in hass.data:
+        async_forget_on_registry_update(hass, DATA_VALIDATED_CONFIGS)
+    hass.data[DATA_VALIDATED_CONFIGS] = validated_items
 
     # Create a copy of the configuration with all config for current
     # component removed and add validated config back in.
@@ -16,4 +16,6 @@ CONF_TRACE = "trace"
 
 DEFAULT_INITIAL_STATE = True
 
+DATA_RELOAD_STATISTICS = "automation_reload_statistics"
+
 LOGGER = logging.getLogger(__package__)
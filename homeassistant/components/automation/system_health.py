@@ -0,0 +1,14 @@
+"""Provide info to system health."""
+from homeassistant.components import system_health
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.reload import reload_statistics_info
+
+from .const import DATA_RELOAD_STATISTICS
+
+
+@callback
+def async_register(
+    hass: HomeAssistant, register: system_health.SystemHealthRegistration
+) -> None:
+    """Register system health callbacks."""
+    register.async_register_info(reload_statistics_info(DATA_RELOAD_STATISTICS))
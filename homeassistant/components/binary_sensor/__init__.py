@@ -186,6 +186,8 @@ class BinarySensorEntityDescription(EntityDescription):
 class BinarySensorEntity(Entity):
     """Represent a binary sensor."""
 
+    _static_properties = frozenset({"device_class", "_default_to_device_class_name"})
+
     entity_description: BinarySensorEntityDescription
     _attr_device_class: BinarySensorDeviceClass | None
     _attr_is_on: bool | None = None
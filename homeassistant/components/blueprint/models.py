@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
+from contextlib import suppress
 import logging
 import pathlib
 import shutil
@@ -43,7 +44,11 @@ from .errors import (
     InvalidBlueprintInputs,
     MissingInput,
 )
-from .schemas import BLUEPRINT_INSTANCE_FIELDS, BLUEPRINT_SCHEMA
+from .schemas import (
+    BLUEPRINT_INSTANCE_FIELDS,
+    BLUEPRINT_SCHEMA,
+    is_blueprint_instance_config,
+)
 
 
 class Blueprint:
@@ -290,6 +295,17 @@ class DomainBlueprints:
             self._blueprints[blueprint_path] = blueprint
             return blueprint
 
+    async def async_get_blueprint_data(self, config: Any) -> dict[str, Any] | None:
+        """Return the data of the blueprint a config item uses, if any."""
+        if not is_blueprint_instance_config(config):
+            return None
+        with suppress(HomeAssistantError, KeyError, TypeError):
+            blueprint = await self.async_get_blueprint(
+                config[CONF_USE_BLUEPRINT][CONF_PATH]
+            )
+            return blueprint.data
+        return None
+
     async def async_inputs_from_config(
         self, config_with_blueprint: dict
     ) -> BlueprintInputs:
@@ -83,6 +83,8 @@ class ButtonEntityDescription(EntityDescription):
 class ButtonEntity(RestoreEntity):
     """Representation of a Button entity."""
 
+    _static_properties = frozenset({"device_class", "_default_to_device_class_name"})
+
     entity_description: ButtonEntityDescription
     _attr_should_poll = False
     _attr_device_class: ButtonDeviceClass | None
@@ -5,13 +5,14 @@ import asyncio
 import collections
 from collections.abc import Awaitable, Callable, Iterable
 from contextlib import suppress
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
 from enum import IntFlag
 from functools import partial
 import logging
 import os
 from random import SystemRandom
+import time
 from typing import Any, Final, cast, final
 
 from aiohttp import hdrs, web
@@ -66,6 +67,7 @@ from .const import (  # noqa: F401
     CONF_LOOKBACK,
     DATA_CAMERA_PREFS,
     DATA_RTSP_TO_WEB_RTC,
+    DEFAULT_SNAPSHOT_CACHE_TTL,
     DOMAIN,
     PREF_ORIENTATION,
     PREF_PRELOAD_STREAM,
@@ -152,6 +154,72 @@ async def async_request_stream(hass: HomeAssistant, entity_id: str, fmt: str) ->
     return await _async_stream_endpoint_url(hass, camera, fmt)
 
 
+_SnapshotKey = tuple[int | None, int | None]
+
+
+@dataclass(slots=True)
+class SnapshotCache:
+    """Snapshots of a camera shared between concurrent and repeated requests.
+
+    A single fetch is in flight per camera and requested size, and its
+    result is returned to further requests for the same size until it is
+    older than the snapshot_cache_ttl of the camera.
+    """
+
+    hits: int = 0
+    coalesced: int = 0
+    misses: int = 0
+    images: dict[_SnapshotKey, tuple[float, Image]] = field(default_factory=dict)
+    fetches: dict[_SnapshotKey, asyncio.Task[Image | None]] = field(
+        default_factory=dict
+    )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters of the cache."""
+        return {"hits": self.hits, "coalesced": self.coalesced, "misses": self.misses}
+
+
+async def _async_fetch_image(
+    camera: Camera,
+    timeout: int,
+    width: int | None,
+    height: int | None,
+) -> Image | None:
+    """Fetch a snapshot image from a camera and cache it."""
+    image_bytes: bytes | None = None
+    with suppress(asyncio.CancelledError, asyncio.TimeoutError):
+        async with asyncio.timeout(timeout):
+            image_bytes = (
+                await _async_get_stream_image(
+                    camera, width=width, height=height, wait_for_next_keyframe=False
+                )
+                if camera.use_stream_for_stills
+                else await camera.async_camera_image(width=width, height=height)
+            )
+    if not image_bytes:
+        # Later requests must not get an image older than a failed fetch
+        camera.snapshot_cache.images.pop((width, height), None)
+        return None
+
+    content_type = camera.content_type
+    image = Image(content_type, image_bytes)
+    if (
+        width is not None
+        and height is not None
+        and ("jpeg" in content_type or "jpg" in content_type)
+    ):
+        image = Image(content_type, scale_jpeg_camera_image(image, width, height))
+
+    if (ttl := camera.snapshot_cache_ttl) > 0:
+        images = camera.snapshot_cache.images
+        now = time.monotonic()
+        for key, (fetched_at, _) in list(images.items()):
+            if now - fetched_at >= ttl:
+                del images[key]
+        images[(width, height)] = (now, image)
+    return image
+
+
 async def _async_get_image(
     camera: Camera,
     timeout: int = 10,
@@ -166,29 +234,27 @@ async def _async_get_image(
     that we can scale, however the majority of cases
     are handled.
     """
-    with suppress(asyncio.CancelledError, asyncio.TimeoutError):
-        async with asyncio.timeout(timeout):
-            image_bytes = (
-                await _async_get_stream_image(
-                    camera, width=width, height=height, wait_for_next_keyframe=False
-                )
-                if camera.use_stream_for_stills
-                else await camera.async_camera_image(width=width, height=height)
-            )
-            if image_bytes:
-                content_type = camera.content_type
-                image = Image(content_type, image_bytes)
-                if (
-                    width is not None
-                    and height is not None
-                    and ("jpeg" in content_type or "jpg" in content_type)
-                ):
-                    assert width is not None
-                    assert height is not None
-                    return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
-                    )
+    cache = camera.snapshot_cache
+    key = (width, height)
+    if (cached := cache.images.get(key)) is not None and (
+        time.monotonic() - cached[0] < camera.snapshot_cache_ttl
+    ):
+        cache.hits += 1
+        return cached[1]
+
+    if (fetch := cache.fetches.get(key)) is None:
+        cache.misses += 1
+        fetch = cache.fetches[key] = camera.hass.async_create_task(
+            _async_fetch_image(camera, timeout, width, height),
+            f"camera snapshot {camera.entity_id}",
+        )
+        fetch.add_done_callback(lambda _: cache.fetches.pop(key, None))
+    else:
+        cache.coalesced += 1
 
+    with suppress(asyncio.TimeoutError):
+        async with asyncio.timeout(timeout):
+            if image := await asyncio.shield(fetch):
                 return image
 
     raise HomeAssistantError("Unable to get image")
@@ -247,6 +313,28 @@ async def async_get_mjpeg_stream(
     return stream
 
 
+def _mjpeg_frame(content_type: str, img_bytes: bytes) -> bytes:
+    """Return an image as a part of an MJPEG stream."""
+    return (
+        bytes(
+            "--frameboundary\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(img_bytes)}\r\n\r\n",
+            "utf-8",
+        )
+        + img_bytes
+        + b"\r\n"
+    )
+
+
+async def _async_prepare_mjpeg_response(request: web.Request) -> web.StreamResponse:
+    """Prepare the response of an MJPEG stream."""
+    response = web.StreamResponse()
+    response.content_type = CONTENT_TYPE_MULTIPART.format("--frameboundary")
+    await response.prepare(request)
+    return response
+
+
 async def async_get_still_stream(
     request: web.Request,
     image_cb: Callable[[], Awaitable[bytes | None]],
@@ -257,23 +345,7 @@ async def async_get_still_stream(
 
     This method must be run in the event loop.
     """
-    response = web.StreamResponse()
-    response.content_type = CONTENT_TYPE_MULTIPART.format("--frameboundary")
-    await response.prepare(request)
-
-    async def write_to_mjpeg_stream(img_bytes: bytes) -> None:
-        """Write image to stream."""
-        await response.write(
-            bytes(
-                "--frameboundary\r\n"
-                f"Content-Type: {content_type}\r\n"
-                f"Content-Length: {len(img_bytes)}\r\n\r\n",
-                "utf-8",
-            )
-            + img_bytes
-            + b"\r\n"
-        )
-
+    response = await _async_prepare_mjpeg_response(request)
     last_image = None
 
     while True:
@@ -282,12 +354,12 @@ async def async_get_still_stream(
             break
 
         if img_bytes != last_image:
-            await write_to_mjpeg_stream(img_bytes)
+            await response.write(_mjpeg_frame(content_type, img_bytes))
 
             # Chrome seems to always ignore first picture,
             # print it twice.
             if last_image is None:
-                await write_to_mjpeg_stream(img_bytes)
+                await response.write(_mjpeg_frame(content_type, img_bytes))
             last_image = img_bytes
 
         await asyncio.sleep(interval)
@@ -295,6 +367,90 @@ async def async_get_still_stream(
     return response
 
 
+class StillStreamBroadcaster:
+    """Fetch the images of an MJPEG still stream once for all its viewers.
+
+    Images are fetched while there are viewers. Each viewer holds at most
+    one image waiting to be written, a viewer which cannot keep up skips
+    images instead of slowing down the others.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        image_cb: Callable[[], Awaitable[bytes | None]],
+        content_type: str,
+        interval: float,
+    ) -> None:
+        """Initialize the broadcaster."""
+        self.hass = hass
+        self.image_cb = image_cb
+        self.content_type = content_type
+        self.interval = interval
+        self.viewers: set[asyncio.Queue[bytes | None]] = set()
+        self._task: asyncio.Task[None] | None = None
+        self._last_image: bytes | None = None
+
+    @staticmethod
+    def _offer(viewer: asyncio.Queue[bytes | None], img_bytes: bytes | None) -> None:
+        """Replace the image a viewer has not written yet."""
+        if viewer.full():
+            viewer.get_nowait()
+        viewer.put_nowait(img_bytes)
+
+    async def _async_fetch_images(self) -> None:
+        """Fetch images and offer them to the viewers."""
+        img_bytes: bytes | None = None
+        try:
+            while self.viewers:
+                img_bytes = await self.image_cb()
+                if not img_bytes:
+                    break
+                if img_bytes != self._last_image:
+                    self._last_image = img_bytes
+                    for viewer in self.viewers:
+                        self._offer(viewer, img_bytes)
+                await asyncio.sleep(self.interval)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error fetching the images of a camera still stream")
+        finally:
+            if self._task is asyncio.current_task():
+                self._task = None
+                self._last_image = None
+                # End the streams of the viewers
+                for viewer in self.viewers:
+                    self._offer(viewer, None)
+
+    async def async_handle(self, request: web.Request) -> web.StreamResponse:
+        """Stream the images to a viewer."""
+        viewer: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=1)
+        if self._last_image is not None:
+            viewer.put_nowait(self._last_image)
+        self.viewers.add(viewer)
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._async_fetch_images(), "camera still stream"
+            )
+        try:
+            response = await _async_prepare_mjpeg_response(request)
+            first = True
+            while img_bytes := await viewer.get():
+                frame = _mjpeg_frame(self.content_type, img_bytes)
+                await response.write(frame)
+                # Chrome seems to always ignore first picture,
+                # print it twice.
+                if first:
+                    await response.write(frame)
+                    first = False
+        finally:
+            self.viewers.discard(viewer)
+            if not self.viewers and self._task is not None:
+                self._task.cancel()
+                self._task = None
+                self._last_image = None
+        return response
+
+
 def _get_camera_from_entity_id(hass: HomeAssistant, entity_id: str) -> Camera:
     """Get camera component from entity_id."""
     if (component := hass.data.get(DOMAIN)) is None:
@@ -463,6 +619,7 @@ class Camera(Entity):
     _attr_model: str | None = None
     _attr_motion_detection_enabled: bool = False
     _attr_should_poll: bool = False  # No need to poll cameras
+    _attr_snapshot_cache_ttl: float = DEFAULT_SNAPSHOT_CACHE_TTL
     _attr_state: None = None  # State is determined by is_on
     _attr_supported_features: CameraEntityFeature = CameraEntityFeature(0)
 
@@ -476,6 +633,8 @@ class Camera(Entity):
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
         self._rtsp_to_webrtc = False
+        self.snapshot_cache = SnapshotCache()
+        self._still_stream_broadcasters: dict[float, StillStreamBroadcaster] = {}
 
     @property
     def entity_picture(self) -> str:
@@ -524,6 +683,15 @@ class Camera(Entity):
         """Return the interval between frames of the mjpeg stream."""
         return self._attr_frame_interval
 
+    @property
+    def snapshot_cache_ttl(self) -> float:
+        """Return the seconds a snapshot is shared with further requests.
+
+        Snapshots are not shared when this is 0, the default, but
+        concurrent requests for the same size still share a single fetch.
+        """
+        return self._attr_snapshot_cache_ttl
+
     @property
     def frontend_stream_type(self) -> StreamType | None:
         """Return the type of stream supported by this camera.
@@ -612,10 +780,20 @@ class Camera(Entity):
     async def handle_async_still_stream(
         self, request: web.Request, interval: float
     ) -> web.StreamResponse:
-        """Generate an HTTP MJPEG stream from camera images."""
-        return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
-        )
+        """Generate an HTTP MJPEG stream from camera images.
+
+        Viewers of the same interval share the images fetched for it.
+        """
+        broadcasters = self._still_stream_broadcasters
+        if (broadcaster := broadcasters.get(interval)) is None:
+            broadcaster = broadcasters[interval] = StillStreamBroadcaster(
+                self.hass, self.async_camera_image, self.content_type, interval
+            )
+        try:
+            return await broadcaster.async_handle(request)
+        finally:
+            if not broadcaster.viewers and broadcasters.get(interval) is broadcaster:
+                del broadcasters[interval]
 
     async def handle_async_mjpeg_stream(
         self, request: web.Request
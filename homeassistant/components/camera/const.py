@@ -17,6 +17,9 @@ CONF_DURATION: Final = "duration"
 
 CAMERA_STREAM_SOURCE_TIMEOUT: Final = 10
 CAMERA_IMAGE_TIMEOUT: Final = 10
+# Seconds a snapshot is shared with further requests for the same size,
+# by default only requests made while it is being fetched share it
+DEFAULT_SNAPSHOT_CACHE_TTL: Final = 0.0
 
 
 class StreamType(StrEnum):
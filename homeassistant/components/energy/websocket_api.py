@@ -14,6 +14,9 @@ import voluptuous as vol
 
 from homeassistant.components import recorder, websocket_api
 from homeassistant.components.recorder.statistics import StatisticsRow
+from homeassistant.components.recorder.statistics_cache import (
+    async_get_statistics_cache,
+)
 from homeassistant.const import UnitOfEnergy
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.integration_platform import (
@@ -265,14 +268,13 @@ async def ws_get_fossil_energy_consumption(
     statistic_ids = set(msg["energy_statistic_ids"])
     statistic_ids.add(msg["co2_statistic_id"])
 
-    # Fetch energy + CO2 statistics
+    # Fetch energy + CO2 statistics, the hours compiled by an earlier
+    # request for the same range are served from the cache
     statistics = await recorder.get_instance(hass).async_add_executor_job(
-        recorder.statistics.statistics_during_period,
-        hass,
+        async_get_statistics_cache(hass).hourly_statistics_during_period,
         start_time,
         end_time,
         statistic_ids,
-        "hour",
         {"energy": UnitOfEnergy.KILO_WATT_HOUR},
         {"mean", "change"},
     )
@@ -106,6 +106,7 @@ class EventEntity(RestoreEntity):
     """Representation of an Event entity."""
 
     _entity_component_unrecorded_attributes = frozenset({ATTR_EVENT_TYPES})
+    _static_properties = frozenset({"device_class", "_default_to_device_class_name"})
 
     entity_description: EventEntityDescription
     _attr_device_class: EventDeviceClass | None
@@ -371,7 +371,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         ("frontend_latest", not is_dev),
         ("frontend_es5", not is_dev),
     ):
-        hass.http.register_static_path(f"/{path}", str(root_path / path), should_cache)
+        hass.http.register_static_path(
+            f"/{path}", str(root_path / path), should_cache, should_cache
+        )
 
     hass.http.register_static_path(
         "/auth/authorize", str(root_path / "authorize.html"), False
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable, MutableMapping
+from collections.abc import AsyncGenerator, Callable, Iterable, MutableMapping
 from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
@@ -62,6 +62,48 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_stream)
 
 
+def _get_significant_states(
+    hass: HomeAssistant,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> MutableMapping[str, list[State | dict[str, Any]]]:
+    """Fetch compressed significant states from memory, or the database."""
+    if (
+        entity_ids
+        and significant_changes_only
+        and no_attributes
+        and (
+            states := history.get_significant_states_from_cache(
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                minimal_response,
+            )
+        )
+        is not None
+    ):
+        return states
+    return history.get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+    )
+
+
 def _ws_get_significant_states(
     hass: HomeAssistant,
     msg_id: int,
@@ -77,17 +119,15 @@ def _ws_get_significant_states(
     return JSON_DUMP(
         messages.result_message(
             msg_id,
-            history.get_significant_states(
+            _get_significant_states(
                 hass,
                 start_time,
                 end_time,
                 entity_ids,
-                None,
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
                 no_attributes,
-                True,
             ),
         )
     )
@@ -224,17 +264,15 @@ def _generate_historical_response(
     """Generate a historical response."""
     states = cast(
         MutableMapping[str, list[dict[str, Any]]],
-        history.get_significant_states(
+        _get_significant_states(
             hass,
             start_time,
             end_time,
             entity_ids,
-            None,
             include_start_time_state,
             significant_changes_only,
             minimal_response,
             no_attributes,
-            True,
         ),
     )
     last_time_ts = 0.0
@@ -263,6 +301,48 @@ def _generate_historical_response(
     )
 
 
+async def _async_iter_historical_responses(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    entity_batch_size: int | None,
+) -> AsyncGenerator[tuple[float, dt | None, str | None], None]:
+    """Fetch historical responses in batches of entity_batch_size entities.
+
+    Each batch is fetched and serialized in the recorder executor only
+    after the previous one was consumed, so only one batch is held in
+    memory at a time.
+    """
+    instance = get_instance(hass)
+    if not entity_ids or not entity_batch_size:
+        batches: list[list[str] | None] = [entity_ids]
+    else:
+        batches = [
+            entity_ids[idx : idx + entity_batch_size]
+            for idx in range(0, len(entity_ids), entity_batch_size)
+        ]
+    for batch in batches:
+        yield await instance.async_add_executor_job(
+            _generate_historical_response,
+            hass,
+            msg_id,
+            start_time,
+            end_time,
+            batch,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            False,
+        )
+
+
 async def _async_send_historical_states(
     hass: HomeAssistant,
     connection: ActiveConnection,
@@ -275,24 +355,59 @@ async def _async_send_historical_states(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    entity_batch_size: int | None = None,
 ) -> dt | None:
-    """Fetch history significant_states and send them to the client."""
-    instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
-        _generate_historical_response,
-        hass,
-        msg_id,
-        start_time,
-        end_time,
-        entity_ids,
-        include_start_time_state,
-        significant_changes_only,
-        minimal_response,
-        no_attributes,
-        send_empty,
-    )
-    if payload:
-        connection.send_message(payload)
+    """Fetch history significant_states and send them to the client.
+
+    With entity_batch_size the states are sent in one message per batch
+    of entities, as soon as each batch is fetched.
+    """
+    if not entity_batch_size:
+        instance = get_instance(hass)
+        last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+            _generate_historical_response,
+            hass,
+            msg_id,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            send_empty,
+        )
+        if payload:
+            connection.send_message(payload)
+        return last_time_dt if last_time_ts != 0 else None
+
+    last_time_ts = 0.0
+    last_time_dt = None
+    async for batch_time_ts, batch_time_dt, payload in (
+        _async_iter_historical_responses(
+            hass,
+            msg_id,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            entity_batch_size,
+        )
+    ):
+        if msg_id not in connection.subscriptions:
+            # Unsubscribe happened while fetching the batch
+            break
+        if payload:
+            connection.send_message(payload)
+        if batch_time_ts > last_time_ts:
+            last_time_ts, last_time_dt = batch_time_ts, batch_time_dt
+    if last_time_ts == 0 and send_empty:
+        connection.send_message(
+            _generate_websocket_response(msg_id, start_time, end_time, {})
+        )
     return last_time_dt if last_time_ts != 0 else None
 
 
@@ -404,6 +519,7 @@ def _async_subscribe_events(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("entity_batch_size"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
@@ -443,6 +559,7 @@ async def ws_stream(
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
+    entity_batch_size: int | None = msg.get("entity_batch_size")
 
     if end_time and end_time <= utc_now:
         if (
@@ -469,6 +586,7 @@ async def ws_stream(
             minimal_response,
             no_attributes,
             True,
+            entity_batch_size,
         )
         return
 
@@ -533,6 +651,7 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         True,
+        entity_batch_size,
     )
 
     if msg_id not in connection.subscriptions:
@@ -54,7 +54,7 @@ from .forwarded import async_setup_forwarded
 from .headers import setup_headers
 from .request_context import current_request, setup_request_context
 from .security_filter import setup_security_filter
-from .static import CACHE_HEADERS, CachingStaticResource
+from .static import CACHE_HEADERS, AssetCache, CachingStaticResource
 from .view import HomeAssistantView
 from .web_runner import HomeAssistantTCPSite
 
@@ -329,6 +329,7 @@ class HomeAssistantHTTP:
         self.runner: web.AppRunner | None = None
         self.site: HomeAssistantTCPSite | None = None
         self.context: ssl.SSLContext | None = None
+        self.asset_cache = AssetCache()
 
     async def async_initialize(
         self,
@@ -410,13 +411,27 @@ class HomeAssistantHTTP:
         )
 
     def register_static_path(
-        self, url_path: str, path: str, cache_headers: bool = True
+        self,
+        url_path: str,
+        path: str,
+        cache_headers: bool = True,
+        cache_in_memory: bool = False,
     ) -> None:
-        """Register a folder or file to serve as a static path."""
+        """Register a folder or file to serve as a static path.
+
+        The files of a folder registered with cache_headers and
+        cache_in_memory are kept in memory, together with their compressed
+        versions, after they are first read. The folder must not change
+        while Home Assistant is running.
+        """
         if os.path.isdir(path):
             if cache_headers:
                 resource: CachingStaticResource | web.StaticResource = (
-                    CachingStaticResource(url_path, path)
+                    CachingStaticResource(
+                        url_path,
+                        path,
+                        asset_cache=self.asset_cache if cache_in_memory else None,
+                    )
                 )
             else:
                 resource = web.StaticResource(url_path, path)
@@ -1,13 +1,18 @@
 """Static file handling for HTTP component."""
 from __future__ import annotations
 
-from collections.abc import Mapping, MutableMapping
+import asyncio
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping, MutableMapping
+from dataclasses import dataclass
+import gzip
+import hashlib
 import mimetypes
 from pathlib import Path
-from typing import Final
+from typing import Any, Final
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse, Request, StreamResponse
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
 from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
 from aiohttp.web_urldispatcher import StaticResource
 from lru import LRU  # pylint: disable=no-name-in-module
@@ -23,6 +28,15 @@ PATH_CACHE: MutableMapping[
     tuple[str, Path, bool], tuple[Path | None, str | None]
 ] = LRU(512)
 
+# Upper bound of the bodies held by an asset cache, and of a single file
+ASSET_CACHE_MAX_BYTES: Final = 64 * 1024 * 1024
+ASSET_CACHE_MAX_FILE_BYTES: Final = 4 * 1024 * 1024
+# Only keep a gzip body when it saves at least this fraction of the size
+_MIN_GZIP_SAVING = 0.1
+# Precompressed siblings served when the client accepts their encoding,
+# in order of preference
+_ENCODING_SUFFIXES: Final = (("br", ".br"), ("gzip", ".gz"))
+
 
 def _get_file_path(rel_url: str, directory: Path, follow_symlinks: bool) -> Path | None:
     """Return the path to file on disk or None."""
@@ -43,8 +57,181 @@ def _get_file_path(rel_url: str, directory: Path, follow_symlinks: bool) -> Path
     raise FileNotFoundError
 
 
+@dataclass(slots=True)
+class _CachedAsset:
+    """The bodies of a static file by content encoding."""
+
+    content_type: str
+    bodies: dict[str, bytes]
+    etags: dict[str, str]
+    size: int
+
+
+def _load_asset(filepath: Path, content_type: str) -> _CachedAsset | None:
+    """Load a static file and its compressed bodies, None if it is too large."""
+    if filepath.stat().st_size > ASSET_CACHE_MAX_FILE_BYTES:
+        return None
+    body = filepath.read_bytes()
+    bodies = {"": body}
+    for encoding, suffix in _ENCODING_SUFFIXES:
+        sibling = filepath.with_name(filepath.name + suffix)
+        if sibling.is_file() and sibling.stat().st_size <= ASSET_CACHE_MAX_FILE_BYTES:
+            bodies[encoding] = sibling.read_bytes()
+    if "gzip" not in bodies:
+        compressed = gzip.compress(body, compresslevel=9, mtime=0)
+        if len(compressed) <= len(body) * (1 - _MIN_GZIP_SAVING):
+            bodies["gzip"] = compressed
+    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+    return _CachedAsset(
+        content_type,
+        bodies,
+        {
+            encoding: f'"{digest}-{encoding}"' if encoding else f'"{digest}"'
+            for encoding in bodies
+        },
+        sum(len(encoded) for encoded in bodies.values()),
+    )
+
+
+class AssetCache:
+    """Size bounded cache of static files and their compressed bodies.
+
+    Files are read once and served from memory afterwards, concurrent
+    requests for a file which is not cached yet wait for a single read.
+    Cached files are not checked for changes, so this is only suited for
+    directories which do not change while Home Assistant is running.
+    """
+
+    def __init__(self, max_bytes: int = ASSET_CACHE_MAX_BYTES) -> None:
+        """Initialize the cache."""
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._assets: OrderedDict[Path, _CachedAsset] = OrderedDict()
+        self._too_large: set[Path] = set()
+        self._loading: dict[Path, asyncio.Task[_CachedAsset | None]] = {}
+
+    async def async_get(
+        self, hass: HomeAssistant, filepath: Path, content_type: str
+    ) -> _CachedAsset | None:
+        """Return a cached file, None if it is too large to be cached."""
+        if (asset := self._assets.get(filepath)) is not None:
+            self._assets.move_to_end(filepath)
+            return asset
+        if filepath in self._too_large:
+            return None
+        if (task := self._loading.get(filepath)) is None:
+            task = self._loading[filepath] = hass.async_create_task(
+                self._async_load(hass, filepath, content_type),
+                f"load static file {filepath}",
+            )
+        return await asyncio.shield(task)
+
+    async def _async_load(
+        self, hass: HomeAssistant, filepath: Path, content_type: str
+    ) -> _CachedAsset | None:
+        """Load a file into the cache."""
+        try:
+            asset = await hass.async_add_executor_job(
+                _load_asset, filepath, content_type
+            )
+        except OSError:
+            # Served from disk, which reports the error
+            return None
+        finally:
+            del self._loading[filepath]
+
+        if asset is None or asset.size > self.max_bytes:
+            self._too_large.add(filepath)
+            return None
+        self._assets[filepath] = asset
+        self.size += asset.size
+        while self.size > self.max_bytes:
+            _, evicted = self._assets.popitem(last=False)
+            self.size -= evicted.size
+        return asset
+
+
+def _parse_accept_encoding(accept_encoding: str) -> dict[str, float]:
+    """Return the quality value of each coding of an Accept-Encoding header."""
+    qualities: dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.partition(";")
+        if not (coding := coding.strip()):
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = min(max(float(value), 0.0), 1.0)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    if "x-gzip" in qualities:
+        qualities.setdefault("gzip", qualities["x-gzip"])
+    return qualities
+
+
+def _select_encoding(accept_encoding: str, encodings: Iterable[str]) -> str:
+    """Return the accepted encoding with the highest quality value.
+
+    Ties are broken by the order of encodings, and the empty string is
+    returned when none of them is accepted. Codings with a quality value
+    of 0 are refused.
+    """
+    qualities = _parse_accept_encoding(accept_encoding)
+    default = qualities.get("*", 0.0)
+    best_encoding = ""
+    best_quality = 0.0
+    for encoding in encodings:
+        if (quality := qualities.get(encoding, default)) > best_quality:
+            best_encoding = encoding
+            best_quality = quality
+    return best_encoding
+
+
+def _asset_response(request: Request, asset: _CachedAsset) -> Response:
+    """Return the body of a cached file in the best encoding the client accepts."""
+    encoding = _select_encoding(
+        request.headers.get(hdrs.ACCEPT_ENCODING, ""),
+        (candidate for candidate, _ in _ENCODING_SUFFIXES if candidate in asset.bodies),
+    )
+    etag = asset.etags[encoding]
+    headers: dict[str, Any] = {
+        hdrs.CACHE_CONTROL: CACHE_HEADER,
+        hdrs.ETAG: etag,
+        hdrs.VARY: hdrs.ACCEPT_ENCODING,
+    }
+    if_none_match = request.headers.get(hdrs.IF_NONE_MATCH)
+    if if_none_match is not None and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        return Response(status=304, headers=headers)
+    headers[hdrs.CONTENT_TYPE] = asset.content_type
+    if encoding:
+        headers[hdrs.CONTENT_ENCODING] = encoding
+    return Response(body=asset.bodies[encoding], headers=headers)
+
+
 class CachingStaticResource(StaticResource):
-    """Static Resource handler that will add cache headers."""
+    """Static Resource handler that will add cache headers.
+
+    Files are served from memory when an asset cache is given, except for
+    range requests and files too large to be cached.
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        directory: str | Path,
+        *,
+        asset_cache: AssetCache | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the resource."""
+        super().__init__(prefix, directory, **kwargs)
+        self._asset_cache = asset_cache
 
     async def _handle(self, request: Request) -> StreamResponse:
         """Return requested file from disk as a FileResponse."""
@@ -75,6 +262,17 @@ class CachingStaticResource(StaticResource):
             filepath, content_type = filepath_content_type
 
         if filepath and content_type:
+            if (
+                self._asset_cache is not None
+                and hdrs.RANGE not in request.headers
+                and (
+                    asset := await self._asset_cache.async_get(
+                        request.app[KEY_HASS], filepath, content_type
+                    )
+                )
+                is not None
+            ):
+                return _asset_response(request, asset)
             return FileResponse(
                 filepath,
                 chunk_size=self._chunk_size,
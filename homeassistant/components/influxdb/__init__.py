@@ -4,6 +4,8 @@ from __future__ import annotations
 from collections.abc import Callable
 from contextlib import suppress
 from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
 import logging
 import math
 import queue
@@ -39,9 +41,11 @@ from homeassistant.helpers.entityfilter import (
     convert_include_exclude_filter,
 )
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
 
 from .const import (
     API_VERSION_2,
+    BATCH_BUFFER_BYTES,
     BATCH_BUFFER_SIZE,
     BATCH_TIMEOUT,
     CATCHING_UP_MESSAGE,
@@ -89,6 +93,8 @@ from .const import (
     INFLUX_CONF_VALUE,
     QUERY_ERROR,
     QUEUE_BACKLOG_SECONDS,
+    QUEUE_FULL_MESSAGE,
+    QUEUE_MAX_SIZE,
     RE_DECIMAL,
     RE_DIGIT_TAIL,
     RESUMED_MESSAGE,
@@ -104,6 +110,9 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=dt_util.UTC)
+_PRECISION_DIVISORS = {None: 1, "ns": 1, "us": 10**3, "ms": 10**6, "s": 10**9}
+
 
 def create_influx_url(conf: dict) -> dict:
     """Build URL used from config inputs and default when necessary."""
@@ -320,12 +329,75 @@ def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | No
     return event_to_json
 
 
+@lru_cache(maxsize=4096)
+def _escape_key(key: str) -> str:
+    """Escape a measurement, tag or field key for the line protocol."""
+    return (
+        key.replace("\\", "\\\\")
+        .replace(" ", "\\ ")
+        .replace(",", "\\,")
+        .replace("=", "\\=")
+        .replace("\n", "\\n")
+    )
+
+
+def _escape_field_value(value: Any) -> str:
+    """Format a field value for the line protocol."""
+    if isinstance(value, str):
+        value = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        return f'"{value}"'
+    if isinstance(value, bool):
+        return str(value)
+    if isinstance(value, int):
+        return f"{value}i"
+    return repr(float(value))
+
+
+def _json_to_line(json: dict[str, Any], divisor: int) -> str:
+    """Serialize a point to the line protocol.
+
+    The output matches the serializer of the InfluxDB client, without
+    its generic conversions of the tags, fields and time.
+    """
+    line = _escape_key(str(json[INFLUX_CONF_MEASUREMENT]))
+    tags = json[INFLUX_CONF_TAGS]
+    for key in sorted(tags):
+        if key != "" and (value := tags[key]) is not None and value != "":
+            line = f"{line},{_escape_key(key)}={_escape_key(str(value))}"
+    fields = json[INFLUX_CONF_FIELDS]
+    if field_list := [
+        f"{_escape_key(key)}={_escape_field_value(value)}"
+        for key in sorted(fields)
+        if key != "" and (value := fields[key]) is not None
+    ]:
+        line = f"{line} {','.join(field_list)}"
+    delta = json[INFLUX_CONF_TIME] - _EPOCH
+    nanos = (
+        (delta.days * 86400 + delta.seconds) * 10**6 + delta.microseconds
+    ) * 10**3
+    return f"{line} {nanos // divisor}"
+
+
+def _generate_event_to_line(conf: dict) -> Callable[[Event], str | None]:
+    """Build event to line protocol converter."""
+    event_to_json = _generate_event_to_json(conf)
+    divisor = _PRECISION_DIVISORS[conf.get(CONF_PRECISION)]
+
+    def event_to_line(event: Event) -> str | None:
+        """Convert event into a line of the line protocol."""
+        if not (json := event_to_json(event)):
+            return None
+        return _json_to_line(json, divisor)
+
+    return event_to_line
+
+
 @dataclass
 class InfluxClient:
     """An InfluxDB client wrapper for V1 or V2."""
 
     data_repositories: list[str]
-    write: Callable[[str], None]
+    write: Callable[[list[str]], None]
     query: Callable[[str, str], list[Any]]
     close: Callable[[], None]
 
@@ -353,9 +425,9 @@ def get_influx_connection(  # noqa: C901
         initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
         write_api = influx.write_api(write_options=initial_write_mode)
 
-        def write_v2(json):
-            """Write data to V2 influx."""
-            data = {"bucket": bucket, "record": json}
+        def write_v2(lines):
+            """Write lines of the line protocol to V2 influx."""
+            data = {"bucket": bucket, "record": "\n".join(lines).encode("utf-8")}
 
             if precision is not None:
                 data["write_precision"] = precision
@@ -366,7 +438,7 @@ def get_influx_connection(  # noqa: C901
                 raise ConnectionError(CONNECTION_ERROR % exc) from exc
             except ApiException as exc:
                 if exc.status == CODE_INVALID_INPUTS:
-                    raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                    raise ValueError(WRITE_ERROR % (lines, exc)) from exc
                 raise ConnectionError(CLIENT_ERROR_V2 % exc) from exc
 
         def query_v2(query, _=None):
@@ -389,7 +461,7 @@ def get_influx_connection(  # noqa: C901
             # Try to write b"" to influx. If we can connect and creds are valid
             # Then invalid inputs is returned. Anything else is a broken config
             with suppress(ValueError):
-                write_v2(b"")
+                write_v2([])
             write_api = influx.write_api(write_options=ASYNCHRONOUS)
 
         if test_read:
@@ -430,10 +502,10 @@ def get_influx_connection(  # noqa: C901
 
     influx = InfluxDBClient(**kwargs)
 
-    def write_v1(json):
-        """Write data to V1 influx."""
+    def write_v1(lines):
+        """Write lines of the line protocol to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            influx.write_points(lines, time_precision=precision, protocol="line")
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -442,7 +514,7 @@ def get_influx_connection(  # noqa: C901
             raise ConnectionError(CONNECTION_ERROR % exc) from exc
         except exceptions.InfluxDBClientError as exc:
             if exc.code == CODE_INVALID_INPUTS:
-                raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                raise ValueError(WRITE_ERROR % (lines, exc)) from exc
             raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
 
     def query_v1(query, database=None):
@@ -490,9 +562,9 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         )
         return True
 
-    event_to_json = _generate_event_to_json(conf)
+    event_to_line = _generate_event_to_line(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_line, max_tries)
     instance.start()
 
     def shutdown(event):
@@ -506,18 +578,48 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return True
 
 
+class _EventQueue(queue.Queue):
+    """A bounded queue which drops its oldest item when a new one is put."""
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the queue."""
+        super().__init__()
+        self.capacity = maxsize
+        self.dropped = 0
+
+    def _put(self, item: Any) -> None:
+        """Put an item, dropping the oldest event if the queue is full.
+
+        The None sentinel which stops the thread is never dropped.
+        """
+        if item is not None and len(self.queue) >= self.capacity:
+            for idx, queued in enumerate(self.queue):
+                if queued is not None:
+                    del self.queue[idx]
+                    self.dropped += 1
+                    # The dropped item will never be marked as done
+                    self.unfinished_tasks -= 1
+                    break
+        self.queue.append(item)
+
+
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(self, hass, influx, event_to_line, max_tries):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
-        self.queue = queue.Queue()
+        self.queue = _EventQueue(QUEUE_MAX_SIZE)
         self.influx = influx
-        self.event_to_json = event_to_json
+        self.event_to_line = event_to_line
         self.max_tries = max_tries
         self.write_errors = 0
+        self.written = 0
+        self.retries = 0
+        self.dropped_backlog = 0
+        self.write_latency: float | None = None
         self.shutdown = False
+        self._reported_full = 0
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
     @callback
@@ -531,17 +633,22 @@ class InfluxThread(threading.Thread):
         """Return number of seconds to wait for more events."""
         return BATCH_TIMEOUT
 
-    def get_events_json(self):
+    def get_events_lines(self):
         """Return a batch of events formatted for writing."""
         queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
 
         count = 0
-        json = []
+        lines = []
+        size = 0
 
         dropped = 0
 
         with suppress(queue.Empty):
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
+            while (
+                len(lines) < BATCH_BUFFER_SIZE
+                and size < BATCH_BUFFER_BYTES
+                and not self.shutdown
+            ):
                 timeout = None if count == 0 else self.batch_timeout()
                 item = self.queue.get(timeout=timeout)
                 count += 1
@@ -553,49 +660,72 @@ class InfluxThread(threading.Thread):
                     age = time.monotonic() - timestamp
 
                     if age < queue_seconds:
-                        event_json = self.event_to_json(event)
-                        if event_json:
-                            json.append(event_json)
+                        if line := self.event_to_line(event):
+                            lines.append(line)
+                            size += len(line)
                     else:
                         dropped += 1
 
         if dropped:
+            self.dropped_backlog += dropped
             _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
 
-        return count, json
+        if (full_dropped := self.queue.dropped) != self._reported_full:
+            _LOGGER.warning(QUEUE_FULL_MESSAGE, full_dropped - self._reported_full)
+            self._reported_full = full_dropped
+
+        return count, lines
 
-    def write_to_influxdb(self, json):
+    def write_to_influxdb(self, lines):
         """Write preprocessed events to influxdb, with retry."""
         for retry in range(self.max_tries + 1):
+            start = time.perf_counter()
             try:
-                self.influx.write(json)
+                self.influx.write(lines)
 
+                self.write_latency = time.perf_counter() - start
+                self.written += len(lines)
                 if self.write_errors:
                     _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
                     self.write_errors = 0
 
-                _LOGGER.debug(WROTE_MESSAGE, len(json))
+                _LOGGER.debug(
+                    WROTE_MESSAGE, len(lines), self.write_latency, self.queue.qsize()
+                )
                 break
             except ValueError as err:
                 _LOGGER.error(err)
                 break
             except ConnectionError as err:
                 if retry < self.max_tries:
+                    self.retries += 1
                     time.sleep(RETRY_DELAY)
                 else:
                     if not self.write_errors:
                         _LOGGER.error(err)
-                    self.write_errors += len(json)
+                    self.write_errors += len(lines)
 
     def run(self):
         """Process incoming events."""
         while not self.shutdown:
-            count, json = self.get_events_json()
-            if json:
-                self.write_to_influxdb(json)
+            count, lines = self.get_events_lines()
+            if lines:
+                self.write_to_influxdb(lines)
             for _ in range(count):
                 self.queue.task_done()
 
     def block_till_done(self):
         """Block till all events processed."""
         self.queue.join()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the writer statistics."""
+        return {
+            "queue_depth": self.queue.qsize(),
+            "written": self.written,
+            "retries": self.retries,
+            "write_errors": self.write_errors,
+            "dropped_queue_full": self.queue.dropped,
+            "dropped_backlog": self.dropped_backlog,
+            "write_latency": self.write_latency,
+        }
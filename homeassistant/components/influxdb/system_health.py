@@ -0,0 +1,23 @@
+"""Provide info to system health."""
+from typing import Any
+
+from homeassistant.components import system_health
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+
+@callback
+def async_register(
+    hass: HomeAssistant, register: system_health.SystemHealthRegistration
+) -> None:
+    """Register system health callbacks."""
+    register.async_register_info(system_health_info)
+
+
+async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
+    """Get info for the info page."""
+    if (instance := hass.data.get(DOMAIN)) is None:
+        # The connection failed and setup is retried later
+        return {"connected": False}
+    return {"connected": True, **instance.as_dict()}
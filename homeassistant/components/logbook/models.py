@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+import logging
 from typing import Any, cast
 
 from sqlalchemy.engine.row import Row
@@ -11,15 +12,17 @@ from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.models import (
     bytes_to_ulid_or_none,
     bytes_to_uuid_hex_or_none,
+    decode_json_object,
     ulid_to_bytes_or_none,
     uuid_hex_to_bytes_or_none,
 )
 from homeassistant.const import ATTR_ICON, EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, State, callback
 import homeassistant.util.dt as dt_util
-from homeassistant.util.json import json_loads
 from homeassistant.util.ulid import ulid_to_bytes
 
+_LOGGER = logging.getLogger(__name__)
+
 
 @dataclass(slots=True)
 class LogbookConfig:
@@ -70,9 +73,12 @@ class LazyEventPartialState:
         elif event_data := self._event_data_cache.get(source):
             self.data = event_data
         else:
-            self.data = self._event_data_cache[source] = cast(
-                dict[str, Any], json_loads(source)
-            )
+            try:
+                event_data = decode_json_object(source)
+            except ValueError:
+                _LOGGER.exception("Error converting row to event data: %s", source)
+                event_data = {}
+            self.data = self._event_data_cache[source] = event_data
 
     @property
     def context_id(self) -> str | None:
@@ -160,6 +160,7 @@ class NumberEntity(Entity):
     _entity_component_unrecorded_attributes = frozenset(
         {ATTR_MIN, ATTR_MAX, ATTR_STEP, ATTR_MODE}
     )
+    _static_properties = frozenset({"device_class", "_default_to_device_class_name"})
 
     entity_description: NumberEntityDescription
     _attr_device_class: NumberDeviceClass | None
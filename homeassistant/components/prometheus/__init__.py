@@ -2,9 +2,11 @@
 from contextlib import suppress
 import logging
 import string
+import threading
 
 from aiohttp import web
 import prometheus_client
+from prometheus_client.utils import floatToGoString
 import voluptuous as vol
 
 from homeassistant import core as hacore
@@ -94,10 +96,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(
-        PrometheusView(prometheus_client, config[DOMAIN][CONF_REQUIRES_AUTH])
-    )
-
     conf = config[DOMAIN]
     entity_filter = conf[CONF_FILTER]
     namespace = conf.get(CONF_PROM_NAMESPACE)
@@ -119,6 +117,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         override_metric,
         default_metric,
     )
+    hass.http.register_view(PrometheusView(metrics, conf[CONF_REQUIRES_AUTH]))
 
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
     hass.bus.listen(
@@ -132,8 +131,102 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return True
 
 
+def _escape(value: str) -> str:
+    """Escape a label value in the text format."""
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _escape_documentation(value: str) -> str:
+    """Escape the documentation of a metric in the text format."""
+    return value.replace("\\", r"\\").replace("\n", r"\n")
+
+
+# Internals of prometheus_client metrics used to render their series one by one
+_SERIES_ATTRIBUTES = (
+    "_name",
+    "_type",
+    "_documentation",
+    "_labelnames",
+    "_lock",
+    "_metrics",
+    "_samples",
+)
+
+
+def _supports_series_rendering(metric) -> bool:
+    """Return if the series of a metric can be rendered one by one.
+
+    This relies on internals of prometheus_client. When a release changes
+    them, the metrics are rendered through the public collect API instead.
+    """
+    return all(hasattr(metric, attr) for attr in _SERIES_ATTRIBUTES)
+
+
+class _Collector:
+    """Collect a list of metrics, to render them with generate_latest."""
+
+    __slots__ = ("metrics",)
+
+    def __init__(self, metrics) -> None:
+        """Initialize the collector."""
+        self.metrics = metrics
+
+    def collect(self):
+        """Return the metric families of the metrics."""
+        for metric in self.metrics:
+            yield from metric.collect()
+
+
+class _RenderedMetric:
+    """Text format of a metric, by the label values of its series."""
+
+    __slots__ = ("series", "text")
+
+    def __init__(self) -> None:
+        """Initialize the rendered metric."""
+        self.series: dict[tuple[str, ...], tuple[str, dict[str, str]]] = {}
+        self.text = b""
+
+
+def _render_series(  # pylint: disable=protected-access
+    metric, labelvalues, child
+) -> tuple[str, dict[str, str]]:
+    """Render the samples of a series of a metric.
+
+    Returns the sample lines, and the lines of the samples which are
+    exposed as separate gauges by suffix, like the _created sample of
+    a counter. The output matches prometheus_client.generate_latest.
+    """
+    name = metric._name
+    labels = dict(zip(metric._labelnames, labelvalues))
+    lines: list[str] = []
+    suffixed: dict[str, str] = {}
+    for suffix, sample_labels, value, timestamp, _ in child._samples():
+        if sample_labels:
+            sample_labels = {**labels, **sample_labels}
+        else:
+            sample_labels = labels
+        labelstr = ",".join(
+            f'{key}="{_escape(label_value)}"'
+            for key, label_value in sorted(sample_labels.items())
+        )
+        line = f"{name}{suffix}{{{labelstr}}} {floatToGoString(value)}"
+        if timestamp is not None:
+            line = f"{line} {int(float(timestamp) * 1000):d}"
+        if suffix in ("_created", "_gsum", "_gcount"):
+            suffixed[suffix] = suffixed.get(suffix, "") + f"{line}\n"
+        else:
+            lines.append(f"{line}\n")
+    return "".join(lines), suffixed
+
+
 class PrometheusMetrics:
-    """Model all of the metrics which should be exposed to Prometheus."""
+    """Model all of the metrics which should be exposed to Prometheus.
+
+    The metrics are not registered in the prometheus_client registry, they
+    are rendered by render, which caches the text format of every series
+    and only formats the series of entities which changed since.
+    """
 
     def __init__(
         self,
@@ -166,6 +259,12 @@ class PrometheusMetrics:
             self.metrics_prefix = ""
         self._metrics = {}
         self._climate_units = climate_units
+        self._dirty_entities: set[str] = set()
+        self._dirty_lock = threading.Lock()
+        self._render_lock = threading.Lock()
+        self._rendered_metrics: dict[str, _RenderedMetric] = {}
+        self._rendered: bytes | None = None
+        self._series_rendering = True
 
     def handle_state_changed_event(self, event):
         """Handle new messages from the bus."""
@@ -185,6 +284,17 @@ class PrometheusMetrics:
 
     def handle_state(self, state):
         """Add/update a state in Prometheus."""
+        try:
+            self._handle_state(state)
+        finally:
+            self._mark_dirty(state.entity_id)
+
+    def _mark_dirty(self, entity_id):
+        """Mark the series of an entity to be rendered again."""
+        with self._dirty_lock:
+            self._dirty_entities.add(entity_id)
+
+    def _handle_state(self, state):
         entity_id = state.entity_id
         _LOGGER.debug("Handling state update for %s", entity_id)
         domain, _ = hacore.split_entity_id(entity_id)
@@ -253,6 +363,74 @@ class PrometheusMetrics:
                     )
                     with suppress(KeyError):
                         metric.remove(*sample.labels.values())
+        self._mark_dirty(entity_id)
+
+    def render(self):
+        """Render all metrics in the Prometheus text format.
+
+        This is called from the executor, while states are handled in
+        other threads. The series of an entity are marked to be rendered
+        again after its state has been handled, so a state which is being
+        handled during the call shows up in the next one.
+        """
+        generate_latest = self.prometheus_cli.generate_latest
+        if not self._series_rendering:
+            return generate_latest(self.prometheus_cli.REGISTRY) + generate_latest(
+                _Collector(list(self._metrics.values()))
+            )
+        with self._render_lock:
+            with self._dirty_lock:
+                dirty, self._dirty_entities = self._dirty_entities, set()
+            if dirty or self._rendered is None:
+                self._rendered = b"".join(
+                    self._render_metric(metric, dirty)
+                    for metric in list(self._metrics.values())
+                )
+            return generate_latest(self.prometheus_cli.REGISTRY) + self._rendered
+
+    def _render_metric(self, metric, dirty):  # pylint: disable=protected-access
+        """Render a metric, formatting only the series of dirty entities."""
+        name = metric._name
+        with metric._lock:
+            children = list(metric._metrics.items())
+        if (rendered := self._rendered_metrics.get(name)) is None:
+            rendered = self._rendered_metrics[name] = _RenderedMetric()
+        elif len(children) == len(rendered.series) and not any(
+            labelvalues[0] in dirty for labelvalues, _ in children
+        ):
+            return rendered.text
+
+        old_series = rendered.series
+        series = {}
+        for labelvalues, child in children:
+            if (
+                labelvalues[0] in dirty
+                or (lines := old_series.get(labelvalues)) is None
+            ):
+                lines = _render_series(metric, labelvalues, child)
+            series[labelvalues] = lines
+        rendered.series = series
+
+        typ = metric._type
+        documentation = _escape_documentation(metric._documentation)
+        exposed_name = f"{name}_total" if typ == "counter" else name
+        output = [
+            f"# HELP {exposed_name} {documentation}\n",
+            f"# TYPE {exposed_name} {typ}\n",
+        ]
+        output.extend(lines for lines, _ in series.values())
+        for suffix in sorted(
+            {key for _, suffixed in series.values() for key in suffixed}
+        ):
+            output.append(f"# HELP {name}{suffix} {documentation}\n")
+            output.append(f"# TYPE {name}{suffix} gauge\n")
+            output.extend(
+                suffixed[suffix]
+                for _, suffixed in series.values()
+                if suffix in suffixed
+            )
+        rendered.text = "".join(output).encode("utf-8")
+        return rendered.text
 
     def _handle_attributes(self, state):
         for key, value in state.attributes.items():
@@ -283,8 +461,17 @@ class PrometheusMetrics:
                 full_metric_name,
                 documentation,
                 labels,
-                registry=self.prometheus_cli.REGISTRY,
+                registry=None,
             )
+            if self._series_rendering and not _supports_series_rendering(
+                self._metrics[metric]
+            ):
+                _LOGGER.warning(
+                    "This version of prometheus_client is not supported for "
+                    "rendering the series of metrics, rendering all metrics "
+                    "on every request"
+                )
+                self._series_rendering = False
             return self._metrics[metric]
 
     @staticmethod
@@ -687,16 +874,17 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, prometheus_cli, requires_auth: bool) -> None:
+    def __init__(self, metrics: PrometheusMetrics, requires_auth: bool) -> None:
         """Initialize Prometheus view."""
         self.requires_auth = requires_auth
-        self.prometheus_cli = prometheus_cli
+        self.metrics = metrics
 
     async def get(self, request):
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
+        hass = request.app["hass"]
 
         return web.Response(
-            body=self.prometheus_cli.generate_latest(self.prometheus_cli.REGISTRY),
+            body=await hass.async_add_executor_job(self.metrics.render),
             content_type=CONTENT_TYPE_TEXT_PLAIN,
         )
@@ -45,6 +45,7 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_URL = "sqlite:///{hass_config_path}"
 DEFAULT_DB_FILE = "home-assistant_v2.db"
+DEFAULT_SPOOL_DIR = "recorder_spool"
 DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
@@ -59,6 +60,8 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_SPOOL = "spool"
+CONF_PARTITION_TABLES = "partition_tables"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -111,6 +114,8 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(CONF_SPOOL, default=False): cv.boolean,
+                    vol.Optional(CONF_PARTITION_TABLES, default=False): cv.boolean,
                 }
             ),
         )
@@ -160,6 +165,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        spool_path=hass.config.path(DEFAULT_SPOOL_DIR) if conf[CONF_SPOOL] else None,
+        partition_tables=conf[CONF_PARTITION_TABLES],
     )
     instance.async_initialize()
     instance.async_register()
@@ -1,5 +1,6 @@
 """Recorder constants."""
 
+from datetime import timedelta
 from enum import StrEnum
 
 from homeassistant.const import (
@@ -48,6 +49,13 @@ ATTR_REPACK = "repack"
 ATTR_APPLY_FILTER = "apply_filter"
 
 KEEPALIVE_TIME = 30
+# Seconds between checks if the database is available again while spooling
+SPOOL_PROBE_INTERVAL = 30
+
+# Background work only runs while fewer tasks than this are queued
+IDLE_BACKLOG = 100
+# Minimum amount of data to purge between incremental purges
+INCREMENTAL_PURGE_INTERVAL = timedelta(hours=1)
 
 STATISTICS_ROWS_SCHEMA_VERSION = 23
 CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
@@ -59,11 +67,13 @@ LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 INTEGRATION_PLATFORM_COMPILE_STATISTICS = "compile_statistics"
 INTEGRATION_PLATFORM_VALIDATE_STATISTICS = "validate_statistics"
 INTEGRATION_PLATFORM_LIST_STATISTIC_IDS = "list_statistic_ids"
+INTEGRATION_PLATFORM_RECORD_STATE_CHANGED = "record_state_changed"
 
 INTEGRATION_PLATFORMS_LOAD_IN_RECORDER_THREAD = {
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_VALIDATE_STATISTICS,
     INTEGRATION_PLATFORM_LIST_STATISTIC_IDS,
+    INTEGRATION_PLATFORM_RECORD_STATE_CHANGED,
 }
 
 
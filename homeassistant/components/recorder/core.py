@@ -29,7 +29,13 @@ from homeassistant.const import (
     EVENT_STATE_CHANGED,
     MATCH_ALL,
 )
-from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    callback,
+    split_entity_id,
+)
 from homeassistant.helpers.event import (
     async_track_time_change,
     async_track_time_interval,
@@ -47,6 +53,8 @@ from .const import (
     DOMAIN,
     ESTIMATED_QUEUE_ITEM_SIZE,
     EVENT_TYPE_IDS_SCHEMA_VERSION,
+    IDLE_BACKLOG,
+    INCREMENTAL_PURGE_INTERVAL,
     KEEPALIVE_TIME,
     LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION,
     MARIADB_PYMYSQL_URL_PREFIX,
@@ -55,6 +63,7 @@ from .const import (
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
     QUEUE_PERCENTAGE_ALLOWED_AVAILABLE_MEMORY,
+    SPOOL_PROBE_INTERVAL,
     SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
     STATES_META_SCHEMA_VERSION,
@@ -78,15 +87,19 @@ from .db_schema import (
 )
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
+from .partition import get_partitioned_tables
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress
 from .queries import (
     has_entity_ids_to_migrate,
     has_event_type_to_migrate,
     has_events_context_ids_to_migrate,
     has_states_context_ids_to_migrate,
 )
+from .spool import EventSpool
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
+from .table_managers.recent_states import RecentStatesManager
 from .table_managers.recorder_runs import RecorderRunsManager
 from .table_managers.state_attributes import StateAttributesManager
 from .table_managers.states import StatesManager
@@ -99,6 +112,7 @@ from .tasks import (
     ClearStatisticsTask,
     CommitTask,
     CompileMissingStatisticsTask,
+    CreatePartitionsTask,
     DatabaseLockTask,
     EntityIDMigrationTask,
     EntityIDPostMigrationTask,
@@ -178,6 +192,8 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_event_types: set[str],
+        spool_path: str | None = None,
+        partition_tables: bool = False,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -213,11 +229,29 @@ class Recorder(threading.Thread):
         self.exclude_event_types = exclude_event_types
 
         self.schema_version = 0
+        # Incremented after statistics that were already compiled or
+        # imported have been changed, so copies of them can be invalidated
+        self.statistics_revision = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
 
+        # Events are spooled to disk while the database is unavailable,
+        # the events in the event session are kept to spool them if the
+        # commit fails
+        self.spool = EventSpool(spool_path) if spool_path else None
+        self.spooling = False
+        self._next_spool_probe = 0.0
+        self._uncommitted_events: list[Event] = []
+
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
+        self.recent_states_manager = RecentStatesManager()
+        # Recorder platforms which follow the recorded state changes of the
+        # entities in their domain
+        self.state_changed_recorders: dict[
+            str, Callable[[HomeAssistant, Event], None]
+        ] = {}
+        self.purge_progress = PurgeProgress()
         self.event_data_manager = EventDataManager(self)
         self.event_type_manager = EventTypeManager(self)
         self.states_meta_manager = StatesMetaManager(self)
@@ -231,6 +265,9 @@ class Recorder(threading.Thread):
         self.migration_in_progress = False
         self.migration_is_live = False
         self.use_legacy_events_index = False
+        # Create the states and events tables of a new database partitioned
+        self.partition_tables = partition_tables
+        self.partitioned_tables: set[str] = set()
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
 
@@ -255,6 +292,16 @@ class Recorder(threading.Thread):
         """Return the number of items in the recorder backlog."""
         return self._queue.qsize()
 
+    @property
+    def is_idle(self) -> bool:
+        """Return if the recorder has time for background work."""
+        return (
+            self.backlog < IDLE_BACKLOG
+            and not self.migration_in_progress
+            and not self._database_lock_task
+            and not self.spooling
+        )
+
     @property
     def dialect_name(self) -> SupportedDialect | None:
         """Return the dialect the recorder uses."""
@@ -541,15 +588,46 @@ class Recorder(threading.Thread):
             # until after the database is vacuumed
             repack = self.auto_repack and is_second_sunday(now)
             purge_before = dt_util.utcnow() - timedelta(days=self.keep_days)
-            self.queue_task(PurgeTask(purge_before, repack=repack, apply_filter=False))
+            self.purge_progress.in_progress = True
+            self.purge_progress.nightly_purge = True
+            self.queue_task(
+                PurgeTask(purge_before, repack=repack, apply_filter=False, nightly=True)
+            )
         else:
             self.queue_task(PerodicCleanupTask())
+        if self.partitioned_tables:
+            self.queue_task(CreatePartitionsTask())
 
     @callback
     def _async_five_minute_tasks(self, now: datetime) -> None:
         """Run tasks every five minutes."""
         self.queue_task(ADJUST_LRU_SIZE_TASK)
         self.async_periodic_statistics()
+        self._async_incremental_purge()
+
+    @callback
+    def _async_incremental_purge(self) -> None:
+        """Purge old data in small runs while the recorder is idle.
+
+        This spreads the purge over the day, so the nightly purge only
+        has the data of the last hour left to purge.
+        """
+        progress = self.purge_progress
+        purge_before = dt_util.utcnow() - timedelta(days=self.keep_days)
+        if (
+            not self.auto_purge
+            or progress.in_progress
+            or not self.is_idle
+            or (
+                progress.purged_before is not None
+                and purge_before - progress.purged_before < INCREMENTAL_PURGE_INTERVAL
+            )
+        ):
+            return
+        progress.in_progress = True
+        self.queue_task(
+            PurgeTask(purge_before, repack=False, apply_filter=False, incremental=True)
+        )
 
     def _adjust_lru_size(self) -> None:
         """Trigger the LRU adjustment.
@@ -844,6 +922,20 @@ class Recorder(threading.Thread):
                         self.queue_task(EventIdMigrationTask())
                         self.use_legacy_events_index = True
 
+            if self.dialect_name == SupportedDialect.POSTGRESQL:
+                with contextlib.suppress(SQLAlchemyError):
+                    self.partitioned_tables = get_partitioned_tables(session)
+                if self.partitioned_tables:
+                    _LOGGER.debug(
+                        "Tables %s are partitioned", sorted(self.partitioned_tables)
+                    )
+                    self.queue_task(CreatePartitionsTask())
+            if self.partition_tables and not self.partitioned_tables:
+                _LOGGER.warning(
+                    "The states and events tables are not partitioned, tables are "
+                    "only partitioned when a new PostgreSQL database is created"
+                )
+
         # We must only set the db ready after we have set the table managers
         # to active if there is no data to migrate.
         #
@@ -868,6 +960,10 @@ class Recorder(threading.Thread):
         # and we don't want to hold them in memory
         del startup_tasks
 
+        # Replay the events spooled before the last shutdown first
+        if self.spool is not None and self.spool.segments:
+            self.spooling = True
+
         self.stop_requested = False
         while not self.stop_requested:
             self._guarded_process_one_task_or_recover(queue_.get())
@@ -916,6 +1012,8 @@ class Recorder(threading.Thread):
             _LOGGER.exception(
                 "Unhandled database error while processing task %s: %s", task, err
             )
+            if isinstance(err, exc.OperationalError):
+                self._start_spooling()
         except SQLAlchemyError as err:
             _LOGGER.exception("SQLAlchemyError error processing task %s: %s", task, err)
 
@@ -923,6 +1021,55 @@ class Recorder(threading.Thread):
         # happens to rollback and recover
         self._reopen_event_session()
 
+    def _start_spooling(self) -> None:
+        """Spool events to disk until the database is available again."""
+        if self.spool is None or self.spooling:
+            return
+        _LOGGER.warning(
+            "The database is unavailable; spooling events to %s until it recovers",
+            self.spool.path,
+        )
+        self.spooling = True
+        self._next_spool_probe = time.monotonic() + SPOOL_PROBE_INTERVAL
+        for event in self._uncommitted_events:
+            self.spool.append(event)
+        self._uncommitted_events.clear()
+
+    def _replay_spool(self) -> bool:
+        """Record the spooled events if the database is available again.
+
+        Returns True if all spooled events have been recorded.
+        """
+        assert self.spool is not None
+        if (now := time.monotonic()) < self._next_spool_probe:
+            return False
+        self._next_spool_probe = now + SPOOL_PROBE_INTERVAL
+        replayed = 0
+        try:
+            assert self.event_session is not None
+            self.event_session.connection().scalar(select(1))
+            for segment in self.spool.segments:
+                for event in self.spool.read_segment(segment):
+                    self._process_event_into_session(event)
+                    replayed += 1
+                self._commit_event_session_or_retry()
+                self.spool.remove_segment(segment)
+        except SQLAlchemyError as err:
+            _LOGGER.debug("The database is still unavailable: %s", err)
+            self._reopen_event_session()
+            return False
+        if self.spool.dropped:
+            _LOGGER.error(
+                "Recorded %s spooled events, %s events could not be spooled",
+                replayed,
+                self.spool.dropped,
+            )
+            self.spool.dropped = 0
+        else:
+            _LOGGER.info("Recorded %s spooled events", replayed)
+        self.spooling = False
+        return True
+
     def _setup_recorder(self) -> bool:
         """Create a connection to the database."""
         tries = 1
@@ -1016,13 +1163,22 @@ class Recorder(threading.Thread):
     def _process_one_event(self, event: Event) -> None:
         if not self.enabled:
             return
+        if self.spool is not None:
+            if self.spooling and not self._replay_spool():
+                self.spool.append(event)
+                return
+            self._uncommitted_events.append(event)
+        self._process_event_into_session(event)
+        # Commit if the commit interval is zero
+        if not self.commit_interval:
+            self._commit_event_session_or_retry()
+
+    def _process_event_into_session(self, event: Event) -> None:
+        """Process an event into the session."""
         if event.event_type == EVENT_STATE_CHANGED:
             self._process_state_changed_event_into_session(event)
         else:
             self._process_non_state_changed_event_into_session(event)
-        # Commit if the commit interval is zero
-        if not self.commit_interval:
-            self._commit_event_session_or_retry()
 
     def _process_non_state_changed_event_into_session(self, event: Event) -> None:
         """Process any event into the session except state changed."""
@@ -1142,6 +1298,21 @@ class Recorder(threading.Thread):
             dbstate.state_attributes = dbstate_attributes
 
         self._add_to_session(session, dbstate)
+        self.recent_states_manager.add_pending(
+            entity_id,
+            dbstate.last_updated_ts,
+            dbstate.state,
+            dbstate.last_changed_ts is None,
+        )
+        if self.state_changed_recorders and (
+            record_state_changed := self.state_changed_recorders.get(
+                split_entity_id(entity_id)[0]
+            )
+        ):
+            try:
+                record_state_changed(self.hass, event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error following the state change of %s", entity_id)
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1182,11 +1353,13 @@ class Recorder(threading.Thread):
 
         session.commit()
         self._event_session_has_pending_writes = False
+        self._uncommitted_events.clear()
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
         # into the LRU or committed now.
         self.states_manager.post_commit_pending()
+        self.recent_states_manager.post_commit_pending()
         self.state_attributes_manager.post_commit_pending()
         self.event_data_manager.post_commit_pending()
         self.event_type_manager.post_commit_pending()
@@ -1212,7 +1385,9 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        self._uncommitted_events.clear()
         self.states_manager.reset()
+        self.recent_states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
         self.event_type_manager.reset()
@@ -1244,6 +1419,10 @@ class Recorder(threading.Thread):
         """Run post schema migration tasks."""
         migration.post_schema_migration(self, old_version, new_version)
 
+    def _create_partitions(self) -> None:
+        """Create the daily partitions of the partitioned tables."""
+        migration.create_daily_partitions(self, dt_util.utcnow().date())
+
     def _migrate_states_context_ids(self) -> bool:
         """Migrate states context ids if needed."""
         return migration.migrate_states_context_ids(self)
@@ -1270,6 +1449,9 @@ class Recorder(threading.Thread):
 
     def _send_keep_alive(self) -> None:
         """Send a keep alive to keep the db connection open."""
+        if self.spooling:
+            self._replay_spool()
+            return
         assert self.event_session is not None
         _LOGGER.debug("Sending keepalive")
         self.event_session.connection().scalar(select(1))
@@ -1403,6 +1585,8 @@ class Recorder(threading.Thread):
         self._dialect_name = try_parse_enum(SupportedDialect, self.engine.dialect.name)
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
+        if self.partition_tables and self.dialect_name == SupportedDialect.POSTGRESQL:
+            migration.create_partitioned_schema(self.engine, dt_util.utcnow().date())
         Base.metadata.create_all(self.engine)
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
@@ -1456,6 +1640,8 @@ class Recorder(threading.Thread):
         else:
             self.hass.add_job(self._async_stop_listeners)
 
+        if self.spool is not None:
+            self.spool.close()
         try:
             self._end_session()
         finally:
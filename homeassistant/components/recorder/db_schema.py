@@ -87,6 +87,12 @@ TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
 
+# Tables which may be partitioned by range of their timestamp column
+PARTITIONED_TABLE_COLUMNS = {
+    TABLE_STATES: "last_updated_ts",
+    TABLE_EVENTS: "time_fired_ts",
+}
+
 MAX_STATE_ATTRS_BYTES = 16384
 MAX_EVENT_DATA_BYTES = 32768
 
@@ -61,6 +61,9 @@ def update_states_metadata(
         )
         return
 
+    instance.recent_states_manager.evict_entity_ids(
+        lambda cached_entity_id: cached_entity_id in (entity_id, new_entity_id)
+    )
     with session_scope(session=instance.get_session()) as session:
         if not states_meta_manager.update_metadata(session, entity_id, new_entity_id):
             _LOGGER.warning(
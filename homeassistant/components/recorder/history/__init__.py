@@ -16,6 +16,7 @@ from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_from_cache as _modern_get_significant_states_from_cache,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
@@ -27,6 +28,7 @@ __all__ = [
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_from_cache",
     "get_significant_states_with_session",
     "state_changes_during_period",
 ]
@@ -115,6 +117,27 @@ def get_significant_states(
     )
 
 
+def get_significant_states_from_cache(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool = True,
+    minimal_response: bool = False,
+) -> MutableMapping[str, list[State | dict[str, Any]]] | None:
+    """Return a dict of cached significant states, None if not cached."""
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        return None
+    return _modern_get_significant_states_from_cache(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        minimal_response,
+    )
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
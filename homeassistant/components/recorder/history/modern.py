@@ -120,6 +120,54 @@ def get_significant_states(
         )
 
 
+def get_significant_states_from_cache(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool = True,
+    minimal_response: bool = False,
+) -> MutableMapping[str, list[State | dict[str, Any]]] | None:
+    """Return significant states in the compressed format from memory.
+
+    This is the equivalent of get_significant_states with
+    significant_changes_only and no_attributes set, served from the
+    recently recorded states. None is returned if the requested window
+    is not covered for all entity_ids.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    # Each entity_id is only returned once, like from the database
+    entity_ids = list(dict.fromkeys(entity_ids))
+    run_start_ts: float | None = None
+    if include_start_time_state and not (
+        run_start_ts := _get_run_start_ts_for_utc_point_in_time(hass, start_time)
+    ):
+        include_start_time_state = False
+    start_time_ts = dt_util.utc_to_timestamp(start_time)
+    rows = recorder.get_instance(hass).recent_states_manager.get_rows(
+        entity_ids,
+        start_time_ts,
+        datetime_to_timestamp_or_none(end_time),
+        # The start time state of multiple entities is only
+        # looked up since the start of the recorder run
+        None if len(entity_ids) == 1 else run_start_ts,
+        include_start_time_state,
+        lambda entity_id: split_entity_id(entity_id)[0] not in SIGNIFICANT_DOMAINS,
+    )
+    if rows is None:
+        return None
+    return _sorted_states_to_dict(
+        rows,  # type: ignore[arg-type]
+        start_time_ts if include_start_time_state else None,
+        entity_ids,
+        {entity_id: idx for idx, entity_id in enumerate(entity_ids)},
+        minimal_response,
+        True,
+        no_attributes=True,
+    )
+
+
 def _significant_states_stmt(
     start_time_ts: float,
     end_time_ts: float | None,
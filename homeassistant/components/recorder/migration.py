@@ -4,7 +4,7 @@ from __future__ import annotations
 from collections.abc import Callable, Iterable
 import contextlib
 from dataclasses import dataclass, replace as dataclass_replace
-from datetime import timedelta
+from datetime import date, timedelta
 import logging
 from time import time
 from typing import TYPE_CHECKING, cast
@@ -53,6 +53,7 @@ from .db_schema import (
     LEGACY_STATES_EVENT_ID_INDEX,
     MYSQL_COLLATE,
     MYSQL_DEFAULT_CHARSET,
+    PARTITIONED_TABLE_COLUMNS,
     SCHEMA_VERSION,
     STATISTICS_TABLES,
     TABLE_STATES,
@@ -69,6 +70,14 @@ from .db_schema import (
 )
 from .models import process_timestamp
 from .models.time import datetime_to_timestamp_or_none
+from .partition import (
+    PARTITIONS_AHEAD_DAYS,
+    create_default_partition_sql,
+    create_partition_sql,
+    get_partitions,
+    missing_daily_partitions,
+    partitioned_schema,
+)
 from .queries import (
     batch_cleanup_entity_ids,
     delete_duplicate_short_term_statistics_row,
@@ -1716,6 +1725,54 @@ def cleanup_legacy_states_event_ids(instance: Recorder) -> bool:
     return True
 
 
+def create_daily_partitions(instance: Recorder, today: date) -> None:
+    """Create the daily partitions of the partitioned tables ahead of time.
+
+    Days which overlap a partition created manually are skipped.
+    """
+    session_maker = instance.get_session
+    for table in sorted(instance.partitioned_tables):
+        with session_scope(session=session_maker(), read_only=True) as session:
+            partitions = get_partitions(session, table)
+        for partition in missing_daily_partitions(
+            table, partitions, today, PARTITIONS_AHEAD_DAYS + 1
+        ):
+            _LOGGER.debug("Creating partition %s of %s", partition.name, table)
+            with session_scope(session=session_maker()) as session:
+                try:
+                    session.connection().execute(
+                        text(create_partition_sql(table, partition))
+                    )
+                except SQLAlchemyError as err:
+                    _LOGGER.error(
+                        "Error creating partition %s of %s: %s",
+                        partition.name,
+                        table,
+                        err,
+                    )
+
+
+def create_partitioned_schema(engine: Engine, today: date) -> None:
+    """Create a new database with range partitioned states and events tables.
+
+    Nothing is done when the states or events table already exists. The
+    default partition and the daily partitions ahead of time are created
+    with the tables, so no row is recorded before its partition exists.
+    """
+    inspector = sqlalchemy.inspect(engine)
+    if any(inspector.has_table(table) for table in PARTITIONED_TABLE_COLUMNS):
+        return
+    _LOGGER.info("Creating partitioned tables %s", sorted(PARTITIONED_TABLE_COLUMNS))
+    with engine.begin() as connection:
+        partitioned_schema().create_all(connection)
+        for table in PARTITIONED_TABLE_COLUMNS:
+            connection.execute(text(create_default_partition_sql(table)))
+            for partition in missing_daily_partitions(
+                table, (), today, PARTITIONS_AHEAD_DAYS + 1
+            ):
+                connection.execute(text(create_partition_sql(table, partition)))
+
+
 def _initialize_database(session: Session) -> bool:
     """Initialize a new database.
 
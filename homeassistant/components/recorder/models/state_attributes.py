@@ -2,15 +2,109 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 import logging
+import threading
 from typing import Any
 
 from homeassistant.util.json import json_loads_object
 
 EMPTY_JSON_OBJECT = "{}"
+# Upper bound of the total length of the sources of the decoded attributes
+# and event data shared between queries
+DECODED_JSON_CACHE_MAX_LENGTH = 4 * 1024 * 1024
+# Longer sources are decoded by every query
+MAX_CACHED_SOURCE_LENGTH = 4096
 _LOGGER = logging.getLogger(__name__)
 
 
+class DecodedJsonCache:
+    """LRU of decoded attributes and event data, bounded by source length.
+
+    Only flat objects are cached, every caller gets its own copy of them
+    which it may modify.
+    """
+
+    def __init__(self, max_length: int = DECODED_JSON_CACHE_MAX_LENGTH) -> None:
+        """Initialize the cache."""
+        self.max_length = max_length
+        self.length = 0
+        self.hits = 0
+        self.misses = 0
+        self._decoded: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, source: str) -> dict[str, Any] | None:
+        """Return a copy of the decoded object of a source, if cached."""
+        with self._lock:
+            if (decoded := self._decoded.get(source)) is None:
+                self.misses += 1
+                return None
+            self._decoded.move_to_end(source)
+            self.hits += 1
+        return dict(decoded)
+
+    def add(self, source: str, decoded: dict[str, Any]) -> None:
+        """Cache the decoded object of a source if it is flat."""
+        if any(
+            value is not None and not isinstance(value, (str, int, float))
+            for value in decoded.values()
+        ):
+            return
+        with self._lock:
+            if source in self._decoded:
+                return
+            self._decoded[source] = decoded
+            self.length += len(source)
+            while self.length > self.max_length:
+                evicted, _ = self._decoded.popitem(last=False)
+                self.length -= len(evicted)
+
+    def clear(self) -> None:
+        """Clear the cache and its metrics."""
+        with self._lock:
+            self._decoded.clear()
+            self.length = self.hits = self.misses = 0
+
+    def info(self) -> dict[str, Any]:
+        """Return the metrics of the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._decoded),
+                "length": self.length,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            }
+
+
+DECODED_JSON_CACHE = DecodedJsonCache()
+
+
+def decode_json_object(source: str) -> dict[str, Any]:
+    """Decode shared attributes or event data.
+
+    The attributes and event data are deduplicated in the database, so
+    the same source is returned by many rows and queries. Short sources
+    are decoded once and shared through DECODED_JSON_CACHE. Raises
+    ValueError if the source is not a JSON object.
+    """
+    cacheable = len(source) <= MAX_CACHED_SOURCE_LENGTH
+    if cacheable and (decoded := DECODED_JSON_CACHE.get(source)) is not None:
+        return decoded
+    decoded = json_loads_object(source)
+    if cacheable:
+        DECODED_JSON_CACHE.add(source, decoded)
+        return dict(decoded)
+    return decoded
+
+
+def decoded_json_cache_info() -> dict[str, Any]:
+    """Return the metrics of the decoded attributes and event data cache."""
+    return DECODED_JSON_CACHE.info()
+
+
 def decode_attributes_from_source(
     source: Any, attr_cache: dict[str, dict[str, Any]]
 ) -> dict[str, Any]:
@@ -20,8 +114,9 @@ def decode_attributes_from_source(
     if (attributes := attr_cache.get(source)) is not None:
         return attributes
     try:
-        attr_cache[source] = attributes = json_loads_object(source)
+        attributes = decode_json_object(source)
     except ValueError:
         _LOGGER.exception("Error converting row to state attributes: %s", source)
-        attr_cache[source] = attributes = {}
+        attributes = {}
+    attr_cache[source] = attributes
     return attributes
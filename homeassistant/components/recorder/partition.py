@@ -0,0 +1,174 @@
+"""Range partitioned states and events tables on PostgreSQL.
+
+PostgreSQL can only partition a table when it is created, and the primary
+key of a partitioned table has to include the partition key. With the
+partition_tables option set, the recorder creates the states and events
+tables of a new database partitioned by range of their timestamp column,
+with the timestamp added to their primary key and without the old_state_id
+foreign key, as foreign keys cannot reference a partitioned table. Existing
+tables are never converted, but tables which have been recreated manually
+partitioned by range of their timestamp column, for example with
+
+    CREATE TABLE states (...) PARTITION BY RANGE (last_updated_ts);
+
+are detected as well. Daily partitions are created ahead of time, and the
+purge drops the partitions which only hold rows older than purge_keep_days
+instead of deleting their rows.
+
+MySQL and MariaDB are not supported: InnoDB cannot partition tables which
+have foreign keys, and only partitions by range of integer or temporal
+columns, not of the DOUBLE timestamp columns of the recorder schema.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+import logging
+import math
+import re
+
+from sqlalchemy import MetaData, PrimaryKeyConstraint, text
+from sqlalchemy.orm.session import Session
+
+from .db_schema import PARTITIONED_TABLE_COLUMNS, Base
+
+_LOGGER = logging.getLogger(__name__)
+
+# Number of days ahead of today partitions are created for
+PARTITIONS_AHEAD_DAYS = 3
+
+_BOUND_RE = re.compile(r"FOR VALUES FROM \((.+)\) TO \((.+)\)")
+
+
+@dataclass(slots=True, frozen=True)
+class Partition:
+    """A partition holding the rows with start_ts <= timestamp < end_ts."""
+
+    name: str
+    start_ts: float
+    end_ts: float
+
+
+def _parse_bound(bound: str, unbounded: float) -> float:
+    """Parse a bound of a range partition."""
+    bound = bound.strip().strip("'")
+    if bound in ("MINVALUE", "MAXVALUE"):
+        return unbounded
+    return float(bound)
+
+
+def get_partitioned_tables(session: Session) -> set[str]:
+    """Return the tables partitioned by range of their timestamp column."""
+    tables: set[str] = set()
+    for table, partition_key in session.execute(
+        text(
+            "SELECT c.relname, pg_get_partkeydef(c.oid) FROM pg_partitioned_table p"
+            " JOIN pg_class c ON c.oid = p.partrelid"
+            " WHERE pg_table_is_visible(c.oid)"
+        )
+    ):
+        if (column := PARTITIONED_TABLE_COLUMNS.get(table)) is None:
+            continue
+        if partition_key != f"RANGE ({column})":
+            _LOGGER.warning(
+                "The %s table is partitioned by %s instead of RANGE (%s), "
+                "partitions will not be managed by the recorder",
+                table,
+                partition_key,
+                column,
+            )
+            continue
+        tables.add(table)
+    return tables
+
+
+def get_partitions(session: Session, table: str) -> list[Partition]:
+    """Return the range partitions of a table, oldest first.
+
+    The default partition is not returned.
+    """
+    partitions: list[Partition] = []
+    for name, bound in session.execute(
+        text(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)"
+            " FROM pg_inherits"
+            " JOIN pg_class parent ON parent.oid = pg_inherits.inhparent"
+            " JOIN pg_class child ON child.oid = pg_inherits.inhrelid"
+            " WHERE parent.relname = :table AND pg_table_is_visible(parent.oid)"
+        ),
+        {"table": table},
+    ):
+        if match := _BOUND_RE.match(bound):
+            partitions.append(
+                Partition(
+                    name,
+                    _parse_bound(match[1], -math.inf),
+                    _parse_bound(match[2], math.inf),
+                )
+            )
+    return sorted(partitions, key=lambda partition: partition.start_ts)
+
+
+def partition_name(table: str, day: date) -> str:
+    """Return the name of the daily partition of a table."""
+    return f"{table}_p{day:%Y%m%d}"
+
+
+def missing_daily_partitions(
+    table: str, partitions: Iterable[Partition], first_day: date, days: int
+) -> list[Partition]:
+    """Return the daily partitions which do not overlap existing partitions."""
+    missing: list[Partition] = []
+    for offset in range(days):
+        day = first_day + timedelta(days=offset)
+        start_ts = datetime(day.year, day.month, day.day, tzinfo=UTC).timestamp()
+        end_ts = start_ts + 86400
+        if not any(
+            partition.start_ts < end_ts and start_ts < partition.end_ts
+            for partition in partitions
+        ):
+            missing.append(Partition(partition_name(table, day), start_ts, end_ts))
+    return missing
+
+
+def create_partition_sql(table: str, partition: Partition) -> str:
+    """Return the statement which creates a range partition of a table."""
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition.name} PARTITION OF {table}"
+        f" FOR VALUES FROM ({partition.start_ts!r}) TO ({partition.end_ts!r})"
+    )
+
+
+def create_default_partition_sql(table: str) -> str:
+    """Return the statement which creates the default partition of a table.
+
+    The default partition holds the rows outside of the daily partitions,
+    such as rows recorded with a timestamp before the table was created.
+    """
+    return f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT"
+
+
+def partitioned_schema() -> MetaData:
+    """Return the recorder schema with range partitioned states and events tables."""
+    metadata = MetaData()
+    for table in Base.metadata.sorted_tables:
+        table.to_metadata(metadata)
+    for name, column in PARTITIONED_TABLE_COLUMNS.items():
+        table = metadata.tables[name]
+        (id_column,) = table.primary_key.columns
+        for constraint in [
+            constraint
+            for constraint in table.foreign_key_constraints
+            if constraint.referred_table is table
+        ]:
+            table.constraints.discard(constraint)
+            table.foreign_keys.difference_update(constraint.elements)
+            for fk_column in constraint.columns:
+                fk_column.foreign_keys.clear()
+        # The id is no longer the only primary key column, but still generated
+        id_column.autoincrement = True
+        table.c[column].primary_key = True
+        table.append_constraint(PrimaryKeyConstraint(id_column.name, column))
+        table.dialect_options["postgresql"]["partition_by"] = f"RANGE ({column})"
+    return metadata
@@ -2,18 +2,21 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from sqlalchemy import bindparam, text
 from sqlalchemy.orm.session import Session
 
 import homeassistant.util.dt as dt_util
 
-from .db_schema import Events, States, StatesMeta
+from .db_schema import TABLE_EVENTS, TABLE_STATES, Events, States, StatesMeta
 from .models import DatabaseEngine
+from .partition import get_partitions
 from .queries import (
     attributes_ids_exist_in_states,
     attributes_ids_exist_in_states_with_fast_in_distinct,
@@ -52,6 +55,76 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# Time budget of a single purge run, the recorder does not write events
+# while it runs
+TARGET_PURGE_RUN_SECONDS = 1.0
+
+
+@dataclass(slots=True)
+class PurgeProgress:
+    """Track the progress of purging and tune the batches per purge run.
+
+    The number of batches is scaled after every run which did not finish,
+    so that a run takes about TARGET_PURGE_RUN_SECONDS. It never exceeds
+    the defaults, which are used for databases that are fast enough.
+
+    Only one chain of purge runs is in progress at a time, as the runs of a
+    chain share the batches. The incremental purge stops when the nightly
+    purge is queued, which continues where it stopped.
+    """
+
+    states_batches: int = DEFAULT_STATES_BATCHES_PER_PURGE
+    events_batches: int = DEFAULT_EVENTS_BATCHES_PER_PURGE
+    in_progress: bool = False
+    purged_before: datetime | None = None
+    runs: int = 0
+    states_purged: int = 0
+    events_purged: int = 0
+    seconds: float = 0.0
+    last_run_seconds: float | None = None
+    nightly_purge: bool = False
+
+    def record_run(
+        self, purge_before: datetime, elapsed: float, finished: bool
+    ) -> None:
+        """Record a purge run and tune the batches of the next run."""
+        self.runs += 1
+        self.seconds += elapsed
+        self.last_run_seconds = elapsed
+        if finished:
+            # A finished run also cleans up and may repack, its
+            # time does not depend on the number of batches
+            self.purged_before = purge_before
+            return
+        scale = min(max(TARGET_PURGE_RUN_SECONDS / max(elapsed, 0.001), 0.5), 2.0)
+        self.states_batches = min(
+            max(round(self.states_batches * scale), 1),
+            DEFAULT_STATES_BATCHES_PER_PURGE,
+        )
+        self.events_batches = min(
+            max(round(self.events_batches * scale), 1),
+            DEFAULT_EVENTS_BATCHES_PER_PURGE,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the purge progress."""
+        purged = self.states_purged + self.events_purged
+        return {
+            "in_progress": self.in_progress,
+            "purged_before": self.purged_before.isoformat()
+            if self.purged_before
+            else None,
+            "runs": self.runs,
+            "states_purged": self.states_purged,
+            "events_purged": self.events_purged,
+            "rows_per_second": round(purged / self.seconds) if self.seconds else None,
+            "last_run_seconds": None
+            if self.last_run_seconds is None
+            else round(self.last_run_seconds, 3),
+            "states_batches": self.states_batches,
+            "events_batches": self.events_batches,
+        }
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -85,6 +158,8 @@ def purge_old_data(
                 " remaining"
             )
             # Once we are done purging legacy rows, we use the new method
+            if instance.partitioned_tables:
+                _purge_partitions(instance, session, purge_before)
             has_more_to_purge |= _purge_states_and_attributes_ids(
                 instance, session, states_batch_size, purge_before
             )
@@ -172,6 +247,87 @@ def _purge_legacy_format(
     )
 
 
+def _purge_partitions(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> None:
+    """Drop the partitions which only hold rows older than purge_before.
+
+    The older rows of the partition holding purge_before are purged
+    in batches afterwards.
+    """
+    purge_before_ts = purge_before.timestamp()
+    quote = session.get_bind().dialect.identifier_preparer.quote
+    for table in (TABLE_STATES, TABLE_EVENTS):
+        if table not in instance.partitioned_tables:
+            continue
+        for partition in get_partitions(session, table):
+            if partition.end_ts > purge_before_ts:
+                break
+            if table == TABLE_STATES:
+                _drop_states_partition(instance, session, quote(partition.name))
+            else:
+                _drop_events_partition(instance, session, quote(partition.name))
+            # Dropping a partition locks the partitioned table until
+            # the transaction ends
+            session.commit()
+            _LOGGER.debug("Dropped partition %s of %s", partition.name, table)
+
+
+def _drop_states_partition(instance: Recorder, session: Session, name: str) -> None:
+    """Drop a partition of the states table and purge unused attributes."""
+    attributes_ids = {
+        attributes_id
+        for (attributes_id,) in session.execute(
+            text(
+                f"SELECT DISTINCT attributes_id FROM {name}"  # noqa: S608
+                " WHERE attributes_id IS NOT NULL"
+            )
+        )
+    }
+    # The state_ids of a partition are not contiguous, since rows are
+    # not always inserted in order of their last_updated_ts
+    select_committed = text(
+        f"SELECT state_id FROM {name} WHERE state_id IN :state_ids"  # noqa: S608
+    ).bindparams(bindparam("state_ids", expanding=True))
+    purged_state_ids = {
+        state_id
+        for state_ids_chunk in chunked(
+            instance.states_manager.committed_state_ids(), instance.max_bind_vars
+        )
+        for (state_id,) in session.execute(
+            select_committed, {"state_ids": list(state_ids_chunk)}
+        )
+    }
+    # The first state of an entity after the partition links to the
+    # last state of the entity in the partition
+    session.execute(
+        text(
+            "UPDATE states SET old_state_id = NULL"  # noqa: S608
+            f" WHERE old_state_id IN (SELECT state_id FROM {name})"
+        )
+    )
+    session.execute(text(f"DROP TABLE {name}"))
+    instance.states_manager.evict_purged_state_ids(purged_state_ids)
+    for attributes_ids_chunk in chunked(attributes_ids, instance.max_bind_vars):
+        _purge_unused_attributes_ids(instance, session, set(attributes_ids_chunk))
+
+
+def _drop_events_partition(instance: Recorder, session: Session, name: str) -> None:
+    """Drop a partition of the events table and purge unused event data."""
+    data_ids = {
+        data_id
+        for (data_id,) in session.execute(
+            text(
+                f"SELECT DISTINCT data_id FROM {name}"  # noqa: S608
+                " WHERE data_id IS NOT NULL"
+            )
+        )
+    }
+    session.execute(text(f"DROP TABLE {name}"))
+    for data_ids_chunk in chunked(data_ids, instance.max_bind_vars):
+        _purge_unused_data_ids(instance, session, set(data_ids_chunk))
+
+
 def _purge_states_and_attributes_ids(
     instance: Recorder,
     session: Session,
@@ -199,6 +355,7 @@ def _purge_states_and_attributes_ids(
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
+        instance.purge_progress.states_purged += len(state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
@@ -234,6 +391,7 @@ def _purge_events_and_data_ids(
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
+        instance.purge_progress.events_purged += len(event_ids)
         data_ids_batch = data_ids_batch | data_ids
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
@@ -626,6 +784,9 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
 
     # Check if excluded entity_ids are in database
     entity_filter = instance.entity_filter
+    instance.recent_states_manager.evict_entity_ids(
+        lambda entity_id: not entity_filter(entity_id)
+    )
     has_more_states_to_purge = False
     excluded_metadata_ids: list[str] = [
         metadata_id
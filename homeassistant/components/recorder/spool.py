@@ -0,0 +1,218 @@
+"""Spool events to disk while the database is unavailable."""
+from __future__ import annotations
+
+from io import BufferedWriter
+import logging
+import os
+from typing import Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, State
+from homeassistant.helpers.json import json_bytes
+import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
+
+_LOGGER = logging.getLogger(__name__)
+
+# Segments are replayed and committed one at a time
+SEGMENT_MAX_BYTES = 4 * 1024 * 1024
+# Upper bound of the disk space used by the spool, new events are
+# dropped once it is exceeded
+SPOOL_MAX_BYTES = 512 * 1024 * 1024
+
+SEGMENT_SUFFIX = ".spool"
+
+
+def _serialize_event(event: Event) -> bytes:
+    """Serialize an event to a single line."""
+    context = event.context
+    data: Any
+    if event.event_type == EVENT_STATE_CHANGED:
+        # Only the new state is recorded, the old state is not spooled
+        state: State | None = event.data.get("new_state")
+        data = [
+            event.data["entity_id"],
+            None
+            if state is None
+            else [
+                state.state,
+                state.attributes,
+                state.last_changed.timestamp(),
+                state.last_updated.timestamp(),
+            ],
+        ]
+    else:
+        data = event.data
+    return (
+        json_bytes(
+            [
+                event.event_type,
+                data,
+                event.origin.value,
+                event.time_fired.timestamp(),
+                context.id,
+                context.user_id,
+                context.parent_id,
+            ]
+        )
+        + b"\n"
+    )
+
+
+def _deserialize_event(line: bytes) -> Event:
+    """Deserialize an event serialized by _serialize_event."""
+    (
+        event_type,
+        data,
+        origin,
+        time_fired_ts,
+        context_id,
+        user_id,
+        parent_id,
+    ) = json_loads(line)
+    context = Context(user_id=user_id, parent_id=parent_id, id=context_id)
+    if event_type == EVENT_STATE_CHANGED:
+        entity_id, state = data
+        data = {"entity_id": entity_id, "old_state": None, "new_state": None}
+        if state is not None:
+            state_, attributes, last_changed_ts, last_updated_ts = state
+            data["new_state"] = State(
+                entity_id,
+                state_,
+                attributes,
+                dt_util.utc_from_timestamp(last_changed_ts),
+                dt_util.utc_from_timestamp(last_updated_ts),
+                context,
+                validate_entity_id=False,
+            )
+    return Event(
+        event_type,
+        data,
+        EventOrigin(origin),
+        dt_util.utc_from_timestamp(time_fired_ts),
+        context,
+    )
+
+
+class EventSpool:
+    """Append-only segment files of events waiting to be recorded.
+
+    Events are appended to the newest segment, which is rotated once it
+    reaches max_segment_bytes. Segments are read back oldest first and
+    removed once their events have been committed to the database, so
+    a segment may be replayed twice if Home Assistant stops in between.
+
+    This class is not thread-safe and must be used from the recorder thread.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_segment_bytes: int = SEGMENT_MAX_BYTES,
+        max_bytes: int = SPOOL_MAX_BYTES,
+    ) -> None:
+        """Initialize the spool."""
+        self.path = path
+        self.max_segment_bytes = max_segment_bytes
+        self.max_bytes = max_bytes
+        self.dropped = 0
+        self._writer: BufferedWriter | None = None
+        self._writer_bytes = 0
+        self._segments: list[str] | None = None
+        self._size = 0
+
+    def _load_segments(self) -> list[str]:
+        """Return the segments on disk, oldest first."""
+        if self._segments is None:
+            try:
+                names = os.listdir(self.path)
+            except FileNotFoundError:
+                names = []
+            self._segments = sorted(
+                os.path.join(self.path, name)
+                for name in names
+                if name.endswith(SEGMENT_SUFFIX)
+            )
+            self._size = sum(os.path.getsize(segment) for segment in self._segments)
+        return self._segments
+
+    @property
+    def segments(self) -> list[str]:
+        """Return the segments waiting to be replayed, oldest first."""
+        return list(self._load_segments())
+
+    def append(self, event: Event) -> None:
+        """Append an event to the newest segment."""
+        segments = self._load_segments()
+        try:
+            line = _serialize_event(event)
+        except (TypeError, ValueError) as err:
+            _LOGGER.warning("Event %s cannot be spooled: %s", event, err)
+            self.dropped += 1
+            return
+        if self._size + len(line) > self.max_bytes:
+            if not self.dropped:
+                _LOGGER.error(
+                    "The recorder spool reached its maximum size of %s bytes; "
+                    "new events will be dropped until the database is available",
+                    self.max_bytes,
+                )
+            self.dropped += 1
+            return
+        try:
+            if self._writer is None or self._writer_bytes >= self.max_segment_bytes:
+                self._close_writer()
+                os.makedirs(self.path, exist_ok=True)
+                sequence = (
+                    int(os.path.basename(segments[-1]).removesuffix(SEGMENT_SUFFIX)) + 1
+                    if segments
+                    else 0
+                )
+                segment = os.path.join(self.path, f"{sequence:010d}{SEGMENT_SUFFIX}")
+                self._writer = open(segment, "ab")  # noqa: SIM115
+                self._writer_bytes = 0
+                segments.append(segment)
+            self._writer.write(line)
+            self._writer.flush()
+        except OSError as err:
+            _LOGGER.error("Error writing to the recorder spool: %s", err)
+            self.dropped += 1
+            return
+        self._writer_bytes += len(line)
+        self._size += len(line)
+
+    def read_segment(self, segment: str) -> list[Event]:
+        """Read the events of a segment.
+
+        Appending continues in a new segment once the newest one is read.
+        """
+        if self._segments and segment == self._segments[-1]:
+            self._close_writer()
+        events: list[Event] = []
+        with open(segment, "rb") as file:
+            for line in file:
+                try:
+                    events.append(_deserialize_event(line))
+                except (ValueError, TypeError, KeyError) as err:
+                    # A line may be truncated if the system crashed while writing
+                    _LOGGER.warning("Skipping invalid spooled event: %s", err)
+        return events
+
+    def remove_segment(self, segment: str) -> None:
+        """Remove a segment after its events have been committed."""
+        segments = self._load_segments()
+        if segment == segments[-1]:
+            self._close_writer()
+        self._size -= os.path.getsize(segment)
+        os.remove(segment)
+        segments.remove(segment)
+
+    def _close_writer(self) -> None:
+        """Close the newest segment."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def close(self) -> None:
+        """Close the spool."""
+        self._close_writer()
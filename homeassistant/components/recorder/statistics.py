@@ -1,20 +1,32 @@
 """Statistics helper."""
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_left
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Sequence
 import contextlib
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
-from itertools import chain, groupby
+from itertools import groupby
 import logging
 from operator import itemgetter
 import re
-from statistics import mean
+from statistics import fmean
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from sqlalchemy import (
+    Select,
+    and_,
+    bindparam,
+    case,
+    func,
+    lambda_stmt,
+    literal_column,
+    select,
+    text,
+)
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError, StatementError
 from sqlalchemy.orm.session import Session
@@ -79,6 +91,10 @@ from .util import (
 if TYPE_CHECKING:
     from . import Recorder
 
+# Upper bound of periods statistics are aggregated into by the database,
+# longer ranges are reduced in Python
+MAX_PERIOD_BUCKETS = 2048
+
 QUERY_STATISTICS = (
     Statistics.metadata_id,
     Statistics.start_ts,
@@ -485,10 +501,26 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
         # not have to hit the database again.
         with session_scope(session=instance.get_session(), read_only=True) as session:
             instance.statistics_meta_manager.get_many(session, modified_statistic_ids)
+        instance.statistics_revision += 1
 
     return True
 
 
+def get_hourly_statistics_compiled_until(hass: HomeAssistant) -> datetime | None:
+    """Return the end of the newest compiled hourly statistics period.
+
+    Statistics are compiled in order, and the hourly statistics are
+    compiled together with the last 5-minute statistics of the hour.
+    """
+    with session_scope(hass=hass, read_only=True) as session:
+        last_run = session.query(func.max(StatisticsRuns.start)).scalar()
+    if last_run is None:
+        return None
+    return (process_timestamp(last_run) + timedelta(minutes=5)).replace(
+        minute=0, second=0, microsecond=0
+    )
+
+
 def _get_first_id_stmt(start: datetime) -> StatementLambdaElement:
     """Return a statement that returns the first run_id at start."""
     return lambda_stmt(lambda: select(StatisticsRuns.run_id).filter_by(start=start))
@@ -856,16 +888,37 @@ def list_statistic_ids(
     return _flatten_list_statistic_ids_metadata_result(result)
 
 
+def _reduce_column(
+    stat_list: list[StatisticsRow],
+    key: Literal["max", "mean", "min"],
+    period_slices: list[slice],
+    reduce: Callable[[Sequence[float]], float],
+) -> list[float | None]:
+    """Reduce a column of the hourly statistics for each period."""
+    column = [statistic.get(key) for statistic in stat_list]
+    if None not in column:
+        # Fast path, aggregate the slices without checking each value
+        return [reduce(column[period]) for period in period_slices]  # type: ignore[arg-type]
+    return [
+        reduce(values)
+        if (values := [v for v in column[period] if v is not None])
+        else None
+        for period in period_slices
+    ]
+
+
 def _reduce_statistics(
     stats: dict[str, list[StatisticsRow]],
-    same_period: Callable[[float, float], bool],
     period_start_end: Callable[[float], tuple[float, float]],
-    period: timedelta,
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to daily or monthly statistics."""
-    result: dict[str, list[StatisticsRow]] = defaultdict(list)
-    period_seconds = period.total_seconds()
+    """Reduce hourly statistics to daily or monthly statistics.
+
+    The hourly statistics are sorted by start, so the rows of each period
+    are found by bisecting the start column with the period boundaries
+    and each column is then aggregated per period with the builtins.
+    """
+    result: dict[str, list[StatisticsRow]] = {}
     _want_mean = "mean" in types
     _want_min = "min" in types
     _want_max = "max" in types
@@ -873,44 +926,42 @@ def _reduce_statistics(
     _want_state = "state" in types
     _want_sum = "sum" in types
     for statistic_id, stat_list in stats.items():
-        max_values: list[float] = []
-        mean_values: list[float] = []
-        min_values: list[float] = []
-        prev_stat: StatisticsRow = stat_list[0]
-        fake_entry: StatisticsRow = {"start": stat_list[-1]["start"] + period_seconds}
-
-        # Loop over the hourly statistics + a fake entry to end the period
-        for statistic in chain(stat_list, (fake_entry,)):
-            if not same_period(prev_stat["start"], statistic["start"]):
-                start, end = period_start_end(prev_stat["start"])
-                # The previous statistic was the last entry of the period
-                row: StatisticsRow = {
-                    "start": start,
-                    "end": end,
-                }
-                if _want_mean:
-                    row["mean"] = mean(mean_values) if mean_values else None
-                    mean_values.clear()
-                if _want_min:
-                    row["min"] = min(min_values) if min_values else None
-                    min_values.clear()
-                if _want_max:
-                    row["max"] = max(max_values) if max_values else None
-                    max_values.clear()
-                if _want_last_reset:
-                    row["last_reset"] = prev_stat.get("last_reset")
-                if _want_state:
-                    row["state"] = prev_stat.get("state")
-                if _want_sum:
-                    row["sum"] = prev_stat["sum"]
-                result[statistic_id].append(row)
-            if _want_max and (_max := statistic.get("max")) is not None:
-                max_values.append(_max)
-            if _want_mean and (_mean := statistic.get("mean")) is not None:
-                mean_values.append(_mean)
-            if _want_min and (_min := statistic.get("min")) is not None:
-                min_values.append(_min)
-            prev_stat = statistic
+        starts = array("d", [statistic["start"] for statistic in stat_list])
+        num_stats = len(starts)
+        periods: list[tuple[float, float]] = []
+        period_slices: list[slice] = []
+        idx = 0
+        while idx < num_stats:
+            start, end = period_start_end(starts[idx])
+            end_idx = bisect_left(starts, end, idx + 1)
+            periods.append((start, end))
+            period_slices.append(slice(idx, end_idx))
+            idx = end_idx
+        if _want_mean:
+            means = _reduce_column(stat_list, "mean", period_slices, fmean)
+        if _want_min:
+            mins = _reduce_column(stat_list, "min", period_slices, min)
+        if _want_max:
+            maxs = _reduce_column(stat_list, "max", period_slices, max)
+        rows: list[StatisticsRow] = []
+        for period_idx, (start, end) in enumerate(periods):
+            row: StatisticsRow = {"start": start, "end": end}
+            if _want_mean:
+                row["mean"] = means[period_idx]
+            if _want_min:
+                row["min"] = mins[period_idx]
+            if _want_max:
+                row["max"] = maxs[period_idx]
+            # The last statistic of the period holds its state and sum
+            last_stat = stat_list[period_slices[period_idx].stop - 1]
+            if _want_last_reset:
+                row["last_reset"] = last_stat.get("last_reset")
+            if _want_state:
+                row["state"] = last_stat.get("state")
+            if _want_sum:
+                row["sum"] = last_stat["sum"]
+            rows.append(row)
+        result[statistic_id] = rows
 
     return result
 
@@ -957,10 +1008,8 @@ def _reduce_statistics_per_day(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to daily statistics."""
-    _same_day_ts, _day_start_end_ts = reduce_day_ts_factory()
-    return _reduce_statistics(
-        stats, _same_day_ts, _day_start_end_ts, timedelta(days=1), types
-    )
+    _, _day_start_end_ts = reduce_day_ts_factory()
+    return _reduce_statistics(stats, _day_start_end_ts, types)
 
 
 def reduce_week_ts_factory() -> (
@@ -1007,10 +1056,8 @@ def _reduce_statistics_per_week(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to weekly statistics."""
-    _same_week_ts, _week_start_end_ts = reduce_week_ts_factory()
-    return _reduce_statistics(
-        stats, _same_week_ts, _week_start_end_ts, timedelta(days=7), types
-    )
+    _, _week_start_end_ts = reduce_week_ts_factory()
+    return _reduce_statistics(stats, _week_start_end_ts, types)
 
 
 def _find_month_end_time(timestamp: datetime) -> datetime:
@@ -1064,10 +1111,24 @@ def _reduce_statistics_per_month(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to monthly statistics."""
-    _same_month_ts, _month_start_end_ts = reduce_month_ts_factory()
-    return _reduce_statistics(
-        stats, _same_month_ts, _month_start_end_ts, timedelta(days=31), types
-    )
+    _, _month_start_end_ts = reduce_month_ts_factory()
+    return _reduce_statistics(stats, _month_start_end_ts, types)
+
+
+PERIOD_TS_FACTORIES: dict[
+    str,
+    Callable[
+        [],
+        tuple[
+            Callable[[float, float], bool],
+            Callable[[float], tuple[float, float]],
+        ],
+    ],
+] = {
+    "day": reduce_day_ts_factory,
+    "week": reduce_week_ts_factory,
+    "month": reduce_month_ts_factory,
+}
 
 
 def _generate_statistics_during_period_stmt(
@@ -1096,6 +1157,160 @@ def _generate_statistics_during_period_stmt(
     return stmt
 
 
+def _period_bucket_edges(
+    start_time: datetime,
+    end_time: datetime | None,
+    period_start_end: Callable[[float], tuple[float, float]],
+) -> list[float] | None:
+    """Return the boundaries of the periods between start_time and end_time.
+
+    The periods are computed in the local time zone, so days around DST
+    changes are 23 or 25 hours long. If end_time is omitted, the periods
+    run until the end of the current period. Returns None if there are
+    more periods than the database should be asked to bucket.
+    """
+    start_ts = start_time.timestamp()
+    end_ts = (
+        end_time.timestamp()
+        if end_time is not None
+        else period_start_end(max(dt_util.utcnow().timestamp(), start_ts))[1]
+    )
+    edges = [start_ts]
+    while edges[-1] < end_ts:
+        if len(edges) > MAX_PERIOD_BUCKETS:
+            return None
+        edges.append(period_start_end(edges[-1])[1])
+    return edges
+
+
+def _period_bucket_expression(
+    column: Any, edges: list[float], first: int, last: int
+) -> Any:
+    """Return an expression mapping column to the index of its bucket.
+
+    The buckets are found by a balanced tree of CASE expressions, so each
+    row is compared to log2(number of buckets) edges only.
+    """
+    if last - first == 1:
+        return literal_column(str(first))
+    middle = (first + last) // 2
+    return case(
+        (
+            column < literal_column(repr(edges[middle])),
+            _period_bucket_expression(column, edges, first, middle),
+        ),
+        else_=_period_bucket_expression(column, edges, middle, last),
+    )
+
+
+def _generate_reduced_statistics_during_period_stmt(
+    edges: list[float],
+    end_time: datetime | None,
+    metadata_ids: list[int] | None,
+    table: type[StatisticsBase],
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> Select:
+    """Prepare a database query for statistics aggregated per period.
+
+    The rows are grouped by the index of the period they start in, the
+    index is returned as start_ts. Rows after the last edge, which can
+    only happen when end_time is omitted, are returned with index -1.
+    The state, sum and last_reset are taken from the last row of each
+    period by joining the aggregated rows back to the table.
+    """
+    bucket = case(
+        (
+            table.start_ts < literal_column(repr(edges[-1])),
+            _period_bucket_expression(table.start_ts, edges, 0, len(edges) - 1),
+        ),
+        else_=literal_column("-1"),
+    )
+    aggregated = select(
+        table.metadata_id,
+        bucket.label("start_ts"),
+        func.max(table.start_ts).label("last_start_ts"),
+    )
+    if "mean" in types:
+        aggregated = aggregated.add_columns(func.avg(table.mean).label("mean"))
+    if "min" in types:
+        aggregated = aggregated.add_columns(func.min(table.min).label("min"))
+    if "max" in types:
+        aggregated = aggregated.add_columns(func.max(table.max).label("max"))
+    aggregated = aggregated.filter(table.start_ts >= edges[0])
+    if end_time is not None:
+        aggregated = aggregated.filter(table.start_ts < end_time.timestamp())
+    if metadata_ids:
+        aggregated = aggregated.filter(table.metadata_id.in_(metadata_ids))
+    subquery = aggregated.group_by(table.metadata_id, bucket).subquery()
+
+    stmt = select(subquery.c.metadata_id, subquery.c.start_ts)
+    for key in ("mean", "min", "max"):
+        if key in types:
+            stmt = stmt.add_columns(subquery.c[key])
+    if last_row_columns := [
+        getattr(table, column)
+        for key, column in _type_column_mapping.items()
+        if key in types and key in ("last_reset", "state", "sum")
+    ]:
+        stmt = stmt.add_columns(*last_row_columns).join(
+            table,
+            and_(
+                table.metadata_id == subquery.c.metadata_id,
+                table.start_ts == subquery.c.last_start_ts,
+            ),
+        )
+    return stmt.order_by(subquery.c.metadata_id, subquery.c.start_ts)
+
+
+def _reduced_statistics_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    metadata_ids: list[int] | None,
+    period_start_end: Callable[[float], tuple[float, float]],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]] | None:
+    """Return statistics reduced to periods by the database.
+
+    Returns None if the periods could not be aggregated in the database,
+    the hourly statistics have to be reduced in Python instead.
+    """
+    if (edges := _period_bucket_edges(start_time, end_time, period_start_end)) is None:
+        return None
+    stmt = _generate_reduced_statistics_during_period_stmt(
+        edges, end_time, metadata_ids, Statistics, types
+    )
+    stats = session.execute(stmt).all()
+    if not stats:
+        return {}
+    if any(row.start_ts < 0 for row in stats):
+        return None
+
+    result = _sorted_statistics_to_dict(
+        hass,
+        session,
+        stats,
+        statistic_ids,
+        metadata,
+        True,
+        Statistics,
+        start_time,
+        units,
+        types,
+    )
+    # Replace the period indices with the boundaries of the periods
+    for stat_list in result.values():
+        for row in stat_list:
+            bucket = int(row["start"])
+            row["start"] = edges[bucket]
+            row["end"] = edges[bucket + 1]
+    return result
+
+
 def _generate_max_mean_min_statistic_in_sub_period_stmt(
     columns: Select,
     start_time: datetime | None,
@@ -1625,6 +1840,55 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _statistics_during_period_reduced_in_python(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    metadata_ids: list[int] | None,
+    table: type[Statistics | StatisticsShortTerm],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Fetch the statistics of every row in the period and reduce them in Python."""
+    stmt = _generate_statistics_during_period_stmt(
+        start_time, end_time, metadata_ids, table, types
+    )
+    stats = cast(
+        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    )
+
+    if not stats:
+        return {}
+
+    result = _sorted_statistics_to_dict(
+        hass,
+        session,
+        stats,
+        statistic_ids,
+        metadata,
+        True,
+        table,
+        start_time,
+        units,
+        types,
+    )
+
+    if period == "day":
+        result = _reduce_statistics_per_day(result, types)
+
+    if period == "week":
+        result = _reduce_statistics_per_week(result, types)
+
+    if period == "month":
+        result = _reduce_statistics_per_month(result, types)
+
+    return result
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1695,37 +1959,40 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
-
-    if not stats:
-        return {}
-
-    result = _sorted_statistics_to_dict(
-        hass,
-        session,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        start_time,
-        units,
-        types,
-    )
-
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+    result: dict[str, list[StatisticsRow]] | None = None
+    if period in PERIOD_TS_FACTORIES:
+        # Let the database aggregate the hourly statistics of each period
+        _, period_start_end = PERIOD_TS_FACTORIES[period]()
+        result = _reduced_statistics_during_period(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata,
+            metadata_ids,
+            period_start_end,
+            units,
+            types,
+        )
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+    if result is None:
+        result = _statistics_during_period_reduced_in_python(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            period,
+            metadata,
+            metadata_ids,
+            table,
+            units,
+            types,
+        )
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+    if not result:
+        return {}
 
     if "change" in _types:
         _augment_result_with_change(
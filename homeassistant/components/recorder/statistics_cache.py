@@ -0,0 +1,165 @@
+"""Cache of the hourly statistics queried by the frontend."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import chain
+import threading
+from typing import Literal
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util import dt as dt_util
+
+from . import statistics
+from .statistics import StatisticsRow
+from .util import get_instance
+
+# Upper bound of cached queries, each holds the hourly statistics of a range
+DEFAULT_MAX_ENTRIES = 16
+# Upper bound of the statistics rows held by all cached queries
+DEFAULT_MAX_ROWS = 100_000
+# Queries holding more than this share of the rows are not cached, so a
+# single long range does not evict all the others
+MAX_ENTRY_ROWS_SHARE = 4
+
+_CacheKey = tuple[float, frozenset[str], frozenset[tuple[str, str]], frozenset[str]]
+
+
+@dataclass(slots=True)
+class _CachedStatistics:
+    """Hourly statistics which will no longer change."""
+
+    revision: int
+    final_until: float
+    stats: dict[str, list[StatisticsRow]]
+    rows: int
+
+
+def _statistics_before(
+    stats: dict[str, list[StatisticsRow]], before: float
+) -> dict[str, list[StatisticsRow]]:
+    """Return the statistics which start before a timestamp."""
+    result: dict[str, list[StatisticsRow]] = {}
+    for statistic_id, rows in stats.items():
+        if rows and rows[-1]["start"] >= before:
+            rows = [row for row in rows if row["start"] < before]
+        if rows:
+            result[statistic_id] = rows
+    return result
+
+
+class HourlyStatisticsCache:
+    """Cache hourly statistics of the ranges shown by the dashboards.
+
+    Hourly statistics are final once they have been compiled, unless
+    they are imported, adjusted or cleared, which bumps the statistics
+    revision of the recorder. The cache keeps the final part of each
+    query, and a repeated query of the same range only fetches the hours
+    compiled since, so reopening the dashboard does not query the whole
+    range again. The cache is bounded by the number of queries and by the
+    number of statistics rows they hold together.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_rows: int = DEFAULT_MAX_ROWS,
+    ) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self.rows = 0
+        self._entries: OrderedDict[_CacheKey, _CachedStatistics] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hourly_statistics_during_period(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        statistic_ids: set[str],
+        units: dict[str, str] | None,
+        types: set[
+            Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]
+        ],
+    ) -> dict[str, list[StatisticsRow]]:
+        """Return hourly statistics during a period.
+
+        This must be called from the recorder executor. The returned rows
+        are shared with the cache and must not be modified.
+        """
+        hass = self.hass
+        start_ts = start_time.timestamp()
+        end_ts = end_time.timestamp()
+        key: _CacheKey = (
+            start_ts,
+            frozenset(statistic_ids),
+            frozenset(units.items()) if units else frozenset(),
+            frozenset(types),
+        )
+        revision = get_instance(hass).statistics_revision
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is not None and entry.revision != revision:
+            entry = None
+
+        if entry is None:
+            cached: dict[str, list[StatisticsRow]] = {}
+            fetch_start_ts = start_ts
+        elif end_ts <= entry.final_until:
+            return _statistics_before(entry.stats, end_ts)
+        else:
+            cached = entry.stats
+            fetch_start_ts = entry.final_until
+
+        # Statistics compiled after this point in time are fetched again,
+        # compiled_until must be read before the statistics are
+        compiled_until = statistics.get_hourly_statistics_compiled_until(hass)
+        fetched = statistics.statistics_during_period(
+            hass,
+            dt_util.utc_from_timestamp(fetch_start_ts),
+            end_time,
+            statistic_ids,
+            "hour",
+            units,
+            types,
+        )
+        stats = {
+            statistic_id: [
+                *cached.get(statistic_id, ()),
+                *fetched.get(statistic_id, ()),
+            ]
+            for statistic_id in dict.fromkeys(chain(cached, fetched))
+        }
+
+        final_until = fetch_start_ts
+        if compiled_until is not None:
+            final_until = max(final_until, min(end_ts, compiled_until.timestamp()))
+        if final_until > start_ts:
+            final_stats = _statistics_before(stats, final_until)
+            rows = sum(len(stat_rows) for stat_rows in final_stats.values())
+            with self._lock:
+                if (replaced := self._entries.pop(key, None)) is not None:
+                    self.rows -= replaced.rows
+                if rows <= self.max_rows // MAX_ENTRY_ROWS_SHARE:
+                    self._entries[key] = _CachedStatistics(
+                        revision, final_until, final_stats, rows
+                    )
+                    self.rows += rows
+                while (
+                    len(self._entries) > self.max_entries or self.rows > self.max_rows
+                ):
+                    _, evicted = self._entries.popitem(last=False)
+                    self.rows -= evicted.rows
+        return stats
+
+
+@singleton("recorder_statistics_cache")
+def async_get_statistics_cache(hass: HomeAssistant) -> HourlyStatisticsCache:
+    """Return the hourly statistics cache."""
+    return HourlyStatisticsCache(hass)
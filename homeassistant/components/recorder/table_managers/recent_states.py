@@ -0,0 +1,237 @@
+"""Keep recently recorded states in memory to serve history without the database."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+import sys
+import threading
+from typing import Any
+
+# Upper bound of rows kept for a single entity
+MAX_ROWS_PER_ENTITY = 4096
+# Upper bound of rows kept over all entities, least recently read
+# entities are dropped first when it is exceeded
+MAX_ROWS = 500000
+
+_intern = sys.intern
+
+
+class _RecentEntityStates:
+    """Columnar ring buffer of the recorded states of a single entity.
+
+    Rows are sorted by last_updated_ts. Every row recorded after
+    complete_since is kept, older rows have been dropped to bound memory.
+    """
+
+    __slots__ = ("complete_since", "last_updated_ts", "states", "significant")
+
+    def __init__(self, complete_since: float) -> None:
+        """Initialize the buffer."""
+        self.complete_since = complete_since
+        self.last_updated_ts = array("d")
+        self.states: list[str | None] = []
+        self.significant = bytearray()
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.states)
+
+    def append(
+        self, last_updated_ts: float, state: str | None, significant: bool
+    ) -> None:
+        """Add a row, keeping the rows sorted."""
+        timestamps = self.last_updated_ts
+        if not timestamps or timestamps[-1] <= last_updated_ts:
+            idx = len(timestamps)
+        else:
+            # Events fired from other threads can be recorded out of order
+            idx = bisect_right(timestamps, last_updated_ts)
+        timestamps.insert(idx, last_updated_ts)
+        self.states.insert(idx, state)
+        self.significant.insert(idx, significant)
+
+    def drop_before(self, idx: int) -> None:
+        """Drop the rows before idx."""
+        if idx <= 0:
+            return
+        self.complete_since = max(self.complete_since, self.last_updated_ts[idx - 1])
+        del self.last_updated_ts[:idx]
+        del self.states[:idx]
+        del self.significant[:idx]
+
+
+class RecentStatesManager:
+    """Manage an in-memory copy of the most recently recorded states.
+
+    The copy is fed from the recorder thread after each commit, so it
+    holds exactly the rows that are in the states table, and is read
+    from the database executor to answer history requests for windows
+    it fully covers.
+    """
+
+    def __init__(
+        self,
+        max_rows_per_entity: int = MAX_ROWS_PER_ENTITY,
+        max_rows: int = MAX_ROWS,
+    ) -> None:
+        """Initialize the recent states manager."""
+        self.max_rows_per_entity = max_rows_per_entity
+        self.max_rows = max_rows
+        self.hits = 0
+        self.misses = 0
+        self._rows = 0
+        self._pending: list[tuple[str, float, str | None, bool]] = []
+        self._entities: OrderedDict[str, _RecentEntityStates] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add_pending(
+        self,
+        entity_id: str,
+        last_updated_ts: float,
+        state: str | None,
+        significant: bool,
+    ) -> None:
+        """Add a state that is in the session but not yet committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending.append(
+            (
+                entity_id,
+                last_updated_ts,
+                None if state is None else _intern(state),
+                significant,
+            )
+        )
+
+    def post_commit_pending(self) -> None:
+        """Move the committed states into the cache.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not self._pending:
+            return
+        max_rows_per_entity = self.max_rows_per_entity
+        # Trim in chunks to avoid shifting the arrays for every new row
+        trim_at = max_rows_per_entity + max(max_rows_per_entity // 8, 1)
+        entities = self._entities
+        with self._lock:
+            for entity_id, last_updated_ts, state, significant in self._pending:
+                if (recent := entities.get(entity_id)) is None:
+                    recent = entities[entity_id] = _RecentEntityStates(last_updated_ts)
+                recent.append(last_updated_ts, state, significant)
+                self._rows += 1
+                if len(recent) >= trim_at:
+                    excess = len(recent) - max_rows_per_entity
+                    recent.drop_before(excess)
+                    self._rows -= excess
+            while self._rows > self.max_rows and entities:
+                _, recent = entities.popitem(last=False)
+                self._rows -= len(recent)
+        self._pending.clear()
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending.clear()
+        with self._lock:
+            self._entities.clear()
+            self._rows = 0
+
+    def evict_purged(self, purge_before_ts: float) -> None:
+        """Drop the states that are about to be purged from the database."""
+        with self._lock:
+            for recent in self._entities.values():
+                idx = bisect_left(recent.last_updated_ts, purge_before_ts)
+                recent.drop_before(idx)
+                self._rows -= idx
+
+    def evict_entity_ids(self, entity_filter: Callable[[str], bool]) -> None:
+        """Drop all states of the entity_ids matching entity_filter."""
+        with self._lock:
+            for entity_id in [
+                entity_id for entity_id in self._entities if entity_filter(entity_id)
+            ]:
+                self._rows -= len(self._entities.pop(entity_id))
+
+    def get_rows(
+        self,
+        entity_ids: Iterable[str],
+        start_time_ts: float,
+        end_time_ts: float | None,
+        start_state_since_ts: float | None,
+        include_start_time_state: bool,
+        only_significant: Callable[[str], bool],
+    ) -> list[tuple[int, str | None, float]] | None:
+        """Return the rows of a history query, or None if they are not all cached.
+
+        The rows have the same shape as the rows of the significant states
+        query with no attributes, the metadata_id is replaced by the position
+        of the entity_id in entity_ids. The start time state is taken from
+        the last state before start_time_ts, if it was recorded after
+        start_state_since_ts. Only the significant rows are returned for
+        the entity_ids only_significant returns True for.
+        """
+        rows: list[tuple[int, str | None, float]] = []
+        entities = self._entities
+        with self._lock:
+            for idx, entity_id in enumerate(entity_ids):
+                if (recent := entities.get(entity_id)) is None:
+                    self.misses += 1
+                    return None
+                timestamps = recent.last_updated_ts
+                first_idx = bisect_right(timestamps, start_time_ts)
+                if include_start_time_state:
+                    # The last state before the start time is only known
+                    # if an older one is still cached
+                    start_idx = bisect_left(timestamps, start_time_ts)
+                    if start_idx == 0:
+                        self.misses += 1
+                        return None
+                    if (
+                        start_state_since_ts is None
+                        or timestamps[start_idx - 1] >= start_state_since_ts
+                    ):
+                        rows.append((idx, recent.states[start_idx - 1], 0))
+                elif recent.complete_since > start_time_ts:
+                    self.misses += 1
+                    return None
+                last_idx = (
+                    len(timestamps)
+                    if end_time_ts is None
+                    else bisect_left(timestamps, end_time_ts, first_idx)
+                )
+                states = recent.states
+                if only_significant(entity_id):
+                    significant = recent.significant
+                    rows.extend(
+                        (idx, states[row_idx], timestamps[row_idx])
+                        for row_idx in range(first_idx, last_idx)
+                        if significant[row_idx]
+                    )
+                else:
+                    rows.extend(
+                        (idx, states[row_idx], timestamps[row_idx])
+                        for row_idx in range(first_idx, last_idx)
+                    )
+                entities.move_to_end(entity_id)
+            self.hits += 1
+        return rows
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cache metrics."""
+        lookups = self.hits + self.misses
+        return {
+            "entities": len(self._entities),
+            "rows": self._rows,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+        }
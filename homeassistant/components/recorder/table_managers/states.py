@@ -80,6 +80,14 @@ class StatesManager:
         ):
             last_committed_ids.pop(last_committed_ids_reversed[purged_state_id], None)
 
+    def committed_state_ids(self) -> list[int]:
+        """Return the state_ids of the committed states.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return list(self._last_committed_id.values())
+
     def evict_purged_entity_ids(self, purged_entity_ids: set[str]) -> None:
         """Evict purged entity_ids from the committed states.
 
@@ -8,13 +8,14 @@ from dataclasses import dataclass
 from datetime import datetime
 import logging
 import threading
+import time
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import Event
 from homeassistant.helpers.typing import UndefinedType
 
 from . import entity_registry, purge, statistics
-from .const import DOMAIN
+from .const import DOMAIN, INTEGRATION_PLATFORM_RECORD_STATE_CHANGED
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
 from .util import periodic_db_cleanups, session_scope
@@ -53,6 +54,7 @@ class ChangeStatisticsUnitTask(RecorderTask):
             self.new_unit_of_measurement,
             self.old_unit_of_measurement,
         )
+        instance.statistics_revision += 1
 
 
 @dataclass(slots=True)
@@ -64,6 +66,7 @@ class ClearStatisticsTask(RecorderTask):
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
         statistics.clear_statistics(instance, self.statistic_ids)
+        instance.statistics_revision += 1
 
 
 @dataclass(slots=True)
@@ -82,6 +85,7 @@ class UpdateStatisticsMetadataTask(RecorderTask):
             self.new_statistic_id,
             self.new_unit_of_measurement,
         )
+        instance.statistics_revision += 1
 
 
 @dataclass(slots=True)
@@ -107,23 +111,63 @@ class PurgeTask(RecorderTask):
     purge_before: datetime
     repack: bool
     apply_filter: bool
+    # Incremental purges only continue while the recorder is idle
+    incremental: bool = False
+    nightly: bool = False
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
-        if purge.purge_old_data(
-            instance, self.purge_before, self.repack, self.apply_filter
-        ):
+        progress = instance.purge_progress
+        if self.incremental and progress.nightly_purge:
+            # The nightly purge continues where the incremental purge stopped
+            return
+        continued = False
+        try:
+            continued = self._run(instance)
+        finally:
+            # Also end the chain when the purge raised, otherwise
+            # the incremental purge would never run again
+            if not continued and (self.incremental or self.nightly):
+                if self.nightly:
+                    progress.nightly_purge = False
+                progress.in_progress = progress.nightly_purge
+
+    def _run(self, instance: Recorder) -> bool:
+        """Run a purge, return True if the chain continues with another run."""
+        progress = instance.purge_progress
+        instance.recent_states_manager.evict_purged(self.purge_before.timestamp())
+        start = time.monotonic()
+        finished = purge.purge_old_data(
+            instance,
+            self.purge_before,
+            self.repack,
+            self.apply_filter,
+            progress.events_batches,
+            progress.states_batches,
+        )
+        progress.record_run(self.purge_before, time.monotonic() - start, finished)
+        if finished:
             with instance.get_session() as session:
                 instance.recorder_runs_manager.load_from_db(session)
             # We always need to do the db cleanups after a purge
             # is finished to ensure the WAL checkpoint and other
             # tasks happen after a vacuum.
             periodic_db_cleanups(instance)
-            return
+            return False
+        if self.incremental and not instance.is_idle:
+            # Continue with the next incremental purge
+            return False
         # Schedule a new purge task if this one didn't finish
         instance.queue_task(
-            PurgeTask(self.purge_before, self.repack, self.apply_filter)
+            PurgeTask(
+                self.purge_before,
+                self.repack,
+                self.apply_filter,
+                self.incremental,
+                self.nightly,
+            )
         )
+        return True
 
 
 @dataclass(slots=True)
@@ -135,6 +179,7 @@ class PurgeEntitiesTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge entities from the database."""
+        instance.recent_states_manager.evict_entity_ids(self.entity_filter)
         if purge.purge_entity_data(instance, self.entity_filter, self.purge_before):
             return
         # Schedule a new purge task if this one didn't finish
@@ -153,6 +198,15 @@ class PerodicCleanupTask(RecorderTask):
         periodic_db_cleanups(instance)
 
 
+@dataclass(slots=True)
+class CreatePartitionsTask(RecorderTask):
+    """An object to insert into the recorder queue to create daily partitions."""
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._create_partitions()  # pylint: disable=[protected-access]
+
+
 @dataclass(slots=True)
 class StatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run a statistics task."""
@@ -193,6 +247,7 @@ class ImportStatisticsTask(RecorderTask):
         if statistics.import_statistics(
             instance, self.metadata, self.statistics, self.table
         ):
+            instance.statistics_revision += 1
             return
         # Schedule a new statistics task if this one didn't finish
         instance.queue_task(
@@ -218,6 +273,7 @@ class AdjustStatisticsTask(RecorderTask):
             self.sum_adjustment,
             self.adjustment_unit,
         ):
+            instance.statistics_revision += 1
             return
         # Schedule a new adjust statistics task if this one didn't finish
         instance.queue_task(
@@ -320,6 +376,10 @@ class AddRecorderPlatformTask(RecorderTask):
         platform = self.platform
         platforms: dict[str, Any] = hass.data[DOMAIN].recorder_platforms
         platforms[domain] = platform
+        if record_state_changed := getattr(
+            platform, INTEGRATION_PLATFORM_RECORD_STATE_CHANGED, None
+        ):
+            instance.state_changed_recorders[domain] = record_state_changed
 
 
 @dataclass(slots=True)
@@ -30,9 +30,10 @@ from homeassistant.util.unit_conversion import (
     VolumeConverter,
 )
 
-from .models import StatisticPeriod
+from .models import StatisticPeriod, decoded_json_cache_info
 from .statistics import (
     STATISTIC_UNIT_TO_UNIT_CONVERTER,
+    StatisticsRow,
     async_add_external_statistics,
     async_change_statistics_unit,
     async_import_statistics,
@@ -42,6 +43,7 @@ from .statistics import (
     statistics_during_period,
     validate_statistics,
 )
+from .statistics_cache import HourlyStatisticsCache, async_get_statistics_cache
 from .util import (
     PERIOD_SCHEMA,
     async_migration_in_progress,
@@ -155,17 +157,33 @@ def _ws_get_statistics_during_period(
     period: Literal["5minute", "day", "hour", "week", "month"],
     units: dict[str, str],
     types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
+    statistics_cache: HourlyStatisticsCache,
 ) -> str:
     """Fetch statistics and convert them to json in the executor."""
-    result = statistics_during_period(
-        hass,
-        start_time,
-        end_time,
-        statistic_ids,
-        period,
-        units,
-        types,
-    )
+    result: dict[str, list[StatisticsRow]]
+    if period == "hour":
+        # Hours compiled by an earlier request for the same range are
+        # served from the cache, its rows are copied before they are modified
+        result = {
+            statistic_id: [row.copy() for row in rows]
+            for statistic_id, rows in statistics_cache.hourly_statistics_during_period(
+                start_time,
+                end_time or dt_util.utcnow(),
+                statistic_ids,
+                units,
+                types,
+            ).items()
+        }
+    else:
+        result = statistics_during_period(
+            hass,
+            start_time,
+            end_time,
+            statistic_ids,
+            period,
+            units,
+            types,
+        )
     for statistic_id in result:
         for item in result[statistic_id]:
             if (start := item.get("start")) is not None:
@@ -212,6 +230,7 @@ async def ws_handle_get_statistics_during_period(
             msg.get("period"),
             msg.get("units"),
             types,
+            async_get_statistics_cache(hass),
         )
     )
 
@@ -508,6 +527,9 @@ def ws_info(
         "migration_is_live": migration_is_live,
         "recording": recording,
         "thread_running": thread_alive,
+        "recent_history_cache": instance.recent_states_manager.as_dict(),
+        "decoded_attributes_cache": decoded_json_cache_info(),
+        "purge": instance.purge_progress.as_dict(),
     }
     connection.send_result(msg["id"], recorder_info)
 
@@ -5,6 +5,7 @@ from abc import ABC, abstractmethod
 import asyncio
 from dataclasses import dataclass
 import logging
+import time
 from typing import Any, cast
 
 import voluptuous as vol
@@ -64,6 +65,7 @@ from .const import (
     ATTR_VARIABLES,
     CONF_FIELDS,
     CONF_TRACE,
+    DATA_RELOAD_STATISTICS,
     DOMAIN,
     ENTITY_ID_FORMAT,
     EVENT_SCRIPT_STARTED,
@@ -196,10 +198,14 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     async def reload_service(service: ServiceCall) -> None:
         """Call a service to reload scripts."""
+        start = time.monotonic()
         await async_get_blueprints(hass).async_reset_cache()
         if (conf := await component.async_prepare_reload(skip_reset=True)) is None:
             return
         await _async_process_config(hass, conf, component)
+        duration = time.monotonic() - start
+        hass.data[DATA_RELOAD_STATISTICS]["reload_duration"] = round(duration, 3)
+        LOGGER.debug("Reloaded scripts in %.3f seconds", duration)
 
     async def turn_on_service(service: ServiceCall) -> None:
         """Call a service to turn script on."""
@@ -336,17 +342,19 @@ async def _async_process_config(
         """
         script_matches: set[int] = set()
         config_matches: set[int] = set()
+        # Script keys are unique, so a script can only match the config with its key
+        script_configs_by_key = {
+            config.key: (config_idx, config)
+            for config_idx, config in enumerate(script_configs)
+        }
 
         for script_idx, script in enumerate(scripts):
-            for config_idx, config in enumerate(script_configs):
-                if config_idx in config_matches:
-                    # Only allow a script config to match at most once
-                    continue
-                if script_matches_config(script, config):
-                    script_matches.add(script_idx)
-                    config_matches.add(config_idx)
-                    # Only allow a script to match at most once
-                    break
+            if script.unique_id not in script_configs_by_key:
+                continue
+            config_idx, config = script_configs_by_key.pop(script.unique_id)
+            if script_matches_config(script, config):
+                script_matches.add(script_idx)
+                config_matches.add(config_idx)
 
         return script_matches, config_matches
 
@@ -356,6 +364,18 @@ async def _async_process_config(
     # Find scripts and configurations which have matches
     script_matches, config_matches = find_matches(scripts, script_configs)
 
+    hass.data[DATA_RELOAD_STATISTICS] = reload_statistics = {
+        "kept": len(script_matches),
+        "removed": len(scripts) - len(script_matches),
+        "created": len(script_configs) - len(config_matches),
+    }
+    LOGGER.debug(
+        "Keeping %d unchanged scripts, removing %d and creating %d",
+        reload_statistics["kept"],
+        reload_statistics["removed"],
+        reload_statistics["created"],
+    )
+
     # Remove scripts which have changed config or no longer exist
     tasks = [
         script.async_remove()
@@ -3,6 +3,8 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from contextlib import suppress
+from copy import deepcopy
+from dataclasses import dataclass
 from typing import Any
 
 import voluptuous as vol
@@ -31,6 +33,7 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_per_platform, config_validation as cv
+from homeassistant.helpers.reload import async_forget_on_registry_update
 from homeassistant.helpers.script import (
     SCRIPT_MODE_SINGLE,
     async_validate_actions_config,
@@ -53,6 +56,8 @@ from .helpers import async_get_blueprints
 
 PACKAGE_MERGE_HINT = "dict"
 
+DATA_VALIDATED_CONFIGS = "script_validated_configs"
+
 _MINIMAL_SCRIPT_ENTITY_SCHEMA = vol.Schema(
     {
         CONF_ALIAS: cv.string,
@@ -234,17 +239,50 @@ class ScriptConfig(dict):
     validation_failed: bool = False
 
 
+@dataclass(slots=True)
+class _ValidatedConfigItem:
+    """A validated config item and the config it was validated from."""
+
+    config: Any
+    blueprint_data: dict[str, Any] | None
+    validated_config: ScriptConfig
+
+
 async def _try_async_validate_config_item(
     hass: HomeAssistant,
     object_id: str,
     config: ConfigType,
+    previous_items: dict[str, _ValidatedConfigItem],
+    validated_items: dict[str, _ValidatedConfigItem],
 ) -> ScriptConfig | None:
-    """Validate config item."""
+    """Validate config item.
+
+    The validated config of the previous run is reused if neither the config
+    item nor the blueprint it uses has changed.
+    """
+    blueprint_data = await async_get_blueprints(hass).async_get_blueprint_data(config)
+
+    if (
+        (item := previous_items.get(object_id)) is not None
+        and item.config == config
+        and item.blueprint_data == blueprint_data
+    ):
+        validated_items[object_id] = item
+        return item.validated_config
+
     try:
-        return await _async_validate_config_item(hass, object_id, config, False, True)
+        script_config = await _async_validate_config_item(
+            hass, object_id, config, False, True
+        )
     except (vol.Invalid, HomeAssistantError):
         return None
 
+    if not script_config.validation_failed:
+        validated_items[object_id] = _ValidatedConfigItem(
+            deepcopy(config), blueprint_data, script_config
+        )
+    return script_config
+
 
 async def async_validate_config_item(
     hass: HomeAssistant,
@@ -257,15 +295,24 @@ async def async_validate_config_item(
 
 async def async_validate_config(hass, config):
     """Validate config."""
+    previous_items: dict[str, _ValidatedConfigItem] = hass.data.get(
+        DATA_VALIDATED_CONFIGS, {}
+    )
+    validated_items: dict[str, _ValidatedConfigItem] = {}
     scripts = {}
     for _, p_config in config_per_platform(config, DOMAIN):
         for object_id, cfg in p_config.items():
             if object_id in scripts:
                 LOGGER.warning("Duplicate script detected with name: '%s'", object_id)
                 continue
-            cfg = await _try_async_validate_config_item(hass, object_id, cfg)
+            cfg = await _try_async_validate_config_item(
+                hass, object_id, cfg, previous_items, validated_items
+            )
             if cfg is not None:
                 scripts[object_id] = cfg
+    if DATA_VALIDATED_CONFIGS not in hass.data:
+        async_forget_on_registry_update(hass, DATA_VALIDATED_CONFIGS)
+    hass.data[DATA_VALIDATED_CONFIGS] = validated_items
 
     # Create a copy of the configuration with all config for current
     # component removed and add validated config back in.
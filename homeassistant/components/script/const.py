@@ -17,4 +17,6 @@ ENTITY_ID_FORMAT = DOMAIN + ".{}"
 
 EVENT_SCRIPT_STARTED = "script_started"
 
+DATA_RELOAD_STATISTICS = "script_reload_statistics"
+
 LOGGER = logging.getLogger(__package__)
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Iterable, MutableMapping
+from collections.abc import Callable, Iterable, Mapping, MutableMapping
+import copy
 import datetime
 import itertools
 import logging
@@ -17,6 +18,7 @@ from homeassistant.components.recorder import (
     history,
     statistics,
 )
+from homeassistant.components.recorder.db_schema import StatisticsShortTerm
 from homeassistant.components.recorder.models import (
     StatisticData,
     StatisticMetaData,
@@ -29,7 +31,7 @@ from homeassistant.const import (
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, split_entity_id
+from homeassistant.core import Event, HomeAssistant, State, split_entity_id
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import entity_sources
 from homeassistant.loader import async_suggest_report_issue
@@ -64,6 +66,11 @@ WARN_UNSUPPORTED_UNIT = "sensor_warn_unsupported_unit"
 WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
+# Statistics accumulated from the recorded states of sensors
+STATISTICS_ACCUMULATOR = "sensor_statistics_accumulator"
+SHORT_TERM_PERIOD = StatisticsShortTerm.duration.total_seconds()
+# Accumulated periods kept per sensor until they are compiled
+MAX_CLOSED_PERIODS = 12
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -373,6 +380,528 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
+class _SumState:
+    """Sum of a total or total_increasing sensor as its states are processed.
+
+    A period starts from the state, sum and last reset of the statistics
+    compiled for the previous period.
+    """
+
+    __slots__ = ("last_reset", "old_last_reset", "old_state", "new_state", "sum")
+
+    def __init__(
+        self, last_reset: str | None, state: float | None, sum_: float
+    ) -> None:
+        """Initialize the starting point of a period."""
+        self.last_reset = self.old_last_reset = last_reset
+        self.old_state = self.new_state = state
+        self.sum = sum_
+
+    @classmethod
+    def from_last_stat(cls, last_stat: Mapping[str, Any] | None) -> _SumState:
+        """Start from the last compiled statistics of a sensor."""
+        if last_stat is None:
+            return cls(None, None, 0.0)
+        # If there are no previous values and has_sum
+        # was previously false there will be no last_stat
+        # for state or sum
+        return cls(
+            _timestamp_to_isoformat_or_none(last_stat["last_reset"]),
+            last_stat.get("state"),
+            last_stat.get("sum") or 0.0,
+        )
+
+    def add(
+        self,
+        hass: HomeAssistant,
+        entity_id: str,
+        state_class: str,
+        fstate: float,
+        state: State,
+    ) -> None:
+        """Process a state of the sensor."""
+        reset = False
+        if state_class != SensorStateClass.TOTAL_INCREASING:
+            self.last_reset = _last_reset_as_utc_isoformat(
+                state.attributes.get("last_reset"), entity_id
+            )
+        if (
+            state_class != SensorStateClass.TOTAL_INCREASING
+            and self.last_reset != self.old_last_reset
+            and self.last_reset is not None
+        ):
+            if self.old_state is None:
+                _LOGGER.info(
+                    "Compiling initial sum statistics for %s, zero point set to %s",
+                    entity_id,
+                    fstate,
+                )
+            else:
+                _LOGGER.info(
+                    (
+                        "Detected new cycle for %s, last_reset set to %s (old"
+                        " last_reset %s)"
+                    ),
+                    entity_id,
+                    self.last_reset,
+                    self.old_last_reset,
+                )
+            reset = True
+        elif self.old_state is None and self.last_reset is None:
+            reset = True
+            _LOGGER.info(
+                "Compiling initial sum statistics for %s, zero point set to %s",
+                entity_id,
+                fstate,
+            )
+        elif state_class == SensorStateClass.TOTAL_INCREASING:
+            try:
+                if self.old_state is None or reset_detected(
+                    hass, entity_id, fstate, self.new_state, state
+                ):
+                    reset = True
+                    _LOGGER.info(
+                        (
+                            "Detected new cycle for %s, value dropped from %s"
+                            " to %s, triggered by state with last_updated set"
+                            " to %s"
+                        ),
+                        entity_id,
+                        self.new_state,
+                        fstate,
+                        state.last_updated.isoformat(),
+                    )
+            except HomeAssistantError:
+                return
+
+        if reset:
+            # The sensor has been reset, update the sum
+            if self.old_state is not None and self.new_state is not None:
+                self.sum += self.new_state - self.old_state
+            # ..and update the starting point
+            self.new_state = fstate
+            self.old_last_reset = self.last_reset
+            # Force a new cycle for an existing sensor to start at 0
+            if self.old_state is not None:
+                self.old_state = 0.0
+            else:
+                self.old_state = self.new_state
+        else:
+            self.new_state = fstate
+
+    def result(self) -> tuple[float, float, str | None] | None:
+        """Return the state, sum and last reset, or None without valid states."""
+        if self.new_state is None or self.old_state is None:
+            return None
+        # Update the sum with the last state
+        return (
+            self.new_state,
+            self.sum + self.new_state - self.old_state,
+            self.last_reset,
+        )
+
+    def next_period(self) -> _SumState:
+        """Return the starting point of the next period."""
+        if (result := self.result()) is None:
+            return self
+        state, sum_, last_reset = result
+        return _SumState(last_reset, state, sum_)
+
+    def matches(self, other: _SumState) -> bool:
+        """Return if two starting points are the same."""
+        if self.last_reset != other.last_reset or not math.isclose(self.sum, other.sum):
+            return False
+        if self.new_state is None or other.new_state is None:
+            return self.new_state is other.new_state
+        return math.isclose(self.new_state, other.new_state)
+
+
+def _period_start(timestamp: float) -> float:
+    """Return the start of the short term statistics period of a timestamp."""
+    return timestamp - timestamp % SHORT_TERM_PERIOD
+
+
+class _MeasurementAccumulator:
+    """Time weighted mean, min and max of a measurement sensor per period."""
+
+    __slots__ = (
+        "state_class",
+        "unit",
+        "since",
+        "last_timestamp",
+        "period_start",
+        "closed",
+        "last_fstate",
+        "fstate",
+        "fstate_start",
+        "first_start",
+        "accumulated",
+        "min",
+        "max",
+    )
+
+    def __init__(self, state_class: str, unit: str | None, timestamp: float) -> None:
+        """Initialize the accumulator at the first state of the sensor."""
+        self.state_class = state_class
+        self.unit = unit
+        # Every state recorded since this timestamp has been accumulated
+        self.since = timestamp
+        self.last_timestamp = timestamp
+        self.closed: dict[float, tuple[float, float, float] | None] = {}
+        # The value of the last state, None if it's not numeric
+        self.last_fstate: float | None = None
+        self._start_period(_period_start(timestamp))
+
+    def _start_period(self, start: float) -> None:
+        """Start a period with the last value of the sensor."""
+        self.period_start = start
+        self.accumulated = 0.0
+        self.fstate = self.min = self.max = self.last_fstate
+        self.fstate_start = self.first_start = start
+
+    def _close_period(self) -> None:
+        """Calculate the statistics of the period."""
+        result: tuple[float, float, float] | None = None
+        if (fstate := self.fstate) is not None:
+            end = self.period_start + SHORT_TERM_PERIOD
+            accumulated = self.accumulated + fstate * (end - self.fstate_start)
+            period_seconds = end - self.first_start
+            assert self.min is not None and self.max is not None
+            result = (
+                # The only state was at the end of the period, see
+                # _time_weighted_average
+                accumulated / period_seconds if period_seconds else 0.0,
+                self.min,
+                self.max,
+            )
+        self.closed[self.period_start] = result
+        if len(self.closed) > MAX_CLOSED_PERIODS:
+            del self.closed[next(iter(self.closed))]
+
+    def add(
+        self,
+        hass: HomeAssistant,
+        entity_id: str,
+        timestamp: float,
+        fstate: float | None,
+        state: State,
+    ) -> None:
+        """Accumulate a state of the sensor."""
+        if timestamp >= self.period_start + SHORT_TERM_PERIOD:
+            self._close_period()
+            self._start_period(_period_start(timestamp))
+        self.last_timestamp = timestamp
+        self.last_fstate = fstate
+        # States which are not numeric are left out, like when compiling
+        # from the history
+        if fstate is None:
+            return
+        if self.fstate is None:
+            self.first_start = timestamp
+            self.min = self.max = fstate
+        else:
+            self.accumulated += self.fstate * (timestamp - self.fstate_start)
+            assert self.min is not None and self.max is not None
+            self.min = min(self.min, fstate)
+            self.max = max(self.max, fstate)
+        self.fstate = fstate
+        self.fstate_start = timestamp
+
+    def pop(self, start: float) -> tuple[float, float, float] | None:
+        """Return the mean, min and max of a period, None if unknown."""
+        if self.period_start <= start:
+            if self.period_start < start:
+                # No states since the period before
+                self._close_period()
+                self._start_period(start)
+            self._close_period()
+            self._start_period(start + SHORT_TERM_PERIOD)
+        result = self.closed.pop(start, None)
+        for period_start in [period for period in self.closed if period < start]:
+            del self.closed[period_start]
+        # The value at the start of the period is only known if the
+        # state before it was accumulated
+        return result if start >= self.since else None
+
+
+class _TotalAccumulator:
+    """Sum of a total or total_increasing sensor per period."""
+
+    __slots__ = (
+        "state_class",
+        "unit",
+        "since",
+        "last_timestamp",
+        "period_start",
+        "closed",
+        "seed",
+        "running",
+        "pending",
+    )
+
+    def __init__(self, state_class: str, unit: str | None, timestamp: float) -> None:
+        """Initialize the accumulator at the first state of the sensor."""
+        self.state_class = state_class
+        self.unit = unit
+        # Every state recorded since this timestamp has been accumulated
+        self.since = timestamp
+        self.last_timestamp = timestamp
+        self.closed: dict[float, tuple[_SumState, _SumState]] = {}
+        # The sum starts from compiled statistics, until seeded the states
+        # of the period are kept to replay them once seeded
+        self.seed: _SumState | None = None
+        self.running: _SumState | None = None
+        self.pending: list[tuple[float, State]] | None = None
+        self._start_period(_period_start(timestamp))
+
+    def _start_period(self, start: float) -> None:
+        """Start a period from the sum of the period before."""
+        self.period_start = start
+        self.pending = []
+        if self.seed is not None:
+            self.running = copy.copy(self.seed)
+
+    def _close_period(self) -> None:
+        """Store the sum of the period."""
+        if self.seed is None or self.running is None:
+            return
+        self.closed[self.period_start] = (self.seed, self.running)
+        if len(self.closed) > MAX_CLOSED_PERIODS:
+            del self.closed[next(iter(self.closed))]
+        self.seed = self.running.next_period()
+
+    def add(
+        self,
+        hass: HomeAssistant,
+        entity_id: str,
+        timestamp: float,
+        fstate: float | None,
+        state: State,
+    ) -> None:
+        """Accumulate a state of the sensor."""
+        if timestamp >= self.period_start + SHORT_TERM_PERIOD:
+            self._close_period()
+            self._start_period(_period_start(timestamp))
+        self.last_timestamp = timestamp
+        if fstate is None:
+            return
+        if self.pending is not None:
+            self.pending.append((fstate, state))
+        if self.running is not None:
+            self.running.add(hass, entity_id, self.state_class, fstate, state)
+
+    def pop(self, start: float) -> tuple[_SumState, _SumState] | None:
+        """Return the sum at the start and end of a period, None if unknown."""
+        if self.period_start <= start:
+            if self.period_start < start:
+                # No states since the period before
+                self._close_period()
+                self._start_period(start)
+            self._close_period()
+            self._start_period(start + SHORT_TERM_PERIOD)
+        result = self.closed.pop(start, None)
+        for period_start in [period for period in self.closed if period < start]:
+            del self.closed[period_start]
+        return result
+
+    def reseed(
+        self, hass: HomeAssistant, entity_id: str, end: float, seed: _SumState
+    ) -> None:
+        """Continue from the statistics compiled for the period ending at end."""
+        if self.since > end or self.period_start != end or self.pending is None:
+            # Some states since the end of the period were not kept
+            self.seed = self.running = None
+            return
+        self.seed = seed
+        self.running = copy.copy(seed)
+        for fstate, state in self.pending:
+            self.running.add(hass, entity_id, self.state_class, fstate, state)
+
+
+class _StatisticsAccumulator:
+    """Statistics of sensors accumulated while their states are recorded.
+
+    compile_statistics uses them for the sensors which were followed
+    during the whole period, and queries the history of the other ones.
+    Only used from the recorder thread.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the accumulator."""
+        self.hass = hass
+        self.sensors: dict[str, _MeasurementAccumulator | _TotalAccumulator] = {}
+        # Sensors with states recorded out of order are followed again
+        # after the newest state which was seen
+        self.blocked: dict[str, float] = {}
+
+    def record_state(self, entity_id: str, state: State | None) -> None:
+        """Accumulate a recorded state of a sensor."""
+        if state is None or not (
+            state_class := try_parse_enum(
+                SensorStateClass, state.attributes.get(ATTR_STATE_CLASS)
+            )
+        ):
+            self.sensors.pop(entity_id, None)
+            return
+        timestamp = dt_util.utc_to_timestamp(state.last_updated)
+        accumulator = self.sensors.get(entity_id)
+        if accumulator is not None and timestamp < accumulator.last_timestamp:
+            self.blocked[entity_id] = accumulator.last_timestamp
+            del self.sensors[entity_id]
+            return
+        if (blocked := self.blocked.get(entity_id)) is not None:
+            if timestamp <= blocked:
+                return
+            del self.blocked[entity_id]
+        fstate = _float_or_none(state.state)
+        unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        if (
+            accumulator is None
+            or accumulator.state_class != state_class
+            or (fstate is not None and accumulator.unit != unit)
+        ):
+            # Changed units are converted when compiling from the history
+            accumulator_class = (
+                _MeasurementAccumulator
+                if state_class == SensorStateClass.MEASUREMENT
+                else _TotalAccumulator
+            )
+            accumulator = self.sensors[entity_id] = accumulator_class(
+                state_class, unit, timestamp
+            )
+        accumulator.add(self.hass, entity_id, timestamp, fstate, state)
+
+    def pop_period(
+        self, sensor_states: list[State], start: float
+    ) -> dict[str, tuple[str | None, Any]]:
+        """Return the unit and accumulated statistics of sensors for a period."""
+        if start % SHORT_TERM_PERIOD:
+            # States are only accumulated per aligned period
+            return {}
+        state_classes = {
+            state.entity_id: state.attributes[ATTR_STATE_CLASS]
+            for state in sensor_states
+        }
+        accumulated: dict[str, tuple[str | None, Any]] = {}
+        for entity_id, accumulator in self.sensors.items():
+            if (result := accumulator.pop(start)) is not None and state_classes.get(
+                entity_id
+            ) == accumulator.state_class:
+                accumulated[entity_id] = (accumulator.unit, result)
+        return accumulated
+
+    def reseed(
+        self, entity_id: str, end: float, unit: str | None, seed: _SumState
+    ) -> None:
+        """Continue the sum of a sensor from compiled statistics."""
+        if (
+            isinstance(accumulator := self.sensors.get(entity_id), _TotalAccumulator)
+            and accumulator.unit == unit
+        ):
+            accumulator.reseed(self.hass, entity_id, end, seed)
+
+    def end_period(self) -> None:
+        """Stop keeping states to replay after the period was compiled."""
+        for accumulator in self.sensors.values():
+            if isinstance(accumulator, _TotalAccumulator):
+                accumulator.pending = None
+
+
+def record_state_changed(hass: HomeAssistant, event: Event) -> None:
+    """Accumulate the statistics of a recorded sensor state."""
+    if (accumulator := hass.data.get(STATISTICS_ACCUMULATOR)) is None:
+        accumulator = hass.data[STATISTICS_ACCUMULATOR] = _StatisticsAccumulator(hass)
+    accumulator.record_state(event.data["entity_id"], event.data.get("new_state"))
+
+
+def _statistic_metadata(
+    entity_id: str, wanted_statistics: set[str], statistics_unit: str | None
+) -> StatisticMetaData:
+    """Return the metadata of the statistics of a sensor."""
+    return {
+        "has_mean": "mean" in wanted_statistics,
+        "has_sum": "sum" in wanted_statistics,
+        "name": None,
+        "source": RECORDER_DOMAIN,
+        "statistic_id": entity_id,
+        "unit_of_measurement": statistics_unit,
+    }
+
+
+def _compile_accumulated_statistics(
+    hass: HomeAssistant,
+    session: Session,
+    accumulated: dict[str, tuple[str | None, Any]],
+    wanted_statistics: dict[str, set[str]],
+    start: datetime.datetime,
+) -> tuple[list[StatisticResult], dict[str, tuple[int, StatisticMetaData]]]:
+    """Compile statistics from the statistics accumulated for a period.
+
+    Accumulated statistics are only used when their unit matches the
+    compiled statistics, and for sums when they start from the last
+    compiled statistics. The statistics of other sensors are removed from
+    accumulated, to compile them from the history.
+    """
+    result: list[StatisticResult] = []
+    metadatas = statistics.get_metadata_with_session(
+        get_instance(hass), session, statistic_ids=set(accumulated)
+    )
+    sum_metadatas = {
+        entity_id: metadata
+        for entity_id, metadata in metadatas.items()
+        if "sum" in wanted_statistics[entity_id]
+    }
+    last_stats = (
+        statistics.get_latest_short_term_statistics_with_session(
+            hass,
+            session,
+            set(sum_metadatas),
+            {"last_reset", "state", "sum"},
+            metadata=sum_metadatas,
+        )
+        if sum_metadatas
+        else {}
+    )
+    for entity_id, (unit, accumulated_stat) in list(accumulated.items()):
+        if (
+            (old_metadata := metadatas.get(entity_id)) is None
+            or old_metadata[1]["unit_of_measurement"] != unit
+            or (
+                entity_id in sum_metadatas
+                and not accumulated_stat[0].matches(
+                    _SumState.from_last_stat(
+                        last_stats[entity_id][0] if entity_id in last_stats else None
+                    )
+                )
+            )
+        ):
+            del accumulated[entity_id]
+            continue
+
+        stat: StatisticData = {"start": start}
+        if entity_id in sum_metadatas:
+            if (sum_result := accumulated_stat[1].result()) is None:
+                # No valid updates
+                continue
+            new_state, _sum, last_reset = sum_result
+            if last_reset is not None:
+                stat["last_reset"] = dt_util.parse_datetime(last_reset)
+            stat["sum"] = _sum
+            stat["state"] = new_state
+        else:
+            stat["mean"], stat["min"], stat["max"] = accumulated_stat
+        result.append(
+            {
+                "meta": _statistic_metadata(
+                    entity_id, wanted_statistics[entity_id], unit
+                ),
+                "stat": stat,
+            }
+        )
+
+    return result, metadatas
+
+
 def compile_statistics(  # noqa: C901
     hass: HomeAssistant,
     session: Session,
@@ -384,6 +913,19 @@ def compile_statistics(  # noqa: C901
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
+    accumulated_metadatas: dict[str, tuple[int, StatisticMetaData]] = {}
+    accumulated: dict[str, tuple[str | None, Any]] = {}
+    accumulator: _StatisticsAccumulator | None
+    if accumulator := hass.data.get(STATISTICS_ACCUMULATOR):
+        accumulated = accumulator.pop_period(sensor_states, start.timestamp())
+    if accumulated:
+        result, accumulated_metadatas = _compile_accumulated_statistics(
+            hass, session, accumulated, wanted_statistics, start
+        )
+        sensor_states = [
+            state for state in sensor_states if state.entity_id not in accumulated
+        ]
+
     # Get history between start and end
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
@@ -485,14 +1027,9 @@ def compile_statistics(  # noqa: C901
                 continue
 
         # Set meta data
-        meta: StatisticMetaData = {
-            "has_mean": "mean" in wanted_statistics[entity_id],
-            "has_sum": "sum" in wanted_statistics[entity_id],
-            "name": None,
-            "source": RECORDER_DOMAIN,
-            "statistic_id": entity_id,
-            "unit_of_measurement": statistics_unit,
-        }
+        meta = _statistic_metadata(
+            entity_id, wanted_statistics[entity_id], statistics_unit
+        )
 
         # Make calculations
         stat: StatisticData = {"start": start}
@@ -515,101 +1052,21 @@ def compile_statistics(  # noqa: C901
             stat["mean"] = _time_weighted_average(valid_float_states, start, end)
 
         if "sum" in wanted_statistics[entity_id]:
-            last_reset = old_last_reset = None
-            new_state = old_state = None
-            _sum = 0.0
-            if entity_id in last_stats:
-                # We have compiled history for this sensor before,
-                # use that as a starting point.
-                last_stat = last_stats[entity_id][0]
-                last_reset = _timestamp_to_isoformat_or_none(last_stat["last_reset"])
-                old_last_reset = last_reset
-                # If there are no previous values and has_sum
-                # was previously false there will be no last_stat
-                # for state or sum
-                new_state = old_state = last_stat.get("state")
-                _sum = last_stat.get("sum") or 0.0
-
+            sum_state = _SumState.from_last_stat(
+                last_stats[entity_id][0] if entity_id in last_stats else None
+            )
             for fstate, state in valid_float_states:
-                reset = False
-                if (
-                    state_class != SensorStateClass.TOTAL_INCREASING
-                    and (
-                        last_reset := _last_reset_as_utc_isoformat(
-                            state.attributes.get("last_reset"), entity_id
-                        )
-                    )
-                    != old_last_reset
-                    and last_reset is not None
-                ):
-                    if old_state is None:
-                        _LOGGER.info(
-                            (
-                                "Compiling initial sum statistics for %s, zero point"
-                                " set to %s"
-                            ),
-                            entity_id,
-                            fstate,
-                        )
-                    else:
-                        _LOGGER.info(
-                            (
-                                "Detected new cycle for %s, last_reset set to %s (old"
-                                " last_reset %s)"
-                            ),
-                            entity_id,
-                            last_reset,
-                            old_last_reset,
-                        )
-                    reset = True
-                elif old_state is None and last_reset is None:
-                    reset = True
-                    _LOGGER.info(
-                        "Compiling initial sum statistics for %s, zero point set to %s",
-                        entity_id,
-                        fstate,
-                    )
-                elif state_class == SensorStateClass.TOTAL_INCREASING:
-                    try:
-                        if old_state is None or reset_detected(
-                            hass, entity_id, fstate, new_state, state
-                        ):
-                            reset = True
-                            _LOGGER.info(
-                                (
-                                    "Detected new cycle for %s, value dropped from %s"
-                                    " to %s, triggered by state with last_updated set"
-                                    " to %s"
-                                ),
-                                entity_id,
-                                new_state,
-                                fstate,
-                                state.last_updated.isoformat(),
-                            )
-                    except HomeAssistantError:
-                        continue
-
-                if reset:
-                    # The sensor has been reset, update the sum
-                    if old_state is not None and new_state is not None:
-                        _sum += new_state - old_state
-                    # ..and update the starting point
-                    new_state = fstate
-                    old_last_reset = last_reset
-                    # Force a new cycle for an existing sensor to start at 0
-                    if old_state is not None:
-                        old_state = 0.0
-                    else:
-                        old_state = new_state
-                else:
-                    new_state = fstate
-
-            if new_state is None or old_state is None:
+                sum_state.add(hass, entity_id, state_class, fstate, state)
+            if accumulator is not None:
+                accumulator.reseed(
+                    entity_id, end.timestamp(), statistics_unit, sum_state.next_period()
+                )
+
+            if (sum_result := sum_state.result()) is None:
                 # No valid updates
                 continue
 
-            # Update the sum with the last state
-            _sum += new_state - old_state
+            new_state, _sum, last_reset = sum_result
             if last_reset is not None:
                 stat["last_reset"] = dt_util.parse_datetime(last_reset)
             stat["sum"] = _sum
@@ -617,7 +1074,12 @@ def compile_statistics(  # noqa: C901
 
         result.append({"meta": meta, "stat": stat})
 
-    return statistics.PlatformCompiledStatistics(result, old_metadatas)
+    if accumulator is not None:
+        accumulator.end_period()
+
+    return statistics.PlatformCompiledStatistics(
+        result, {**accumulated_metadatas, **old_metadatas}
+    )
 
 
 def list_statistic_ids(
@@ -195,6 +195,7 @@ class UpdateEntity(RestoreEntity):
     _entity_component_unrecorded_attributes = frozenset(
         {ATTR_ENTITY_PICTURE, ATTR_IN_PROGRESS, ATTR_RELEASE_SUMMARY}
     )
+    _static_properties = frozenset({"device_class", "_default_to_device_class_name"})
 
     entity_description: UpdateEntityDescription
     _attr_auto_update: bool = False
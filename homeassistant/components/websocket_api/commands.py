@@ -28,6 +28,7 @@ from homeassistant.exceptions import (
 )
 from homeassistant.helpers import config_validation as cv, entity, template
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import async_get_poll_scheduler
 from homeassistant.helpers.event import (
     EventStateChangedData,
     TrackTemplate,
@@ -42,6 +43,10 @@ from homeassistant.helpers.json import (
 )
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.typing import EventType
+from homeassistant.helpers.update_coordinator import (
+    async_get_coordinator_statistics,
+    async_get_shared_fetch_statistics,
+)
 from homeassistant.loader import (
     Integration,
     IntegrationNotFound,
@@ -88,6 +93,8 @@ def async_register_commands(
     async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_supported_features)
     async_reg(hass, handle_integration_descriptions)
+    async_reg(hass, handle_update_coordinator_statistics)
+    async_reg(hass, handle_entity_poll_statistics)
 
 
 def pong_message(iden: int) -> dict[str, Any]:
@@ -525,6 +532,34 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "update_coordinator/statistics"})
+@decorators.require_admin
+def handle_update_coordinator_statistics(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle update coordinator statistics command."""
+    connection.send_result(
+        msg["id"],
+        {
+            "coordinators": async_get_coordinator_statistics(hass),
+            "shared_fetches": async_get_shared_fetch_statistics(hass),
+        },
+    )
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "entity_platform/poll_statistics"})
+@decorators.require_admin
+def handle_entity_poll_statistics(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle entity poll statistics command."""
+    connection.send_result(
+        msg["id"], async_get_poll_scheduler(hass).async_get_statistics()
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -1310,7 +1310,13 @@ class State:
 
         self.entity_id = entity_id
         self.state = state
-        self.attributes = ReadOnlyDict(attributes or {})
+        # A ReadOnlyDict cannot change, so the attributes of another state
+        # are shared instead of copied
+        self.attributes = (
+            attributes
+            if type(attributes) is ReadOnlyDict  # noqa: E721
+            else ReadOnlyDict(attributes or {})
+        )
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
@@ -1637,6 +1643,8 @@ class StateMachine:
         """Set the state of an entity, add entity if it does not exist.
 
         Attributes is an optional dict to specify attributes of this state.
+        Passing the attributes of the current state on, rather than a copy,
+        avoids comparing them when the state does not change.
 
         If you just update the attributes and not the state, last changed will
         not be affected.
@@ -1705,7 +1713,12 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
+            # The attributes only decide if the state changed when the state
+            # itself is unchanged
+            same_attr = same_state and (
+                (old_attributes := old_state.attributes) is attributes
+                or old_attributes == attributes
+            )
             last_changed = old_state.last_changed if same_state else None
 
         if same_state and same_attr:
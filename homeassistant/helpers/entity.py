@@ -17,6 +17,7 @@ from typing import (
     Any,
     Final,
     Literal,
+    NamedTuple,
     NotRequired,
     TypedDict,
     TypeVar,
@@ -51,6 +52,7 @@ from homeassistant.exceptions import (
 )
 from homeassistant.loader import async_suggest_report_issue, bind_hass
 from homeassistant.util import ensure_unique_string, slugify
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from . import device_registry as dr, entity_registry as er
 from .device_registry import DeviceInfo, EventDeviceRegistryUpdatedData
@@ -74,6 +76,66 @@ DATA_ENTITY_SOURCE = "entity_info"
 # epsilon to make the string representation readable
 FLOAT_PRECISION = abs(int(math.floor(math.log10(abs(sys.float_info.epsilon))))) - 1
 
+# The properties each attribute written by _async_generate_attributes is
+# derived from
+_STATIC_ATTRIBUTE_PROPERTIES: Final = {
+    ATTR_UNIT_OF_MEASUREMENT: ("unit_of_measurement",),
+    ATTR_ASSUMED_STATE: ("assumed_state",),
+    ATTR_ATTRIBUTION: ("attribution",),
+    ATTR_DEVICE_CLASS: ("device_class",),
+    ATTR_ENTITY_PICTURE: ("entity_picture",),
+    ATTR_ICON: ("icon",),
+    ATTR_FRIENDLY_NAME: (
+        "name",
+        "has_entity_name",
+        "use_device_name",
+        "device_class",
+        "translation_key",
+        "_default_to_device_class_name",
+        "_friendly_name_internal",
+    ),
+    ATTR_SUPPORTED_FEATURES: ("supported_features",),
+}
+
+# The static attributes are recalculated when any of these instance
+# attributes is set to another value
+_STATIC_ATTRIBUTE_DEPENDENCIES: Final = (
+    "_attr_assumed_state",
+    "_attr_attribution",
+    "_attr_capability_attributes",
+    "_attr_device_class",
+    "_attr_entity_picture",
+    "_attr_has_entity_name",
+    "_attr_icon",
+    "_attr_name",
+    "_attr_supported_features",
+    "_attr_translation_key",
+    "_attr_unit_of_measurement",
+    "device_entry",
+    "entity_description",
+    "platform",
+    "registry_entry",
+)
+
+
+def _is_static_property(cls: type, name: str) -> bool:
+    """Return if the class defining a property lists it as static."""
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return name in klass.__dict__.get("_static_properties", ())
+    return False
+
+
+class _StaticAttributes(NamedTuple):
+    """Attributes of an entity which only change with its static properties."""
+
+    dependencies: list[Any]
+    capability_attributes: Mapping[str, Any] | None
+    attributes: dict[str, Any]
+    # All attributes of an entity which only has static attributes, shared
+    # by its states so the state machine can skip comparing them
+    frozen: ReadOnlyDict[str, Any] | None
+
 
 @callback
 def async_setup(hass: HomeAssistant) -> None:
@@ -313,6 +375,39 @@ class Entity(ABC):
 
     __remove_event: asyncio.Event | None = None
 
+    # Properties and methods defined by this class which only depend on the
+    # attributes in _STATIC_ATTRIBUTE_DEPENDENCIES. The state attributes derived
+    # from them are calculated once and cached until one of those attributes is
+    # set to another value. A class overriding one of them has to list it in its
+    # own _static_properties if the override is static as well, otherwise the
+    # attributes derived from it are calculated on every state write. Only
+    # entities added to a platform are cached. Attributes are compared when the
+    # state is written, an entity mutating one of them in place has to call
+    # async_invalidate_static_attributes.
+    _static_properties: frozenset[str] = frozenset(
+        {
+            "assumed_state",
+            "attribution",
+            "capability_attributes",
+            "device_class",
+            "entity_picture",
+            "has_entity_name",
+            "icon",
+            "name",
+            "supported_features",
+            "translation_key",
+            "unit_of_measurement",
+            "use_device_name",
+            "_default_to_device_class_name",
+            "_friendly_name_internal",
+        }
+    )
+    # Set automatically by __init_subclass__
+    __static_attribute_keys: frozenset[str] = frozenset(_STATIC_ATTRIBUTE_PROPERTIES)
+    __dynamic_attribute_keys: frozenset[str] = frozenset()
+    __static_capability_attributes = True
+    __static_attributes: _StaticAttributes | None = None
+
     # Entity Properties
     _attr_assumed_state: bool = False
     _attr_attribution: str | None = None
@@ -343,6 +438,17 @@ class Entity(ABC):
         cls.__combined_unrecorded_attributes = (
             cls._entity_component_unrecorded_attributes | cls._unrecorded_attributes
         )
+        cls.__static_attribute_keys = frozenset(
+            key
+            for key, properties in _STATIC_ATTRIBUTE_PROPERTIES.items()
+            if all(_is_static_property(cls, name) for name in properties)
+        )
+        cls.__dynamic_attribute_keys = (
+            frozenset(_STATIC_ATTRIBUTE_PROPERTIES) - cls.__static_attribute_keys
+        )
+        cls.__static_capability_attributes = _is_static_property(
+            cls, "capability_attributes"
+        )
 
     @property
     def should_poll(self) -> bool:
@@ -774,50 +880,103 @@ class Entity(ABC):
             return device_name
         return f"{device_name} {name}" if device_name else name
 
-    @callback
-    def _async_generate_attributes(self) -> tuple[str, dict[str, Any]]:
-        """Calculate state string and attribute mapping."""
+    def __async_calculate_attributes(self, keys: frozenset[str]) -> dict[str, Any]:
+        """Calculate the attributes derived from the properties of keys."""
         entry = self.registry_entry
+        attr: dict[str, Any] = {}
 
-        attr = self.capability_attributes
-        attr = dict(attr) if attr else {}
-
-        available = self.available  # only call self.available once per update cycle
-        state = self._stringify_state(available)
-        if available:
-            attr.update(self.state_attributes or {})
-            attr.update(self.extra_state_attributes or {})
-
-        if (unit_of_measurement := self.unit_of_measurement) is not None:
+        if ATTR_UNIT_OF_MEASUREMENT in keys and (
+            (unit_of_measurement := self.unit_of_measurement) is not None
+        ):
             attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
 
-        if assumed_state := self.assumed_state:
+        if ATTR_ASSUMED_STATE in keys and (assumed_state := self.assumed_state):
             attr[ATTR_ASSUMED_STATE] = assumed_state
 
-        if (attribution := self.attribution) is not None:
+        if ATTR_ATTRIBUTION in keys and (attribution := self.attribution) is not None:
             attr[ATTR_ATTRIBUTION] = attribution
 
-        if (
-            device_class := (entry and entry.device_class) or self.device_class
-        ) is not None:
+        if ATTR_DEVICE_CLASS in keys and (
+            (device_class := (entry and entry.device_class) or self.device_class)
+            is not None
+        ):
             attr[ATTR_DEVICE_CLASS] = str(device_class)
 
-        if (entity_picture := self.entity_picture) is not None:
+        if ATTR_ENTITY_PICTURE in keys and (
+            (entity_picture := self.entity_picture) is not None
+        ):
             attr[ATTR_ENTITY_PICTURE] = entity_picture
 
-        if (icon := (entry and entry.icon) or self.icon) is not None:
+        if ATTR_ICON in keys and (
+            (icon := (entry and entry.icon) or self.icon) is not None
+        ):
             attr[ATTR_ICON] = icon
 
-        if (
-            name := (entry and entry.name) or self._friendly_name_internal()
-        ) is not None:
+        if ATTR_FRIENDLY_NAME in keys and (
+            (name := (entry and entry.name) or self._friendly_name_internal())
+            is not None
+        ):
             attr[ATTR_FRIENDLY_NAME] = name
 
-        if (supported_features := self.supported_features) is not None:
+        if ATTR_SUPPORTED_FEATURES in keys and (
+            (supported_features := self.supported_features) is not None
+        ):
             attr[ATTR_SUPPORTED_FEATURES] = supported_features
 
+        return attr
+
+    @callback
+    def _async_generate_attributes(self) -> tuple[str, Mapping[str, Any]]:
+        """Calculate state string and attribute mapping."""
+        entity_dict = self.__dict__
+        dependencies = [
+            entity_dict.get(name, UNDEFINED) for name in _STATIC_ATTRIBUTE_DEPENDENCIES
+        ]
+        if (
+            static := self.__static_attributes
+        ) is None or static.dependencies != dependencies:
+            attributes = self.__async_calculate_attributes(self.__static_attribute_keys)
+            if self.__static_capability_attributes:
+                capability_attr = self.capability_attributes
+                frozen = ReadOnlyDict({**(capability_attr or {}), **attributes})
+            else:
+                capability_attr = frozen = None
+            static = _StaticAttributes(
+                dependencies, capability_attr, attributes, frozen
+            )
+            if self.platform is not None:
+                self.__static_attributes = static
+
+        available = self.available  # only call self.available once per update cycle
+        state = self._stringify_state(available)
+        if available:
+            state_attr = self.state_attributes
+            extra_attr = self.extra_state_attributes
+        else:
+            state_attr = extra_attr = None
+        dynamic_keys = self.__dynamic_attribute_keys
+
+        if static.frozen is not None and not (state_attr or extra_attr or dynamic_keys):
+            return (state, static.frozen)
+
+        if self.__static_capability_attributes:
+            capability_attr = static.capability_attributes
+        else:
+            capability_attr = self.capability_attributes
+        attr = dict(capability_attr) if capability_attr else {}
+        attr.update(state_attr or {})
+        attr.update(extra_attr or {})
+        if dynamic_keys:
+            attr.update(self.__async_calculate_attributes(dynamic_keys))
+        attr.update(static.attributes)
+
         return (state, attr)
 
+    @callback
+    def async_invalidate_static_attributes(self) -> None:
+        """Recalculate the static attributes on the next state write."""
+        self.__static_attributes = None
+
     @callback
     def _async_write_ha_state(self) -> None:
         """Write the state to the state machine."""
@@ -857,8 +1016,10 @@ class Entity(ABC):
             )
 
         # Overwrite properties that have been set in the config file.
-        if customize := hass.data.get(DATA_CUSTOMIZE):
-            attr.update(customize.get(entity_id))
+        if (customize := hass.data.get(DATA_CUSTOMIZE)) and (
+            entity_customize := customize.get(entity_id)
+        ):
+            attr = {**attr, **entity_customize}
 
         if (
             self._context_set is not None
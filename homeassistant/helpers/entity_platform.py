@@ -2,11 +2,14 @@
 from __future__ import annotations
 
 import asyncio
+from bisect import bisect_left
 from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from contextvars import ContextVar
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field
+from datetime import timedelta
 from logging import Logger, getLogger
 from typing import TYPE_CHECKING, Any, Protocol
+import zlib
 
 import voluptuous as vol
 
@@ -41,8 +44,9 @@ from . import (
     translation,
 )
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
-from .event import async_call_later, async_track_time_interval
+from .event import async_call_later
 from .issue_registry import IssueSeverity, async_create_issue
+from .singleton import singleton
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType
 
 if TYPE_CHECKING:
@@ -56,8 +60,23 @@ SLOW_ADD_MIN_TIMEOUT = 500
 
 PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
+DATA_ENTITY_POLL_SCHEDULER = "entity_poll_scheduler"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
+# The first poll of an entity is brought forward by up to this fraction of
+# its scan interval, depending on its entity id
+POLL_SPREAD = 0.5
+# Entities are polled less often after this many consecutive polls which
+# took over half of the scan interval, or which did not change their state
+SLOW_POLLS_BEFORE_BACKOFF = 3
+UNCHANGED_POLLS_BEFORE_BACKOFF = 10
+# Entities are polled at least every MAX_POLL_BACKOFF scan intervals.
+# Platforms which need every poll at their scan interval set POLL_BACKOFF
+# to False in their module
+MAX_POLL_BACKOFF = 4
+# Upper bounds in seconds of the buckets of the poll duration histograms
+POLL_DURATION_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
 _LOGGER = getLogger(__name__)
 
 
@@ -135,10 +154,9 @@ class EntityPlatform:
         self._async_unsub_polling: CALLBACK_TYPE | None = None
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
-        self._process_updates: asyncio.Lock | None = None
 
         self.parallel_updates: asyncio.Semaphore | None = None
-        self._update_in_sequence: bool = False
+        self.poll_backoff: bool = getattr(platform, "POLL_BACKOFF", True)
 
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
@@ -189,7 +207,6 @@ class EntityPlatform:
 
         if parallel_updates is not None:
             self.parallel_updates = asyncio.Semaphore(parallel_updates)
-            self._update_in_sequence = parallel_updates == 1
 
         return self.parallel_updates
 
@@ -522,19 +539,14 @@ class EntityPlatform:
             )
             raise
 
-        if (
-            (self.config_entry and self.config_entry.pref_disable_polling)
-            or self._async_unsub_polling is not None
-            or not any(entity.should_poll for entity in self.entities.values())
+        if (self.config_entry and self.config_entry.pref_disable_polling) or not any(
+            entity.should_poll for entity in self.entities.values()
         ):
             return
 
-        self._async_unsub_polling = async_track_time_interval(
-            self.hass,
-            self._update_entity_states,
-            self.scan_interval,
-            name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
-        )
+        self._async_unsub_polling = async_get_poll_scheduler(
+            self.hass
+        ).async_poll_platform(self)
 
     def _entity_id_already_exists(self, entity_id: str) -> tuple[bool, bool]:
         """Check if an entity_id already exists.
@@ -846,43 +858,213 @@ class EntityPlatform:
             self.platform_name, name, handle_service, schema, supports_response
         )
 
-    async def _update_entity_states(self, now: datetime) -> None:
-        """Update the states of all the polling entities.
 
-        To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
+@dataclass(slots=True)
+class PollStatistics:
+    """Durations of the entity polls of a platform."""
+
+    buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(POLL_DURATION_BUCKETS) + 1)
+    )
+    count: int = 0
+    total: float = 0.0
+    skipped: int = 0
+
+    def record(self, duration: float) -> None:
+        """Record the duration of a poll."""
+        self.buckets[bisect_left(POLL_DURATION_BUCKETS, duration)] += 1
+        self.count += 1
+        self.total += duration
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dict."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "skipped": self.skipped,
+            "histogram": {
+                **{
+                    str(bound): count
+                    for bound, count in zip(POLL_DURATION_BUCKETS, self.buckets)
+                },
+                "inf": self.buckets[-1],
+            },
+        }
+
+
+@dataclass(slots=True)
+class _PolledEntity:
+    """Polling state of an entity."""
+
+    platform: EntityPlatform
+    entity: Entity
+    interval: float
+    statistics: PollStatistics
+    timer: asyncio.TimerHandle | None = None
+    updating: bool = False
+    slow_polls: int = 0
+    unchanged_polls: int = 0
+
+
+class EntityPollScheduler:
+    """Poll the entities of all entity platforms.
+
+    Every entity is polled on its own timer instead of all entities of a
+    platform at once. The first poll of an entity is brought forward by a
+    phase derived from its entity id, which spreads the polls of entities
+    added at the same time over the scan interval. Entities whose polls are
+    consistently slow, or do not change their state, are polled less often
+    until their state changes again.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.statistics: dict[str, PollStatistics] = {}
+        self._platforms: dict[EntityPlatform, dict[str, _PolledEntity]] = {}
+
+    @callback
+    def async_poll_platform(self, platform: EntityPlatform) -> CALLBACK_TYPE:
+        """Poll the entities of a platform which are not polled yet.
+
+        Every entity of the platform gets a timer, also the entities which
+        do not poll right now, as entities may start polling later. Whether
+        an entity polls is checked each time its timer fires.
 
-        This method must be run in the event loop.
+        Returns a callback which stops polling the platform.
         """
-        if self._process_updates is None:
-            self._process_updates = asyncio.Lock()
-        if self._process_updates.locked():
-            self.logger.warning(
-                "Updating %s %s took longer than the scheduled update interval %s",
-                self.platform_name,
-                self.domain,
-                self.scan_interval,
+        polled = self._platforms.setdefault(platform, {})
+        statistics = self.statistics.setdefault(
+            f"{platform.domain}.{platform.platform_name}", PollStatistics()
+        )
+        interval = platform.scan_interval.total_seconds()
+        now = self.hass.loop.time()
+        for entity_id, entity in platform.entities.items():
+            if (polled_entity := polled.get(entity_id)) is not None:
+                if polled_entity.entity is entity:
+                    continue
+                # The entity was removed and added again with the same id
+                if polled_entity.timer is not None:
+                    polled_entity.timer.cancel()
+            phase = zlib.crc32(entity_id.encode()) / 2**32 * POLL_SPREAD
+            polled[entity_id] = polled_entity = _PolledEntity(
+                platform, entity, interval, statistics
+            )
+            self._async_schedule(polled_entity, now + interval * (1 - phase))
+
+        @callback
+        def async_stop_polling() -> None:
+            """Stop polling the platform."""
+            for polled_entity in self._platforms.pop(platform, {}).values():
+                if polled_entity.timer is not None:
+                    polled_entity.timer.cancel()
+
+        return async_stop_polling
+
+    @callback
+    def async_get_statistics(self) -> dict[str, dict[str, Any]]:
+        """Return the poll statistics of each platform."""
+        return {
+            platform: statistics.as_dict()
+            for platform, statistics in self.statistics.items()
+        }
+
+    @callback
+    def _async_schedule(self, polled_entity: _PolledEntity, when: float) -> None:
+        """Schedule the next poll of an entity."""
+        polled_entity.timer = self.hass.loop.call_at(
+            when, self._async_poll, polled_entity
+        )
+
+    @callback
+    def _async_poll(self, polled_entity: _PolledEntity) -> None:
+        """Poll an entity and schedule its next poll."""
+        platform = polled_entity.platform
+        entity = polled_entity.entity
+        if entity.hass is None or platform.entities.get(entity.entity_id) is not entity:
+            # The entity has been removed from the platform
+            polled = self._platforms[platform]
+            if polled.get(entity.entity_id) is polled_entity:
+                del polled[entity.entity_id]
+            return
+
+        self._async_schedule(
+            polled_entity, self.hass.loop.time() + polled_entity.interval
+        )
+        if not entity.should_poll:
+            return
+        if polled_entity.updating:
+            polled_entity.statistics.skipped += 1
+            platform.logger.warning(
+                "Updating %s took longer than the scheduled update interval %s",
+                entity.entity_id,
+                timedelta(seconds=polled_entity.interval),
             )
             return
 
-        async with self._process_updates:
-            if self._update_in_sequence or len(self.entities) <= 1:
-                # If we know we will update sequentially, we want to avoid scheduling
-                # the coroutines as tasks that will wait on the semaphore lock.
-                for entity in list(self.entities.values()):
-                    # If the entity is removed from hass during the previous
-                    # entity being updated, we need to skip updating the
-                    # entity.
-                    if entity.should_poll and entity.hass:
-                        await entity.async_update_ha_state(True)
-                return
+        polled_entity.updating = True
+        self.hass.async_create_task(
+            self._async_update(polled_entity),
+            f"EntityPlatform poll {entity.entity_id}",
+        )
 
-            if tasks := [
-                entity.async_update_ha_state(True)
-                for entity in self.entities.values()
-                if entity.should_poll
-            ]:
-                await asyncio.gather(*tasks)
+    async def _async_update(self, polled_entity: _PolledEntity) -> None:
+        """Update an entity and adjust its poll interval."""
+        entity = polled_entity.entity
+        assert entity.entity_id is not None
+        states = self.hass.states
+        old_state = states.get(entity.entity_id)
+        start = self.hass.loop.time()
+        try:
+            await entity.async_update_ha_state(True)
+        finally:
+            polled_entity.updating = False
+        duration = self.hass.loop.time() - start
+        polled_entity.statistics.record(duration)
+
+        platform = polled_entity.platform
+        if not platform.poll_backoff:
+            return
+        scan_interval = platform.scan_interval.total_seconds()
+        if duration > scan_interval / 2:
+            polled_entity.slow_polls += 1
+        else:
+            polled_entity.slow_polls = 0
+        if states.get(entity.entity_id) is old_state:
+            polled_entity.unchanged_polls += 1
+        else:
+            polled_entity.unchanged_polls = 0
+
+        interval = polled_entity.interval
+        if (
+            polled_entity.slow_polls >= SLOW_POLLS_BEFORE_BACKOFF
+            or polled_entity.unchanged_polls >= UNCHANGED_POLLS_BEFORE_BACKOFF
+        ):
+            interval = min(interval * 2, scan_interval * MAX_POLL_BACKOFF)
+            polled_entity.slow_polls = polled_entity.unchanged_polls = 0
+        elif not polled_entity.unchanged_polls and not polled_entity.slow_polls:
+            interval = scan_interval
+
+        if (
+            interval == polled_entity.interval
+            or self._platforms.get(platform, {}).get(entity.entity_id)
+            is not polled_entity
+        ):
+            return
+        platform.logger.debug(
+            "Polling %s every %s", entity.entity_id, timedelta(seconds=interval)
+        )
+        polled_entity.interval = interval
+        if polled_entity.timer is not None:
+            polled_entity.timer.cancel()
+        self._async_schedule(polled_entity, start + interval)
+
+
+@callback
+@singleton(DATA_ENTITY_POLL_SCHEDULER)
+def async_get_poll_scheduler(hass: HomeAssistant) -> EntityPollScheduler:
+    """Return the scheduler which polls the entities."""
+    return EntityPollScheduler(hass)
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
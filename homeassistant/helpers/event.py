@@ -23,6 +23,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import (
     CALLBACK_TYPE,
+    Event,
     HassJob,
     HassJobType,
     HomeAssistant,
@@ -35,6 +36,7 @@ from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 
+from .area_registry import EVENT_AREA_REGISTRY_UPDATED
 from .device_registry import (
     EVENT_DEVICE_REGISTRY_UPDATED,
     EventDeviceRegistryUpdatedData,
@@ -63,6 +65,11 @@ TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener
 TRACK_DEVICE_REGISTRY_UPDATED_CALLBACKS = "track_device_registry_updated_callbacks"
 TRACK_DEVICE_REGISTRY_UPDATED_LISTENER = "track_device_registry_updated_listener"
 
+TRACK_TIME_PATTERN_GROUPS = "track_time_pattern_groups"
+
+TEMPLATE_RENDER_CACHE = "template_render_cache"
+TEMPLATE_RENDER_CACHE_MAX_ENTRIES = 1024
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -886,6 +893,165 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+_RenderCacheKey = tuple[str, bool, bool]
+
+
+class _TemplateRenderCache:
+    """Share render results of identical templates between template trackers.
+
+    Results are keyed by template string and render mode and are only cached
+    for templates rendered without variables which depend on specific entities
+    or domains, but not on all states or the time. Templates rendered with
+    variables, such as the this variable of template entities, are always
+    rendered.
+    An entry is dropped as soon as a state it depends on according to its
+    RenderInfo changes, and all entries are dropped when the registries or
+    the core config change. The cache only listens for events while there
+    are template trackers using it.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.hits = 0
+        self.misses = 0
+        self._users = 0
+        self._entries: dict[_RenderCacheKey, RenderInfo] = {}
+        self._domains: dict[str, set[_RenderCacheKey]] = {}
+        self._entities: dict[str, set[_RenderCacheKey]] = {}
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_add_user(self) -> None:
+        """Start listening for changes when the first tracker is set up."""
+        self._users += 1
+        if self._users > 1:
+            return
+        bus = self.hass.bus
+        self._unsubs = [
+            bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_state_changed, run_immediately=True
+            ),
+            *(
+                bus.async_listen(event_type, self._async_clear, run_immediately=True)
+                for event_type in (
+                    EVENT_AREA_REGISTRY_UPDATED,
+                    EVENT_CORE_CONFIG_UPDATE,
+                    EVENT_DEVICE_REGISTRY_UPDATED,
+                    EVENT_ENTITY_REGISTRY_UPDATED,
+                )
+            ),
+        ]
+
+    @callback
+    def async_remove_user(self) -> None:
+        """Stop listening for changes when the last tracker is removed."""
+        self._users -= 1
+        if self._users:
+            return
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+        self._async_clear()
+
+    @callback
+    def async_render_to_info(
+        self,
+        template: Template,
+        variables: TemplateVarsType,
+        strict: bool = False,
+        log_fn: Callable[[int, str], None] | None = None,
+    ) -> RenderInfo:
+        """Render a template to info, sharing the result if possible."""
+        # pylint: disable=protected-access
+        if variables or log_fn or template._log_fn or not self._users:
+            # Errors and warnings are only reported when the template is rendered
+            return template.async_render_to_info(
+                variables, strict=strict, log_fn=log_fn
+            )
+
+        # A compiled template keeps the mode it was first rendered with
+        key = (
+            template.template,
+            strict or bool(template._strict),
+            bool(template._limited),
+        )
+        if (cached_info := self._entries.get(key)) is not None:
+            self.hits += 1
+            info = copy.copy(cached_info)
+            info.template = template
+            return info
+
+        self.misses += 1
+        info = template.async_render_to_info(variables, strict=strict)
+        if (
+            # Renders without concrete dependencies, for example of random or
+            # integration_entities(), could change without the cache noticing
+            (info.entities or info.domains or info.domains_lifecycle)
+            and not info.all_states
+            and not info.all_states_lifecycle
+            and not info.has_time
+            and info.exception is None
+            and isinstance(info.result(), (str, int, float, bool, type(None)))
+        ):
+            self._async_store(key, info)
+        return info
+
+    @callback
+    def _async_store(self, key: _RenderCacheKey, info: RenderInfo) -> None:
+        """Store a render result and index its dependencies."""
+        self._async_evict(key)
+        if len(self._entries) >= TEMPLATE_RENDER_CACHE_MAX_ENTRIES:
+            self._async_evict(next(iter(self._entries)))
+        self._entries[key] = info
+        for domain in (*info.domains, *info.domains_lifecycle):
+            self._domains.setdefault(domain, set()).add(key)
+        for entity_id in info.entities:
+            self._entities.setdefault(entity_id, set()).add(key)
+
+    @callback
+    def _async_evict(self, key: _RenderCacheKey) -> None:
+        """Drop a render result and its dependency index entries."""
+        if (info := self._entries.pop(key, None)) is None:
+            return
+        for index, names in (
+            (self._domains, (*info.domains, *info.domains_lifecycle)),
+            (self._entities, info.entities),
+        ):
+            for name in names:
+                if (keys := index.get(name)) is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del index[name]
+
+    @callback
+    def _async_state_changed(self, event: EventType[EventStateChangedData]) -> None:
+        """Drop results depending on the changed state."""
+        if not self._entries:
+            return
+        entity_id = event.data["entity_id"]
+        for key in (
+            *self._domains.get(split_entity_id(entity_id)[0], ()),
+            *self._entities.get(entity_id, ()),
+        ):
+            self._async_evict(key)
+
+    @callback
+    def _async_clear(self, event: Event | None = None) -> None:
+        """Drop all results."""
+        self._entries.clear()
+        self._domains.clear()
+        self._entities.clear()
+
+
+@callback
+def _async_get_template_render_cache(hass: HomeAssistant) -> _TemplateRenderCache:
+    """Return the template render cache."""
+    if (cache := hass.data.get(TEMPLATE_RENDER_CACHE)) is None:
+        cache = hass.data[TEMPLATE_RENDER_CACHE] = _TemplateRenderCache(hass)
+    return cache
+
+
 class TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -908,6 +1074,7 @@ class TrackTemplateResultInfo:
         self._last_result: dict[Template, bool | str | TemplateError] = {}
 
         self._rate_limit = KeyedRateLimit(hass)
+        self._render_cache = _async_get_template_render_cache(hass)
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
@@ -924,13 +1091,14 @@ class TrackTemplateResultInfo:
         """Activation of template tracking."""
         block_render = False
         super_template = self._track_templates[0] if self._has_super_template else None
+        self._render_cache.async_add_user()
 
         # Render the super template first
         if super_template is not None:
             template = super_template.template
             variables = super_template.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
+            self._info[template] = info = self._render_cache.async_render_to_info(
+                template, variables, strict=strict, log_fn=log_fn
             )
 
             # If the super template did not render to True, don't update other templates
@@ -950,8 +1118,8 @@ class TrackTemplateResultInfo:
                 continue
             template = track_template_.template
             variables = track_template_.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
+            self._info[template] = info = self._render_cache.async_render_to_info(
+                template, variables, strict=strict, log_fn=log_fn
             )
 
             if info.exception:
@@ -1023,6 +1191,7 @@ class TrackTemplateResultInfo:
         assert self._track_state_changes
         self._track_state_changes.async_remove()
         self._rate_limit.async_remove()
+        self._render_cache.async_remove_user()
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
 
@@ -1075,8 +1244,8 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
+        self._info[template] = info = self._render_cache.async_render_to_info(
+            template, track_template_.variables
         )
 
         try:
@@ -1646,6 +1815,115 @@ time_tracker_utcnow = dt_util.utcnow
 time_tracker_timestamp = time.time
 
 
+class _TimePatternGroup:
+    """Listeners of the same time pattern sharing a single timer.
+
+    The next matching time is calculated once for all the listeners of the
+    group, which are run from the same timer. The microsecond the timer
+    fires at is picked randomly per group to keep spreading patterns.
+    """
+
+    __slots__ = (
+        "hass",
+        "key",
+        "local",
+        "matching_seconds",
+        "matching_minutes",
+        "matching_hours",
+        "microsecond",
+        "jobs",
+        "_cancel_timer",
+        "_timer_job",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: tuple[Any, ...],
+        matching_seconds: list[int],
+        matching_minutes: list[int],
+        matching_hours: list[int],
+        local: bool,
+    ) -> None:
+        """Initialize the group."""
+        self.hass = hass
+        self.key = key
+        self.local = local
+        self.matching_seconds = matching_seconds
+        self.matching_minutes = matching_minutes
+        self.matching_hours = matching_hours
+        # Avoid aligning all time trackers to the same fraction of a second
+        # since it can create a thundering herd problem
+        # https://github.com/home-assistant/core/issues/82231
+        self.microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
+        self.jobs: dict[CALLBACK_TYPE, HassJob[[datetime], Any]] = {}
+        self._cancel_timer: CALLBACK_TYPE | None = None
+        self._timer_job = HassJob(
+            self._async_fire,
+            f"time change listener {key}",
+            job_type=HassJobType.Callback,
+        )
+
+    def _calculate_next(self, now: datetime) -> datetime:
+        """Calculate the next time the pattern matches."""
+        localized_now = dt_util.as_local(now) if self.local else now
+        return dt_util.find_next_time_expression_time(
+            localized_now,
+            self.matching_seconds,
+            self.matching_minutes,
+            self.matching_hours,
+        ).replace(microsecond=self.microsecond)
+
+    @callback
+    def async_add(self, job: HassJob[[datetime], Any]) -> CALLBACK_TYPE:
+        """Add a listener to the group."""
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener from the group."""
+            if self.jobs.pop(remove_listener, None) is not None and not self.jobs:
+                self._async_stop()
+
+        self.jobs[remove_listener] = job
+        if self._cancel_timer is None:
+            self._cancel_timer = async_track_point_in_utc_time(
+                self.hass, self._timer_job, self._calculate_next(dt_util.utcnow())
+            )
+        return remove_listener
+
+    @callback
+    def _async_stop(self) -> None:
+        """Stop the timer once the group has no listeners left."""
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
+        self.hass.data[TRACK_TIME_PATTERN_GROUPS].pop(self.key, None)
+
+    @callback
+    def _async_fire(self, _: datetime) -> None:
+        """Run the listeners and schedule the next match."""
+        now = time_tracker_utcnow()
+        self._cancel_timer = async_track_point_in_utc_time(
+            self.hass,
+            self._timer_job,
+            self._calculate_next(now + timedelta(seconds=1)),
+        )
+        fire_time = dt_util.as_local(now) if self.local else now
+        jobs = self.jobs
+        for remove_listener, job in list(jobs.items()):
+            # A listener may have been removed by a listener run before it
+            if remove_listener not in jobs:
+                continue
+            try:
+                self.hass.async_run_hass_job(job, fire_time)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error while running time change listener %s for %s",
+                    job,
+                    self.key,
+                )
+
+
 @callback
 @bind_hass
 def async_track_utc_time_change(
@@ -1674,53 +1952,22 @@ def async_track_utc_time_change(
     matching_seconds = dt_util.parse_time_expression(second, 0, 59)
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
-    # Avoid aligning all time trackers to the same fraction of a second
-    # since it can create a thundering herd problem
-    # https://github.com/home-assistant/core/issues/82231
-    microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
-
-    def calculate_next(now: datetime) -> datetime:
-        """Calculate and set the next time the trigger should fire."""
-        localized_now = dt_util.as_local(now) if local else now
-        return dt_util.find_next_time_expression_time(
-            localized_now, matching_seconds, matching_minutes, matching_hours
-        ).replace(microsecond=microsecond)
-
-    time_listener: CALLBACK_TYPE | None = None
-    pattern_time_change_listener_job: HassJob[[datetime], Any] | None = None
 
-    @callback
-    def pattern_time_change_listener(_: datetime) -> None:
-        """Listen for matching time_changed events."""
-        nonlocal time_listener
-        nonlocal pattern_time_change_listener_job
-
-        now = time_tracker_utcnow()
-        hass.async_run_hass_job(job, dt_util.as_local(now) if local else now)
-        assert pattern_time_change_listener_job is not None
-
-        time_listener = async_track_point_in_utc_time(
-            hass,
-            pattern_time_change_listener_job,
-            calculate_next(now + timedelta(seconds=1)),
-        )
-
-    pattern_time_change_listener_job = HassJob(
-        pattern_time_change_listener,
-        f"time change listener {hour}:{minute}:{second} {action}",
-        job_type=HassJobType.Callback,
+    # Listeners of the same pattern share a timer
+    key = (
+        tuple(matching_seconds),
+        tuple(matching_minutes),
+        tuple(matching_hours),
+        local,
     )
-    time_listener = async_track_point_in_utc_time(
-        hass, pattern_time_change_listener_job, calculate_next(dt_util.utcnow())
+    groups: dict[tuple[Any, ...], _TimePatternGroup] = hass.data.setdefault(
+        TRACK_TIME_PATTERN_GROUPS, {}
     )
-
-    @callback
-    def unsub_pattern_time_change_listener() -> None:
-        """Cancel the time listener."""
-        assert time_listener is not None
-        time_listener()
-
-    return unsub_pattern_time_change_listener
+    if (group := groups.get(key)) is None:
+        group = groups[key] = _TimePatternGroup(
+            hass, key, matching_seconds, matching_minutes, matching_hours, local
+        )
+    return group.async_add(job)
 
 
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
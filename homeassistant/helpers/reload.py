@@ -2,18 +2,18 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Iterable
+from collections.abc import Awaitable, Callable, Iterable
 import logging
 from typing import Any
 
 from homeassistant import config as conf_util
 from homeassistant.const import SERVICE_RELOAD
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
 
-from . import config_per_platform
+from . import config_per_platform, device_registry as dr, entity_registry as er
 from .entity import Entity
 from .entity_component import EntityComponent
 from .entity_platform import EntityPlatform, async_get_platforms
@@ -187,3 +187,46 @@ def setup_reload_service(
         async_setup_reload_service(hass, domain, platforms),
         hass.loop,
     ).result()
+
+
+@callback
+def async_forget_on_registry_update(hass: HomeAssistant, data_key: str) -> None:
+    """Reset hass.data[data_key] when the entity or device registry changes.
+
+    Intended for caches of validated configs which are reused on reload.
+    Validation of device triggers, conditions and actions and of entity
+    registry ids depends on the registries, so such configs can't be reused
+    once they changed.
+    """
+
+    @callback
+    def _async_registry_changed_filter(event: Event) -> bool:
+        # Entries which didn't exist can't have been used by a valid config
+        return bool(event.data["action"] != "create")
+
+    @callback
+    def _async_registry_changed(event: Event) -> None:
+        hass.data[data_key] = {}
+
+    for event_type in (
+        er.EVENT_ENTITY_REGISTRY_UPDATED,
+        dr.EVENT_DEVICE_REGISTRY_UPDATED,
+    ):
+        hass.bus.async_listen(
+            event_type,
+            _async_registry_changed,
+            event_filter=_async_registry_changed_filter,
+            run_immediately=True,
+        )
+
+
+def reload_statistics_info(
+    data_key: str,
+) -> Callable[[HomeAssistant], Awaitable[dict[str, Any]]]:
+    """Return a system health info callback for the statistics in data_key."""
+
+    async def _reload_statistics_info(hass: HomeAssistant) -> dict[str, Any]:
+        """Get the statistics of the last reload."""
+        return dict(hass.data.get(data_key, {}))
+
+    return _reload_statistics_info
@@ -3,13 +3,17 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Generator
+from collections import deque
+from collections.abc import Awaitable, Callable, Coroutine, Generator, Hashable
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import logging
+import math
 from random import randint
 from time import monotonic
 from typing import Any, Generic, Protocol, TypeVar
 import urllib.error
+from weakref import WeakSet
 
 import aiohttp
 import requests
@@ -37,6 +41,14 @@ from .debounce import Debouncer
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
 REQUEST_REFRESH_DEFAULT_IMMEDIATE = True
 
+DATA_COORDINATORS = "update_coordinators"
+DATA_SHARED_FETCHES = "update_coordinator_shared_fetches"
+# Number of recent refresh durations kept to compute their percentiles
+REFRESH_DURATIONS_KEPT = 100
+# Coordinators sharing a fetch key reuse data fetched by another coordinator
+# if the fetch started less than this many seconds ago
+SHARED_FETCH_WINDOW = 1.0
+
 _DataT = TypeVar("_DataT")
 _BaseDataUpdateCoordinatorT = TypeVar(
     "_BaseDataUpdateCoordinatorT", bound="BaseDataUpdateCoordinatorProtocol"
@@ -50,6 +62,111 @@ class UpdateFailed(Exception):
     """Raised when an update has failed."""
 
 
+def _percentile(values: list[float], fraction: float) -> float | None:
+    """Return the nearest-rank percentile of sorted values."""
+    if not values:
+        return None
+    return values[max(math.ceil(fraction * len(values)) - 1, 0)]
+
+
+@dataclass(slots=True)
+class CoordinatorStatistics:
+    """Refresh statistics of a coordinator."""
+
+    durations: deque[float] = field(
+        default_factory=lambda: deque(maxlen=REFRESH_DURATIONS_KEPT)
+    )
+    refreshes: int = 0
+    failures: int = 0
+    skipped: int = 0
+    total_duration: float = 0.0
+    last_success: float | None = None
+
+    def record_refresh(self, duration: float, success: bool) -> None:
+        """Record a refresh."""
+        self.durations.append(duration)
+        self.refreshes += 1
+        self.total_duration += duration
+        if success:
+            self.last_success = monotonic()
+        else:
+            self.failures += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dict."""
+        durations = sorted(self.durations)
+        return {
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "skipped": self.skipped,
+            "total_duration": self.total_duration,
+            "duration": {
+                "p50": _percentile(durations, 0.5),
+                "p90": _percentile(durations, 0.9),
+                "p99": _percentile(durations, 0.99),
+                "max": durations[-1] if durations else None,
+            },
+            "data_age": None
+            if self.last_success is None
+            else monotonic() - self.last_success,
+        }
+
+
+@callback
+def async_get_coordinator_statistics(hass: HomeAssistant) -> list[dict[str, Any]]:
+    """Return the refresh statistics of the coordinators."""
+    coordinators: WeakSet[DataUpdateCoordinator[Any]] = hass.data.get(
+        DATA_COORDINATORS, WeakSet()
+    )
+    return [
+        {
+            "name": coordinator.name,
+            "domain": entry.domain if (entry := coordinator.config_entry) else None,
+            "entry_id": entry.entry_id if entry else None,
+            "update_interval": coordinator.update_interval.total_seconds()
+            if coordinator.update_interval
+            else None,
+            **coordinator.statistics.as_dict(),
+        }
+        for coordinator in list(coordinators)
+    ]
+
+
+@dataclass(slots=True)
+class _SharedFetch:
+    """Fetches shared by the coordinators with the same fetch key."""
+
+    microsecond: float
+    coordinators: WeakSet[DataUpdateCoordinator[Any]] = field(default_factory=WeakSet)
+    future: asyncio.Future[Any] | None = None
+    followers: list[DataUpdateCoordinator[Any]] = field(default_factory=list)
+    data: Any = None
+    started: float | None = None
+    fetches: int = 0
+    deduplicated: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the statistics of the shared fetches."""
+        return {
+            "coordinators": len(self.coordinators),
+            "fetches": self.fetches,
+            "deduplicated": self.deduplicated,
+        }
+
+
+@callback
+def async_get_shared_fetch_statistics(hass: HomeAssistant) -> dict[str, dict[str, int]]:
+    """Return the statistics of the fetches shared between coordinators."""
+    shared_fetches: dict[Hashable, _SharedFetch] = hass.data.get(
+        DATA_SHARED_FETCHES, {}
+    )
+    return {
+        str(key): shared.as_dict()
+        for key, shared in shared_fetches.items()
+        if shared.coordinators
+    }
+
+
 class BaseDataUpdateCoordinatorProtocol(Protocol):
     """Base protocol type for DataUpdateCoordinator."""
 
@@ -66,6 +183,13 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     Setting :attr:`always_update` to ``False`` will cause coordinator to only
     callback listeners when data has changed. This requires that the data
     implements ``__eq__`` or uses a python object that already does.
+
+    Coordinators created with the same ``fetch_key``, for example one per
+    config entry of the same cloud account, share their fetches: a refresh
+    joins a fetch in progress, or reuses data fetched less than
+    SHARED_FETCH_WINDOW seconds ago, and fetched data is passed on to the
+    other coordinators, which postpone their next scheduled refresh. Their
+    update methods must therefore return interchangeable data.
     """
 
     def __init__(
@@ -78,6 +202,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         update_method: Callable[[], Awaitable[_DataT]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        fetch_key: Hashable | None = None,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -88,6 +213,9 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._shutdown_requested = False
         self.config_entry = config_entries.current_entry.get()
         self.always_update = always_update
+        self.fetch_key = fetch_key
+        self.statistics = CoordinatorStatistics()
+        hass.data.setdefault(DATA_COORDINATORS, WeakSet()).add(self)
 
         # It's None before the first successful update.
         # Components should call async_config_entry_first_refresh
@@ -102,6 +230,25 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
             randint(event.RANDOM_MICROSECOND_MIN, event.RANDOM_MICROSECOND_MAX)
             / 10**6
         )
+        self._shared_fetch: _SharedFetch | None = None
+        if fetch_key is not None:
+            shared_fetches: dict[Hashable, _SharedFetch] = hass.data.setdefault(
+                DATA_SHARED_FETCHES, {}
+            )
+            # Forget the fetches of coordinators which were garbage collected
+            # without being shut down
+            for key in [
+                key for key, shared in shared_fetches.items() if not shared.coordinators
+            ]:
+                del shared_fetches[key]
+            if (shared_fetch := shared_fetches.get(fetch_key)) is None:
+                shared_fetch = shared_fetches[fetch_key] = _SharedFetch(
+                    self._microsecond
+                )
+            shared_fetch.coordinators.add(self)
+            # Refreshes of coordinators sharing fetches are scheduled together
+            self._microsecond = shared_fetch.microsecond
+            self._shared_fetch = shared_fetch
 
         self._listeners: dict[CALLBACK_TYPE, tuple[CALLBACK_TYPE, object | None]] = {}
         job_name = "DataUpdateCoordinator"
@@ -185,6 +332,17 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     async def async_shutdown(self) -> None:
         """Cancel any scheduled call, and ignore new runs."""
         self._shutdown_requested = True
+        self.hass.data[DATA_COORDINATORS].discard(self)
+        if (shared_fetch := self._shared_fetch) is not None:
+            shared_fetch.coordinators.discard(self)
+            shared_fetches: dict[Hashable, _SharedFetch] = self.hass.data[
+                DATA_SHARED_FETCHES
+            ]
+            if (
+                not shared_fetch.coordinators
+                and shared_fetches.get(self.fetch_key) is shared_fetch
+            ):
+                del shared_fetches[self.fetch_key]
         self._async_unsub_refresh()
         self._async_unsub_shutdown()
         await self._debounced_refresh.async_shutdown()
@@ -256,6 +414,75 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
             raise NotImplementedError("Update method not implemented")
         return await self.update_method()
 
+    async def _async_fetch_data(self) -> _DataT:
+        """Fetch the data, sharing the fetch with coordinators of the same key."""
+        if (shared := self._shared_fetch) is None:
+            return await self._async_update_data()
+
+        if (future := shared.future) is not None:
+            shared.deduplicated += 1
+            shared.followers.append(self)
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+            # The coordinator which started the fetch was cancelled
+            return await self._async_update_data()
+
+        now = self.hass.loop.time()
+        if shared.started is not None and now - shared.started < SHARED_FETCH_WINDOW:
+            shared.deduplicated += 1
+            return shared.data  # type: ignore[no-any-return]
+
+        shared.future = future = self.hass.loop.create_future()
+        shared.followers = [self]
+        shared.fetches += 1
+        try:
+            data = await self._async_update_data()
+        except Exception as err:
+            future.set_exception(err)
+            # The exception is raised here, it does not need to be retrieved
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            shared.future = None
+
+        future.set_result(data)
+        shared.data = data
+        shared.started = now
+        for coordinator in list(shared.coordinators):
+            if coordinator not in shared.followers:
+                coordinator._async_set_shared_data(data)
+        return data
+
+    @callback
+    def _async_set_shared_data(self, data: _DataT) -> None:
+        """Set data fetched by a coordinator with the same fetch key."""
+        if self._shutdown_requested:
+            return
+
+        previous_update_success = self.last_update_success
+        previous_data = self.data
+        self.data = data
+        self.last_update_success = True
+        self.statistics.last_success = monotonic()
+
+        if self._listeners:
+            self._schedule_refresh()
+
+        if (
+            self.always_update
+            or not previous_update_success
+            or previous_data != self.data
+        ):
+            self.async_update_listeners()
+        else:
+            self.statistics.skipped += 1
+
     async def async_config_entry_first_refresh(self) -> None:
         """Refresh data for the first time when a config entry is setup.
 
@@ -290,15 +517,15 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if self._shutdown_requested or scheduled and self.hass.is_stopping:
             return
 
-        if log_timing := self.logger.isEnabledFor(logging.DEBUG):
-            start = monotonic()
+        log_timing = self.logger.isEnabledFor(logging.DEBUG)
+        start = monotonic()
 
         auth_failed = False
         previous_update_success = self.last_update_success
         previous_data = self.data
 
         try:
-            self.data = await self._async_update_data()
+            self.data = await self._async_fetch_data()
 
         except (asyncio.TimeoutError, requests.exceptions.Timeout) as err:
             self.last_exception = err
@@ -379,11 +606,13 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
                 self.logger.info("Fetching %s data recovered", self.name)
 
         finally:
+            duration = monotonic() - start
+            self.statistics.record_refresh(duration, self.last_update_success)
             if log_timing:
                 self.logger.debug(
                     "Finished fetching %s data in %.3f seconds (success: %s)",
                     self.name,
-                    monotonic() - start,
+                    duration,
                     self.last_update_success,
                 )
             if not auth_failed and self._listeners and not self.hass.is_stopping:
@@ -398,6 +627,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
             or previous_data != self.data
         ):
             self.async_update_listeners()
+        else:
+            self.statistics.skipped += 1
 
     @callback
     def async_set_update_error(self, err: Exception) -> None:
@@ -416,6 +647,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
 
         self.data = data
         self.last_update_success = True
+        self.statistics.last_success = monotonic()
         self.logger.debug(
             "Manually updated %s data",
             self.name,
@@ -449,6 +681,13 @@ class TimestampDataUpdateCoordinator(DataUpdateCoordinator[_DataT]):
         if self.last_update_success:
             self.last_update_success_time = utcnow()
 
+    @callback
+    def _async_set_shared_data(self, data: _DataT) -> None:
+        """Set data fetched by a coordinator with the same fetch key."""
+        super()._async_set_shared_data(data)
+        if not self._shutdown_requested:
+            self.last_update_success_time = utcnow()
+
 
 class BaseCoordinatorEntity(entity.Entity, Generic[_BaseDataUpdateCoordinatorT]):
     """Base class for all Coordinator entities."""
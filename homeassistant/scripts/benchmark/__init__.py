@@ -357,3 +357,268 @@ def _create_state_changed_event_from_old_new(
     from homeassistant.components import logbook
 
     return logbook.LazyEventPartialState(row, {})
+
+
+@benchmark
+async def reduce_statistics_per_month(hass):
+    """Reduce three years of hourly statistics of 40 statistic_ids to months."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import statistics
+
+    start_ts = 1577836800.0  # 2020-01-01 00:00 UTC
+    stats = {
+        f"sensor.energy_{idx}": [
+            {
+                "start": start_ts + hour * 3600,
+                "end": start_ts + (hour + 1) * 3600,
+                "mean": float(hour % 24),
+                "min": float(hour % 24) - 1,
+                "max": float(hour % 24) + 1,
+                "last_reset": None,
+                "state": float(hour),
+                "sum": float(hour),
+            }
+            for hour in range(3 * 365 * 24)
+        ]
+        for idx in range(40)
+    }
+    types = {"last_reset", "max", "mean", "min", "state", "sum"}
+
+    start = timer()
+    # pylint: disable-next=protected-access
+    statistics._reduce_statistics_per_month(stats, types)
+    return timer() - start
+
+
+@benchmark
+async def prometheus_scrape(hass):
+    """Scrape the metrics of 6000 sensors, changing 100 states between scrapes."""
+    # pylint: disable-next=import-outside-toplevel
+    import prometheus_client
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import prometheus
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.entity_values import EntityValues
+
+    metrics = prometheus.PrometheusMetrics(
+        prometheus_client,
+        lambda entity_id: True,
+        "homeassistant",
+        "°C",
+        EntityValues({}, {}, {}),
+        None,
+        None,
+    )
+
+    def set_power(idx, value):
+        hass.states.async_set(
+            f"sensor.power_{idx}",
+            str(value),
+            {"unit_of_measurement": "W", "friendly_name": f"Power {idx}"},
+        )
+        metrics.handle_state(hass.states.get(f"sensor.power_{idx}"))
+
+    for idx in range(6000):
+        set_power(idx, idx)
+    metrics.render()
+
+    elapsed = 0.0
+    for scrape in range(10):
+        for idx in range(scrape * 100, (scrape + 1) * 100):
+            set_power(idx, idx + 1)
+        start = timer()
+        metrics.render()
+        elapsed += timer() - start
+    return elapsed
+
+
+@benchmark
+async def influxdb_write(hass):
+    """Write 20000 state changes to a local stand-in of the InfluxDB write API."""
+    # pylint: disable=import-outside-toplevel
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    import threading
+
+    from homeassistant.components import influxdb
+
+    # pylint: enable=import-outside-toplevel
+
+    class WriteHandler(BaseHTTPRequestHandler):
+        """Accept every write."""
+
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):  # pylint: disable=invalid-name
+            """Consume the written lines."""
+            self.rfile.read(int(self.headers["Content-Length"]))
+            self.send_response(204)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            """Do not log requests."""
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), WriteHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    conf = influxdb.CONFIG_SCHEMA(
+        {"influxdb": {"host": "127.0.0.1", "port": server.server_address[1]}}
+    )["influxdb"]
+    influx = influxdb.get_influx_connection(conf)
+    instance = await hass.async_add_executor_job(
+        influxdb.InfluxThread, hass, influx, influxdb._generate_event_to_line(conf), 0
+    )
+    instance.start()
+
+    start = timer()
+    for idx in range(20000):
+        hass.states.async_set(
+            f"sensor.power_{idx % 500}",
+            str(idx),
+            {"unit_of_measurement": "W", "friendly_name": f"Power {idx % 500}"},
+        )
+    await hass.async_add_executor_job(instance.block_till_done)
+    elapsed = timer() - start
+
+    instance.queue.put(None)
+    await hass.async_add_executor_job(instance.join)
+    influx.close()
+    server.shutdown()
+    return elapsed
+
+
+@benchmark
+async def sensor_write_ha_state(hass):
+    """Write the state of 100 temperature sensors 2000 times each."""
+    # pylint: disable=import-outside-toplevel
+    from datetime import timedelta
+
+    from homeassistant.components.sensor import (
+        SensorDeviceClass,
+        SensorEntity,
+        SensorStateClass,
+    )
+    from homeassistant.helpers import (
+        device_registry as dr,
+        entity,
+        entity_registry as er,
+    )
+    from homeassistant.helpers.entity_platform import EntityPlatform
+
+    # pylint: enable=import-outside-toplevel
+
+    class TemperatureSensor(SensorEntity):
+        """Temperature sensor of a device."""
+
+        _attr_has_entity_name = True
+        _attr_name = "Temperature"
+        _attr_device_class = SensorDeviceClass.TEMPERATURE
+        _attr_state_class = SensorStateClass.MEASUREMENT
+        _attr_native_unit_of_measurement = "°C"
+        _attr_should_poll = False
+
+    await dr.async_load(hass)
+    await er.async_load(hass)
+    entity.async_setup(hass)
+    platform = EntityPlatform(
+        hass=hass,
+        logger=logging.getLogger(__name__),
+        domain="sensor",
+        platform_name="benchmark",
+        platform=None,
+        scan_interval=timedelta(seconds=30),
+        entity_namespace=None,
+    )
+    sensors = [TemperatureSensor() for _ in range(100)]
+    await platform.async_add_entities(sensors)
+    for idx, sensor in enumerate(sensors):
+        sensor.device_entry = dr.DeviceEntry(name=f"Device {idx}")
+
+    start = timer()
+    for value in range(2000):
+        for sensor in sensors:
+            sensor._attr_native_value = value
+            sensor.async_write_ha_state()
+    return timer() - start
+
+
+@benchmark
+async def state_set_large_attributes(hass):
+    """Set the state of 100 media players with large attributes 1000 times each."""
+    attributes = [
+        {
+            "friendly_name": f"Media player {idx}",
+            "source_list": [f"Source {source}" for source in range(50)],
+            "sound_mode_list": [f"Sound mode {mode}" for mode in range(20)],
+            "group_members": [f"media_player.member_{member}" for member in range(10)],
+            "supported_features": 0xFFFFF,
+            **{f"attribute_{attr}": attr for attr in range(20)},
+        }
+        for idx in range(100)
+    ]
+    for idx in range(100):
+        hass.states.async_set(f"media_player.player_{idx}", "playing", attributes[idx])
+
+    start = timer()
+    for value in range(1000):
+        state = "paused" if value // 10 % 2 else "playing"
+        for idx in range(100):
+            entity_id = f"media_player.player_{idx}"
+            if value % 10:
+                # Unchanged state with the attributes of the current state
+                hass.states.async_set(
+                    entity_id, state, hass.states.get(entity_id).attributes
+                )
+            else:
+                hass.states.async_set(entity_id, state, attributes[idx])
+    return timer() - start
+
+
+@benchmark
+async def static_file_requests(hass):
+    """Load 20 static files from 20 clients 10 times."""
+    # pylint: disable=import-outside-toplevel
+    from pathlib import Path
+    import tempfile
+
+    from aiohttp import ClientSession, TCPConnector, web
+
+    from homeassistant.components.http.const import KEY_HASS
+    from homeassistant.components.http.static import AssetCache, CachingStaticResource
+
+    # pylint: enable=import-outside-toplevel
+
+    with tempfile.TemporaryDirectory() as directory:
+        for idx in range(20):
+            Path(directory, f"chunk.{idx}.js").write_text(
+                "".join(f"export const value{line} = {line};\n" for line in range(5000))
+            )
+        app = web.Application()
+        app[KEY_HASS] = hass
+        app.router.register_resource(
+            CachingStaticResource("/static", directory, asset_cache=AssetCache())
+        )
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+
+        async def load_frontend(session):
+            """Request every file once."""
+            for idx in range(20):
+                async with session.get(
+                    f"http://127.0.0.1:{port}/static/chunk.{idx}.js"
+                ) as resp:
+                    await resp.read()
+
+        async with ClientSession(
+            connector=TCPConnector(limit=20), auto_decompress=False
+        ) as session:
+            start = timer()
+            for _ in range(10):
+                await asyncio.gather(*(load_frontend(session) for _ in range(20)))
+            elapsed = timer() - start
+        await runner.cleanup()
+    return elapsed
@@ -0,0 +1,278 @@
+"""Cache of constructed YAML trees, invalidated through their include graph."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import io
+import os
+import pickle
+import threading
+import time
+from typing import Any, NamedTuple
+
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# Files modified less than this many seconds ago are not cached, a second
+# write within the same mtime tick would otherwise go unnoticed.
+RACY_WINDOW = 2.0
+
+_FileSignature = tuple[int, int, int]
+
+
+def _file_signature(path: str) -> _FileSignature | None:
+    """Return the signature of a file or directory, None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+@dataclass(slots=True)
+class _Dependencies:
+    """Files and environment variables a constructed tree depends on."""
+
+    files: dict[str, _FileSignature | None] = field(default_factory=dict)
+    env: dict[str, str | None] = field(default_factory=dict)
+
+    def update(self, other: _Dependencies) -> None:
+        """Merge the dependencies of a nested load."""
+        self.files.update(other.files)
+        self.env.update(other.env)
+
+    def is_current(self) -> bool:
+        """Return if none of the dependencies changed."""
+        return all(
+            _file_signature(path) == signature for path, signature in self.files.items()
+        ) and all(os.environ.get(name) == value for name, value in self.env.items())
+
+    def is_stable(self) -> bool:
+        """Return if none of the files was modified within the racy window."""
+        cutoff = (time.time() - RACY_WINDOW) * 1e9
+        return all(
+            signature is None or signature[0] < cutoff
+            for signature in self.files.values()
+        )
+
+
+_CacheKey = tuple[str, str | None]
+
+
+class _MissingNestedEntry(Exception):
+    """A nested tree referenced by an entry is no longer cached."""
+
+
+@dataclass(slots=True)
+class _Load:
+    """A load in progress on the current thread."""
+
+    dependencies: _Dependencies
+    # Cached trees of nested loads by id, pickled as a reference to their entry
+    nested: dict[int, tuple[_CacheKey, int, Any]] = field(default_factory=dict)
+
+
+class _CacheEntry(NamedTuple):
+    """A pickled YAML tree and what it was constructed from."""
+
+    data: bytes
+    dependencies: _Dependencies
+    generation: int
+    has_nested: bool
+
+
+class _Pickler(pickle.Pickler):
+    """Pickle a tree, referencing the trees of cached nested loads."""
+
+    def __init__(self, file: io.BytesIO, nested: dict[int, Any]) -> None:
+        """Initialize the pickler."""
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self._nested = nested
+
+    def persistent_id(
+        self, obj: Any
+    ) -> tuple[_CacheKey, int, dict[str, Any] | None] | None:
+        """Return the reference of the trees of cached nested loads.
+
+        The attributes added to the tree by the including file, such as
+        its line annotation, are part of the reference.
+        """
+        if (nested := self._nested.get(id(obj))) is None or nested[2] is not obj:
+            return None
+        key, generation, _ = nested
+        return (key, generation, dict(vars(obj)) if hasattr(obj, "__dict__") else None)
+
+
+class _Unpickler(pickle.Unpickler):
+    """Unpickle a tree, loading the referenced trees from the cache."""
+
+    def __init__(self, data: bytes, cache: YamlCache) -> None:
+        """Initialize the unpickler."""
+        super().__init__(io.BytesIO(data))
+        self._cache = cache
+
+    def persistent_load(self, pid: Any) -> Any:
+        """Return the tree of a nested load."""
+        key, generation, attributes = pid
+        obj = self._cache._load_nested(  # pylint: disable=protected-access
+            key, generation
+        )
+        if attributes:
+            for name, value in attributes.items():
+                setattr(obj, name, value)
+        return obj
+
+
+class YamlCache:
+    """Cache constructed YAML trees keyed by file and secrets.
+
+    Trees are stored pickled, which keeps the line annotations of the
+    node classes and hands every caller its own copy to mutate. An entry
+    is reused as long as every file, directory and environment variable
+    that was read while constructing it is unchanged, so editing a single
+    included file only re-parses that file and the files including it.
+    Included trees are stored once, the entries of the files including
+    them only reference their entry.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Initialize the cache."""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[_CacheKey, _CacheEntry] = OrderedDict()
+        self._size = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def size(self) -> int:
+        """Return the number of bytes of the cached trees."""
+        return self._size
+
+    def _frames(self) -> list[_Load]:
+        """Return the loads in progress on this thread."""
+        try:
+            return self._local.frames  # type: ignore[no-any-return]
+        except AttributeError:
+            frames: list[_Load] = []
+            self._local.frames = frames
+            return frames
+
+    def track_file(self, path: str | os.PathLike[str]) -> None:
+        """Record a file or directory the load in progress depends on."""
+        if frames := self._frames():
+            path = os.fspath(path)
+            frames[-1].dependencies.files[path] = _file_signature(path)
+
+    def track_env(self, name: str) -> None:
+        """Record an environment variable the load in progress depends on."""
+        if frames := self._frames():
+            frames[-1].dependencies.env[name] = os.environ.get(name)
+
+    def clear(self) -> None:
+        """Drop all cached trees."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _unpickle(self, entry: _CacheEntry) -> Any:
+        """Return a copy of the tree of an entry."""
+        if entry.has_nested:
+            return _Unpickler(entry.data, self).load()
+        return pickle.loads(entry.data)
+
+    def _load_nested(self, key: _CacheKey, generation: int) -> Any:
+        """Return a copy of a tree referenced by another entry.
+
+        The dependencies of the referencing entry include those of the
+        nested tree, so only the entry it was pickled with is accepted.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.generation != generation:
+                raise _MissingNestedEntry
+            self._entries.move_to_end(key)
+        return self._unpickle(entry)
+
+    def _store(self, key: _CacheKey, load: _Load, result: Any) -> _CacheEntry | None:
+        """Store a constructed tree, return its entry if it was cached."""
+        if not load.dependencies.is_stable():
+            return None
+        try:
+            if load.nested:
+                with io.BytesIO() as file:
+                    _Pickler(file, load.nested).dump(result)
+                    data = file.getvalue()
+            else:
+                data = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return None
+        if len(data) > self.max_bytes:
+            return None
+
+        with self._lock:
+            self._generation += 1
+            entry = _CacheEntry(
+                data, load.dependencies, self._generation, bool(load.nested)
+            )
+            if (replaced := self._entries.pop(key, None)) is not None:
+                self._size -= len(replaced.data)
+            self._entries[key] = entry
+            self._size += len(data)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.data)
+        return entry
+
+    def load(
+        self,
+        fname: str,
+        secrets_key: str | None,
+        constructor: Callable[[], Any],
+    ) -> Any:
+        """Return the tree for fname, calling constructor on a cache miss."""
+        key = (fname, secrets_key)
+        frames = self._frames()
+
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry.dependencies.is_current():
+            try:
+                result = self._unpickle(entry)
+            except _MissingNestedEntry:
+                pass
+            else:
+                with self._lock:
+                    self.hits += 1
+                    if self._entries.get(key) is entry:
+                        self._entries.move_to_end(key)
+                if frames:
+                    frames[-1].dependencies.update(entry.dependencies)
+                    frames[-1].nested[id(result)] = (key, entry.generation, result)
+                return result
+
+        with self._lock:
+            self.misses += 1
+        load = _Load(_Dependencies(files={fname: _file_signature(fname)}))
+        frames.append(load)
+        try:
+            result = constructor()
+        finally:
+            frames.pop()
+            if frames:
+                frames[-1].dependencies.update(load.dependencies)
+
+        if (entry := self._store(key, load, result)) is not None and frames:
+            frames[-1].nested[id(result)] = (key, entry.generation, result)
+        return result
+
+
+YAML_CACHE = YamlCache()
@@ -23,6 +23,7 @@ except ImportError:
 
 from homeassistant.exceptions import HomeAssistantError
 
+from .cache import YAML_CACHE
 from .const import SECRET_YAML
 from .objects import Input, NodeDictClass, NodeListClass, NodeStrClass
 
@@ -56,6 +57,7 @@ class Secrets:
                 # We went above the config dir
                 break
 
+            YAML_CACHE.track_file(secret_dir / SECRET_YAML)
             secrets = self._load_secret_yaml(secret_dir)
 
             if secret in secrets:
@@ -148,7 +150,20 @@ LoaderType = FastSafeLoader | PythonSafeLoader
 
 
 def load_yaml(fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
-    """Load a YAML file."""
+    """Load a YAML file.
+
+    Unchanged files are served from the YAML cache.
+    """
+    fname = os.fspath(fname)
+    return YAML_CACHE.load(  # type: ignore[no-any-return]
+        fname,
+        str(secrets.config_dir) if secrets is not None else None,
+        lambda: _load_yaml_file(fname, secrets),
+    )
+
+
+def _load_yaml_file(fname: str, secrets: Secrets | None) -> JSON_TYPE:
+    """Read and parse a YAML file."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
             return parse_yaml(conf_file, secrets)
@@ -226,9 +241,9 @@ def _add_reference(  # type: ignore[no-untyped-def]
     obj, loader: LoaderType, node: yaml.nodes.Node
 ):
     """Add file reference information to an object."""
-    if isinstance(obj, list):
+    if isinstance(obj, list) and not isinstance(obj, NodeListClass):
         obj = NodeListClass(obj)
-    if isinstance(obj, str):
+    if isinstance(obj, str) and not isinstance(obj, NodeStrClass):
         obj = NodeStrClass(obj)
     setattr(obj, "__config_file__", loader.get_name())
     setattr(obj, "__line__", node.start_mark.line + 1)
@@ -258,7 +273,9 @@ def _is_file_valid(name: str) -> bool:
 
 def _find_files(directory: str, pattern: str) -> Iterator[str]:
     """Recursively load files in a directory."""
+    YAML_CACHE.track_file(directory)
     for root, dirs, files in os.walk(directory, topdown=True):
+        YAML_CACHE.track_file(root)
         dirs[:] = [d for d in dirs if _is_file_valid(d)]
         for basename in sorted(files):
             if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern):
@@ -375,6 +392,7 @@ def _handle_scalar_tag(
 def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
+    YAML_CACHE.track_env(args[0])
 
     # Check for a default value
     if len(args) > 1:
@@ -15,6 +15,7 @@ from homeassistant.auth import (
     InvalidAuthError,
     auth_store,
     const as auth_const,
+    jwt_wrapper,
     models as auth_models,
 )
 from homeassistant.auth.const import GROUP_ID_ADMIN, MFA_SESSION_EXPIRATION
@@ -1303,3 +1304,53 @@ async def test_access_token_from_the_future(mock_hass) -> None:
     with freeze_time(now + timedelta(days=365)):
         rt = await manager.async_validate_access_token(access_token)
         assert rt.id == refresh_token.id
+
+    # The validated token is remembered, but not before it was issued
+    assert await manager.async_validate_access_token(access_token) is None
+
+
+async def test_validated_access_token_cache(mock_hass) -> None:
+    """Test validated access tokens are remembered until revoked."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    with patch(
+        "homeassistant.auth.jwt_wrapper.verify_and_decode",
+        wraps=jwt_wrapper.verify_and_decode,
+    ) as verify_and_decode:
+        for _ in range(3):
+            assert (
+                await manager.async_validate_access_token(access_token) is refresh_token
+            )
+    assert verify_and_decode.call_count == 1
+
+    await manager.async_deactivate_user(user)
+    assert await manager.async_validate_access_token(access_token) is None
+    await manager.async_activate_user(user)
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    await manager.async_remove_refresh_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is None
+
+
+async def test_validated_access_token_cache_expires(mock_hass) -> None:
+    """Test remembered access tokens are rejected once they expire."""
+    now = dt_util.utcnow()
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    with freeze_time(now + auth_const.ACCESS_TOKEN_EXPIRATION + timedelta(minutes=1)):
+        assert await manager.async_validate_access_token(access_token) is None
+
+    with patch.object(auth, "ACCESS_TOKEN_CACHE_SIZE", 1):
+        other_token = manager.async_create_access_token(
+            await manager.async_create_refresh_token(user, CLIENT_ID)
+        )
+        assert await manager.async_validate_access_token(access_token)
+        assert await manager.async_validate_access_token(other_token)
+        assert list(manager._validated_access_tokens) == [other_token]
@@ -86,6 +86,7 @@ from homeassistant.util.json import (
 )
 from homeassistant.util.unit_system import METRIC_SYSTEM
 import homeassistant.util.uuid as uuid_util
+from homeassistant.util.yaml.cache import YAML_CACHE
 import homeassistant.util.yaml.loader as yaml_loader
 
 _LOGGER = logging.getLogger(__name__)
@@ -960,6 +961,8 @@ def patch_yaml_files(files_dict, endswith=True):
         # Not found
         raise FileNotFoundError(f"File not found: {fname}")
 
+    # Mocked files may shadow real ones which have been cached before
+    YAML_CACHE.clear()
     return patch.object(yaml_loader, "open", mock_open_f, create=True)
 
 
@@ -37,7 +37,7 @@ from homeassistant.core import (
     callback,
 )
 from homeassistant.exceptions import HomeAssistantError, Unauthorized
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.script import (
     SCRIPT_MODE_CHOICES,
     SCRIPT_MODE_PARALLEL,
@@ -1060,6 +1060,113 @@ async def test_reload_unchanged_automation(
         assert len(calls) == 2
 
 
+@pytest.mark.parametrize(
+    "automation_config",
+    (
+        {
+            "id": "sun",
+            "trigger": {"platform": "event", "event_type": "test_event"},
+            "action": [{"service": "test.automation"}],
+        },
+        {
+            "id": "sun",
+            "use_blueprint": {
+                "path": "test_event_service.yaml",
+                "input": {
+                    "trigger_event": "test_event",
+                    "service_to_call": "test.automation",
+                    "a_number": 5,
+                },
+            },
+        },
+    ),
+)
+async def test_reload_reuses_validated_config(
+    hass: HomeAssistant, calls, automation_config
+) -> None:
+    """Test only new or changed automations are validated at reload."""
+    with patch(
+        "homeassistant.components.automation.config._async_validate_config_item",
+        wraps=automation.config._async_validate_config_item,
+    ) as validate_config_item:
+        config = {automation.DOMAIN: [automation_config]}
+        assert await async_setup_component(hass, automation.DOMAIN, config)
+        assert validate_config_item.call_count == 1
+        validate_config_item.reset_mock()
+
+        # Reload the automations with an unchanged and an added automation
+        added_config = {
+            "id": "moon",
+            "trigger": {"platform": "event", "event_type": "test_event"},
+            "action": [{"service": "test.automation"}],
+        }
+        with patch(
+            "homeassistant.config.load_yaml_config_file",
+            autospec=True,
+            return_value={automation.DOMAIN: [dict(automation_config), added_config]},
+        ):
+            await hass.services.async_call(
+                automation.DOMAIN, SERVICE_RELOAD, blocking=True
+            )
+
+        assert validate_config_item.call_count == 1
+        assert validate_config_item.call_args[0][1] == added_config
+
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize(
+    ("registry_event", "event_data"),
+    (
+        (
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            {"action": "update", "entity_id": "light.kitchen", "changes": {}},
+        ),
+        (
+            dr.EVENT_DEVICE_REGISTRY_UPDATED,
+            {"action": "remove", "device_id": "abcd"},
+        ),
+    ),
+)
+async def test_reload_revalidates_after_registry_update(
+    hass: HomeAssistant, calls, registry_event, event_data
+) -> None:
+    """Test validated configs are not reused after a registry update."""
+    automation_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": [{"service": "test.automation"}],
+    }
+    with patch(
+        "homeassistant.components.automation.config._async_validate_config_item",
+        wraps=automation.config._async_validate_config_item,
+    ) as validate_config_item:
+        config = {automation.DOMAIN: [automation_config]}
+        assert await async_setup_component(hass, automation.DOMAIN, config)
+        assert validate_config_item.call_count == 1
+        validate_config_item.reset_mock()
+
+        hass.bus.async_fire(registry_event, event_data)
+        await hass.async_block_till_done()
+
+        with patch(
+            "homeassistant.config.load_yaml_config_file",
+            autospec=True,
+            return_value={automation.DOMAIN: [dict(automation_config)]},
+        ):
+            await hass.services.async_call(
+                automation.DOMAIN, SERVICE_RELOAD, blocking=True
+            )
+
+        assert validate_config_item.call_count == 1
+
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+
 @pytest.mark.parametrize("extra_config", ({}, {"id": "sun"}))
 async def test_reload_automation_when_blueprint_changes(
     hass: HomeAssistant, calls, extra_config
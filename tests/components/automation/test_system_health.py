@@ -0,0 +1,43 @@
+"""Test automation system health."""
+from unittest.mock import patch
+
+from homeassistant.components import automation
+from homeassistant.const import SERVICE_RELOAD
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from tests.common import get_system_health_info
+
+
+async def test_system_health_info(hass: HomeAssistant) -> None:
+    """Test the reload statistics are reported to system health."""
+    assert await async_setup_component(hass, "system_health", {})
+    automation_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": [{"service": "test.automation"}],
+    }
+    assert await async_setup_component(
+        hass, automation.DOMAIN, {automation.DOMAIN: [automation_config]}
+    )
+    await hass.async_block_till_done()
+
+    info = await get_system_health_info(hass, automation.DOMAIN)
+    assert info == {"kept": 0, "removed": 0, "created": 1}
+
+    added_config = {**automation_config, "id": "moon"}
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={automation.DOMAIN: [dict(automation_config), added_config]},
+    ):
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    info = await get_system_health_info(hass, automation.DOMAIN)
+    assert info == {
+        "kept": 1,
+        "removed": 0,
+        "created": 1,
+        "reload_duration": info["reload_duration"],
+    }
+    assert info["reload_duration"] >= 0
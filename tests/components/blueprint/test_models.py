@@ -234,6 +234,20 @@ async def test_domain_blueprints_caching(domain_bps) -> None:
         assert await domain_bps.async_get_blueprint("something") is obj_2
 
 
+async def test_domain_blueprints_get_blueprint_data(domain_bps, blueprint_1) -> None:
+    """Test DomainBlueprints.async_get_blueprint_data."""
+    assert await domain_bps.async_get_blueprint_data({"alias": "No blueprint"}) is None
+    assert await domain_bps.async_get_blueprint_data({"use_blueprint": {}}) is None
+
+    config = {"use_blueprint": {"path": "bla.yaml", "input": {}}}
+    with patch.object(domain_bps, "_load_blueprint", return_value=blueprint_1):
+        assert await domain_bps.async_get_blueprint_data(config) is blueprint_1.data
+
+    await domain_bps.async_reset_cache()
+    with patch("homeassistant.util.yaml.load_yaml", side_effect=FileNotFoundError):
+        assert await domain_bps.async_get_blueprint_data(config) is None
+
+
 async def test_domain_blueprints_inputs_from_config(domain_bps, blueprint_1) -> None:
     """Test DomainBlueprints.async_inputs_from_config."""
     with pytest.raises(errors.InvalidBlueprintInputs):
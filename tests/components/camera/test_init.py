@@ -222,6 +222,92 @@ async def test_get_image_fails(hass: HomeAssistant, image_mock_url) -> None:
         await camera.async_get_image(hass, "camera.demo_camera")
 
 
+async def test_get_image_shared(hass: HomeAssistant, image_mock_url) -> None:
+    """Test concurrent and repeated requests share a snapshot per size."""
+    fetched = asyncio.Event()
+    calls = []
+
+    async def async_camera_image(width=None, height=None):
+        calls.append((width, height))
+        await fetched.wait()
+        return f"Image {len(calls)}".encode()
+
+    entity = hass.data[camera.DOMAIN].get_entity("camera.demo_camera_png")
+    entity._attr_snapshot_cache_ttl = 1.0
+    with patch.object(entity, "async_camera_image", async_camera_image), patch(
+        "homeassistant.components.camera.time.monotonic", return_value=1000
+    ) as monotonic:
+        requests = [
+            asyncio.create_task(camera.async_get_image(hass, "camera.demo_camera_png"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        fetched.set()
+        images = await asyncio.gather(*requests)
+        assert [image.content for image in images] == [b"Image 1"] * 3
+
+        image = await camera.async_get_image(hass, "camera.demo_camera_png")
+        assert image.content == b"Image 1"
+        image = await camera.async_get_image(
+            hass, "camera.demo_camera_png", width=4, height=3
+        )
+        assert image.content == b"Image 2"
+
+        monotonic.return_value = 1001
+        image = await camera.async_get_image(hass, "camera.demo_camera_png")
+        assert image.content == b"Image 3"
+
+    assert calls == [(None, None), (4, 3), (None, None)]
+    assert entity.snapshot_cache.as_dict() == {
+        "hits": 1,
+        "coalesced": 2,
+        "misses": 3,
+    }
+
+
+async def test_get_image_not_reused_by_default(
+    hass: HomeAssistant, image_mock_url
+) -> None:
+    """Test repeated requests fetch a new snapshot unless a TTL is set."""
+    calls = 0
+
+    async def async_camera_image(width=None, height=None):
+        nonlocal calls
+        calls += 1
+        return f"Image {calls}".encode() if calls != 2 else None
+
+    entity = hass.data[camera.DOMAIN].get_entity("camera.demo_camera_png")
+    with patch.object(entity, "async_camera_image", async_camera_image):
+        image = await camera.async_get_image(hass, "camera.demo_camera_png")
+        assert image.content == b"Image 1"
+        with pytest.raises(HomeAssistantError):
+            await camera.async_get_image(hass, "camera.demo_camera_png")
+        image = await camera.async_get_image(hass, "camera.demo_camera_png")
+        assert image.content == b"Image 3"
+
+
+async def test_get_image_failed_fetch_not_served_from_cache(
+    hass: HomeAssistant, image_mock_url
+) -> None:
+    """Test a failed fetch drops the shared snapshot."""
+    images = [b"Image", None]
+
+    async def async_camera_image(width=None, height=None):
+        return images.pop(0)
+
+    entity = hass.data[camera.DOMAIN].get_entity("camera.demo_camera_png")
+    entity._attr_snapshot_cache_ttl = 10.0
+    with patch.object(entity, "async_camera_image", async_camera_image), patch(
+        "homeassistant.components.camera.time.monotonic", return_value=1000
+    ) as monotonic:
+        image = await camera.async_get_image(hass, "camera.demo_camera_png")
+        assert image.content == b"Image"
+        monotonic.return_value = 1011
+        with pytest.raises(HomeAssistantError):
+            await camera.async_get_image(hass, "camera.demo_camera_png")
+    assert entity.snapshot_cache.images == {}
+
+
 async def test_snapshot_service(hass: HomeAssistant, mock_camera) -> None:
     """Test snapshot service."""
     mopen = mock_open()
@@ -564,6 +650,39 @@ async def test_camera_proxy_stream(
             assert response.status == HTTPStatus.BAD_GATEWAY
 
 
+async def test_camera_proxy_still_stream_shared(
+    hass: HomeAssistant, mock_camera, hass_client: ClientSessionGenerator
+) -> None:
+    """Test viewers of a still stream share the fetched images."""
+    images: asyncio.Queue[bytes | None] = asyncio.Queue()
+    fetches = 0
+
+    async def async_camera_image(width=None, height=None):
+        nonlocal fetches
+        fetches += 1
+        return await images.get()
+
+    client = await hass_client()
+    entity = hass.data[camera.DOMAIN].get_entity("camera.demo_camera")
+    url = "/api/camera_proxy_stream/camera.demo_camera?interval=0.5"
+    with patch.object(entity, "async_camera_image", async_camera_image):
+        first = await client.get(url)
+        second = await client.get(url)
+        assert len(entity._still_stream_broadcasters[0.5].viewers) == 2
+
+        images.put_nowait(b"Image")
+        images.put_nowait(None)
+        bodies = [await first.read(), await second.read()]
+
+    frame = (
+        b"--frameboundary\r\nContent-Type: image/jpg\r\n"
+        b"Content-Length: 5\r\n\r\nImage\r\n"
+    )
+    assert bodies == [frame * 2, frame * 2]
+    assert fetches == 2
+    assert entity._still_stream_broadcasters == {}
+
+
 async def test_websocket_web_rtc_offer(
     hass: HomeAssistant,
     hass_ws_client: WebSocketGenerator,
@@ -1,11 +1,14 @@
 """Test the Energy websocket API."""
 from typing import Any
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from homeassistant.components.energy import data, is_configured
-from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder import (
+    Recorder,
+    statistics as recorder_statistics,
+)
 from homeassistant.components.recorder.statistics import async_add_external_statistics
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
@@ -987,6 +990,97 @@ async def test_fossil_energy_consumption(
     }
 
 
+async def test_fossil_energy_consumption_cached(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test fossil_energy_consumption serves compiled hours from the cache."""
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+
+    period1 = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 00:00:00"))
+    period2 = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 01:00:00"))
+    energy_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    co2_metadata = {
+        "has_mean": True,
+        "has_sum": False,
+        "name": "Fossil percentage",
+        "source": "test",
+        "statistic_id": "test:fossil_percentage",
+        "unit_of_measurement": "%",
+    }
+    async_add_external_statistics(
+        hass,
+        energy_metadata,
+        (
+            {"start": period1, "last_reset": None, "state": 0, "sum": 2},
+            {"start": period2, "last_reset": None, "state": 1, "sum": 3},
+        ),
+    )
+    async_add_external_statistics(
+        hass,
+        co2_metadata,
+        (
+            {"start": period1, "last_reset": None, "mean": 10},
+            {"start": period2, "last_reset": None, "mean": 50},
+        ),
+    )
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    msg = {
+        "type": "energy/fossil_energy_consumption",
+        "start_time": period1.isoformat(),
+        "end_time": "2021-09-02T00:00:00+00:00",
+        "energy_statistic_ids": ["test:total_energy_import"],
+        "co2_statistic_id": "test:fossil_percentage",
+        "period": "hour",
+    }
+    statistics_during_period = recorder_statistics.statistics_during_period
+    with patch.object(
+        recorder_statistics,
+        "statistics_during_period",
+        wraps=statistics_during_period,
+    ) as statistics_during_period_mock:
+        await client.send_json({"id": 1, **msg})
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"] == {
+            period1.isoformat(): pytest.approx(2.0 * 0.1),
+            period2.isoformat(): pytest.approx(1.0 * 0.5),
+        }
+        assert statistics_during_period_mock.call_count == 1
+
+        # The whole range has been compiled, it is served from the cache
+        await client.send_json({"id": 2, **msg, "period": "day"})
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"] == {period1.isoformat(): pytest.approx(0.7)}
+        assert statistics_during_period_mock.call_count == 1
+
+        # Importing statistics invalidates the cache
+        async_add_external_statistics(
+            hass,
+            energy_metadata,
+            ({"start": period2, "last_reset": None, "state": 1, "sum": 4},),
+        )
+        await async_wait_recording_done(hass)
+        await client.send_json({"id": 3, **msg})
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"] == {
+            period1.isoformat(): pytest.approx(2.0 * 0.1),
+            period2.isoformat(): pytest.approx(2.0 * 0.5),
+        }
+        assert statistics_during_period_mock.call_count == 2
+
+
 async def test_fossil_energy_consumption_checks(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -530,8 +530,10 @@ async def test_frame_interval_property(hass: HomeAssistant) -> None:
 
     request = Mock()
     with patch(
-        "homeassistant.components.camera.async_get_still_stream"
-    ) as mock_get_stream:
+        "homeassistant.components.camera.StillStreamBroadcaster.async_handle",
+        autospec=True,
+    ) as mock_handle:
         await async_get_mjpeg_stream(hass, request, "camera.config_test")
 
-    assert mock_get_stream.call_args_list[0][0][3] == pytest.approx(0.2)
+    broadcaster = mock_handle.call_args_list[0][0][0]
+    assert broadcaster.interval == pytest.approx(0.2)
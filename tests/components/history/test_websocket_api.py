@@ -8,7 +8,7 @@ import pytest
 
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
-from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder import Recorder, history as recorder_history
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
@@ -523,6 +523,77 @@ async def test_history_stream_historical_only(
     }
 
 
+async def test_history_stream_historical_only_entity_batches(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream sends one message per batch of entities."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    last_updated = {}
+    for entity_id in ("sensor.one", "sensor.two", "sensor.three"):
+        hass.states.async_set(entity_id, "on")
+        last_updated[entity_id] = hass.states.get(entity_id).last_updated.timestamp()
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one", "sensor.two", "sensor.three", "sensor.four"],
+            "start_time": now.isoformat(),
+            "end_time": end_time.isoformat(),
+            "no_attributes": True,
+            "minimal_response": True,
+            "entity_batch_size": 2,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    response = await client.receive_json()
+    assert response["event"] == {
+        "end_time": last_updated["sensor.two"],
+        "start_time": now.timestamp(),
+        "states": {
+            "sensor.one": [{"lu": last_updated["sensor.one"], "s": "on"}],
+            "sensor.two": [{"lu": last_updated["sensor.two"], "s": "on"}],
+        },
+    }
+    response = await client.receive_json()
+    assert response["event"] == {
+        "end_time": last_updated["sensor.three"],
+        "start_time": now.timestamp(),
+        "states": {
+            "sensor.three": [{"lu": last_updated["sensor.three"], "s": "on"}],
+        },
+    }
+
+    # Nothing recorded in the window sends a single empty message
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/stream",
+            "entity_ids": ["sensor.five", "sensor.six", "sensor.seven"],
+            "start_time": now.isoformat(),
+            "end_time": end_time.isoformat(),
+            "no_attributes": True,
+            "entity_batch_size": 2,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert response["event"] == {
+        "end_time": end_time.timestamp(),
+        "start_time": now.timestamp(),
+        "states": {},
+    }
+
+
 async def test_history_stream_significant_domain_historical_only(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -1908,3 +1979,91 @@ async def test_history_stream_historical_only_with_start_time_state_past(
         "id": 1,
         "type": "event",
     }
+
+
+async def test_history_during_period_served_from_cache(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period is served from recently recorded states."""
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "on", attributes={"any": "attr"})
+    hass.states.async_set("climate.test", "heat", attributes={"temperature": 20})
+    await async_recorder_block_till_done(hass)
+    start = dt_util.utcnow()
+    for state, attr in (("off", "attr"), ("off", "changed"), ("on", "attr")):
+        hass.states.async_set("sensor.test", state, attributes={"any": attr})
+        hass.states.async_set("climate.test", "heat", attributes={"temperature": attr})
+        await async_recorder_block_till_done(hass)
+    end = dt_util.utcnow()
+    hass.states.async_set("sensor.test", "off", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    recent_states_manager = recorder_mock.recent_states_manager
+    for entity_ids, include_start_time_state, minimal_response, end_time in (
+        (["sensor.test"], True, False, None),
+        (["sensor.test"], True, True, end),
+        (["sensor.test", "climate.test"], True, True, None),
+        (["sensor.test", "climate.test"], False, False, end),
+        (["sensor.test", "climate.test", "sensor.test"], True, True, None),
+    ):
+        hits = recent_states_manager.hits
+        cached = await recorder_mock.async_add_executor_job(
+            recorder_history.get_significant_states_from_cache,
+            hass,
+            start,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            minimal_response,
+        )
+        assert recent_states_manager.hits == hits + 1
+        assert cached == await recorder_mock.async_add_executor_job(
+            recorder_history.get_significant_states,
+            hass,
+            start,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            True,
+            minimal_response,
+            True,
+            True,
+        )
+
+    # Nothing before the first recorded state is cached
+    misses = recent_states_manager.misses
+    assert (
+        await recorder_mock.async_add_executor_job(
+            recorder_history.get_significant_states_from_cache,
+            hass,
+            start - timedelta(hours=1),
+            None,
+            ["sensor.test"],
+        )
+        is None
+    )
+    assert recent_states_manager.misses == misses + 1
+
+    client = await hass_ws_client()
+    hits = recent_states_manager.hits
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "end_time": end.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "no_attributes": True,
+            "minimal_response": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert [state["s"] for state in response["result"]["sensor.test"]] == [
+        "on",
+        "off",
+        "on",
+    ]
+    assert recent_states_manager.hits == hits + 1
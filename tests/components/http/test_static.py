@@ -1,13 +1,22 @@
 """The tests for http static files."""
 
 
+import asyncio
+import gzip
 from pathlib import Path
+from unittest.mock import patch
 
+from aiohttp import hdrs
 from aiohttp.test_utils import TestClient
 from aiohttp.web_exceptions import HTTPForbidden
 import pytest
 
-from homeassistant.components.http.static import CachingStaticResource, _get_file_path
+from homeassistant.components.http import static
+from homeassistant.components.http.static import (
+    AssetCache,
+    CachingStaticResource,
+    _get_file_path,
+)
 from homeassistant.core import EVENT_HOMEASSISTANT_START, HomeAssistant
 from homeassistant.setup import async_setup_component
 
@@ -59,3 +68,116 @@ async def test_static_path_blocks_anchors(
     # changes we still block it.
     with pytest.raises(HTTPForbidden):
         _get_file_path(canonical_url, tmp_path, False)
+
+
+async def test_static_path_cache_in_memory(
+    hass: HomeAssistant, aiohttp_client: ClientSessionGenerator, tmp_path: Path
+) -> None:
+    """Test files are served from memory in the encoding the client accepts."""
+    body = b"const value = 1;\n" * 100
+    (tmp_path / "app.js").write_bytes(body)
+    (tmp_path / "styles.css").write_bytes(b"body {}")
+    (tmp_path / "styles.css.br").write_bytes(b"brotli")
+    hass.http.register_static_path("/assets", str(tmp_path), True, True)
+    client = await aiohttp_client(hass.http.app, auto_decompress=False)
+
+    resp = await client.get(
+        "/assets/app.js", headers={hdrs.ACCEPT_ENCODING: "gzip, deflate, br"}
+    )
+    assert resp.status == 200
+    assert resp.headers[hdrs.CONTENT_ENCODING] == "gzip"
+    assert resp.headers[hdrs.CONTENT_TYPE] == "text/javascript"
+    assert resp.headers[hdrs.VARY] == hdrs.ACCEPT_ENCODING
+    assert gzip.decompress(await resp.read()) == body
+    gzip_etag = resp.headers[hdrs.ETAG]
+
+    # Served from memory once read
+    (tmp_path / "app.js").write_bytes(b"changed")
+    resp = await client.get("/assets/app.js", headers={hdrs.ACCEPT_ENCODING: ""})
+    assert hdrs.CONTENT_ENCODING not in resp.headers
+    assert await resp.read() == body
+    assert resp.headers[hdrs.ETAG] != gzip_etag
+
+    resp = await client.get(
+        "/assets/app.js",
+        headers={hdrs.ACCEPT_ENCODING: "gzip", hdrs.IF_NONE_MATCH: gzip_etag},
+    )
+    assert resp.status == 304
+
+    # Range requests are served from disk
+    resp = await client.get("/assets/app.js", headers={hdrs.RANGE: "bytes=0-2"})
+    assert resp.status == 206
+    assert await resp.read() == b"cha"
+
+    # Precompressed siblings are preferred, small files are not compressed
+    resp = await client.get(
+        "/assets/styles.css", headers={hdrs.ACCEPT_ENCODING: "gzip, br"}
+    )
+    assert resp.headers[hdrs.CONTENT_ENCODING] == "br"
+    assert await resp.read() == b"brotli"
+    resp = await client.get(
+        "/assets/styles.css", headers={hdrs.ACCEPT_ENCODING: "gzip"}
+    )
+    assert hdrs.CONTENT_ENCODING not in resp.headers
+    assert await resp.read() == b"body {}"
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    (
+        ("", ""),
+        ("gzip, deflate, br", "br"),
+        ("GZIP", "gzip"),
+        ("x-gzip", "gzip"),
+        ("br;q=0, gzip", "gzip"),
+        ("br; q=0.0, gzip;q=0", ""),
+        ("br;q=0.5, gzip;q=0.8", "gzip"),
+        ("gzip;q=0.5, br;q=0.5", "br"),
+        ("*", "br"),
+        ("*;q=0.1, br;q=0", "gzip"),
+        ("identity, *;q=0", ""),
+        ("br;q=invalid, gzip", "gzip"),
+        ("brotli, gzipped", ""),
+    ),
+)
+def test_select_encoding(accept_encoding: str, expected: str) -> None:
+    """Test selecting the encoding from the Accept-Encoding header."""
+    assert static._select_encoding(accept_encoding, ("br", "gzip")) == expected
+
+
+async def test_static_path_refused_encoding(
+    hass: HomeAssistant, aiohttp_client: ClientSessionGenerator, tmp_path: Path
+) -> None:
+    """Test encodings with a quality value of 0 are not served."""
+    (tmp_path / "styles.css").write_bytes(b"body {}")
+    (tmp_path / "styles.css.br").write_bytes(b"brotli")
+    hass.http.register_static_path("/assets", str(tmp_path), True, True)
+    client = await aiohttp_client(hass.http.app, auto_decompress=False)
+
+    resp = await client.get(
+        "/assets/styles.css", headers={hdrs.ACCEPT_ENCODING: "gzip, br;q=0"}
+    )
+    assert hdrs.CONTENT_ENCODING not in resp.headers
+    assert await resp.read() == b"body {}"
+
+
+async def test_asset_cache_size(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test the asset cache reads a file once and stays within its size."""
+    for name in ("a", "b", "c"):
+        (tmp_path / name).write_bytes(name.encode() * 100)
+    cache = AssetCache(max_bytes=250)
+
+    with patch.object(static, "_load_asset", wraps=static._load_asset) as load:
+        assets = await asyncio.gather(
+            *(cache.async_get(hass, tmp_path / "a", "text/plain") for _ in range(5))
+        )
+        assert load.call_count == 1
+    assert all(asset is assets[0] for asset in assets)
+
+    await cache.async_get(hass, tmp_path / "b", "text/plain")
+    await cache.async_get(hass, tmp_path / "c", "text/plain")
+    assert cache.size <= 250
+    assert list(cache._assets) == [tmp_path / "b", tmp_path / "c"]
+
+    with patch.object(static, "ASSET_CACHE_MAX_FILE_BYTES", 10):
+        assert await cache.async_get(hass, tmp_path / "a", "text/plain") is None
@@ -4,6 +4,7 @@ import datetime
 from http import HTTPStatus
 from unittest.mock import ANY, MagicMock, Mock, call, patch
 
+from influxdb.line_protocol import make_lines
 import pytest
 
 import homeassistant.components.influxdb as influxdb
@@ -51,22 +52,70 @@ def mock_client_fixture(request):
         yield client
 
 
+class LineProtocol:
+    """Compare written line protocol to the lines the InfluxDB client makes.
+
+    The time of the points may be ANY, the timestamps of the written
+    lines are then ignored.
+    """
+
+    def __init__(self, body, precision):
+        """Initialize the expected lines."""
+        self.any_time = any(point.get("time") is ANY for point in body)
+        # Numbers are always written as floats, 1 is expected to match 1.0
+        points = [
+            {
+                key: value
+                for key, value in point.items()
+                if key != "fields" and value is not ANY
+            }
+            | {
+                "fields": {
+                    key: float(value)
+                    if isinstance(value, int) and not isinstance(value, bool)
+                    else value
+                    for key, value in point["fields"].items()
+                }
+            }
+            for point in body
+        ]
+        self.lines = make_lines(
+            {"points": points}, {"us": "u", "ns": "n"}.get(precision, precision)
+        ).splitlines()
+
+    def __eq__(self, other):
+        """Return if the written lines are the expected lines."""
+        if isinstance(other, bytes):
+            other = other.decode("utf-8").split("\n")
+        if self.any_time:
+            other = [line.rsplit(" ", 1)[0] for line in other]
+        return other == self.lines
+
+    def __repr__(self):
+        """Return the expected lines."""
+        return repr(self.lines)
+
+
 @pytest.fixture(name="get_mock_call")
 def get_mock_call_fixture(request):
     """Get version specific lambda to make write API call mock."""
 
     def v2_call(body, precision):
-        data = {"bucket": DEFAULT_BUCKET, "record": body}
+        data = {"bucket": DEFAULT_BUCKET, "record": LineProtocol(body, precision)}
 
         if precision is not None:
             data["write_precision"] = precision
 
         return call(**data)
 
+    def v1_call(body, precision):
+        return call(
+            LineProtocol(body, precision), time_precision=precision, protocol="line"
+        )
+
     if request.param == influxdb.API_VERSION_2:
         return lambda body, precision=None: v2_call(body, precision)
-    # pylint: disable-next=unnecessary-lambda
-    return lambda body, precision=None: call(body, time_precision=precision)
+    return lambda body, precision=None: v1_call(body, precision)
 
 
 def _get_write_api_mock_v1(mock_influx_client):
@@ -1676,3 +1725,60 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+@pytest.mark.parametrize("precision", [None, "ns", "us", "ms", "s"])
+def test_json_to_line(precision) -> None:
+    """Test points are serialized like the InfluxDB client serializes them."""
+    point = {
+        "measurement": "power, total=",
+        "tags": {
+            "entity_id": "my_power",
+            "domain": "sensor",
+            "empty": "",
+            "none": None,
+            "room": "living room\\",
+            "floor": 1,
+        },
+        "time": datetime.datetime(2023, 5, 6, 7, 8, 9, 123456, tzinfo=datetime.UTC),
+        "fields": {
+            "value": 1.5,
+            "state": 'on "quoted"\nnext',
+            "count": 3,
+            "flag": True,
+            "none": None,
+        },
+    }
+    line = influxdb._json_to_line(point, influxdb._PRECISION_DIVISORS[precision])
+    assert [line] == make_lines(
+        {"points": [point]}, {"us": "u", "ns": "n"}.get(precision, precision)
+    ).splitlines()
+
+
+def test_event_queue_drops_oldest() -> None:
+    """Test the event queue drops its oldest events when full."""
+    event_queue = influxdb._EventQueue(2)
+    for item in range(3):
+        event_queue.put(item)
+
+    assert event_queue.qsize() == 2
+    assert event_queue.dropped == 1
+    assert event_queue.get() == 1
+    assert event_queue.get() == 2
+    event_queue.task_done()
+    event_queue.task_done()
+    # Does not block on the dropped event
+    event_queue.join()
+
+
+def test_event_queue_keeps_sentinel() -> None:
+    """Test the event queue never drops the sentinel which stops the thread."""
+    event_queue = influxdb._EventQueue(2)
+    event_queue.put(0)
+    event_queue.put(None)
+    event_queue.put(1)
+    event_queue.put(2)
+
+    assert event_queue.dropped == 2
+    assert event_queue.get() is None
+    assert event_queue.get() == 2
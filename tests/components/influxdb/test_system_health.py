@@ -0,0 +1,52 @@
+"""Test InfluxDB system health."""
+from unittest.mock import patch
+
+from homeassistant.components import influxdb
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from tests.common import get_system_health_info
+
+
+async def test_system_health_info(hass: HomeAssistant) -> None:
+    """Test the writer statistics are reported to system health."""
+    assert await async_setup_component(hass, "system_health", {})
+    with patch("homeassistant.components.influxdb.InfluxDBClient") as mock_client:
+        assert await async_setup_component(
+            hass, influxdb.DOMAIN, {influxdb.DOMAIN: {"host": "host"}}
+        )
+        await hass.async_block_till_done()
+
+        hass.states.async_set("sensor.test", "1")
+        await hass.async_block_till_done()
+        hass.data[influxdb.DOMAIN].block_till_done()
+
+    assert mock_client.return_value.write_points.called
+    info = await get_system_health_info(hass, influxdb.DOMAIN)
+    assert info == {
+        "connected": True,
+        "queue_depth": 0,
+        "written": 1,
+        "retries": 0,
+        "write_errors": 0,
+        "dropped_queue_full": 0,
+        "dropped_backlog": 0,
+        "write_latency": info["write_latency"],
+    }
+    assert info["write_latency"] >= 0
+
+
+async def test_system_health_info_not_connected(hass: HomeAssistant) -> None:
+    """Test system health while the connection is retried."""
+    assert await async_setup_component(hass, "system_health", {})
+    with patch(
+        "homeassistant.components.influxdb.InfluxDBClient"
+    ) as mock_client, patch("homeassistant.components.influxdb.event_helper"):
+        mock_client.return_value.write_points.side_effect = ConnectionError("fail")
+        assert await async_setup_component(
+            hass, influxdb.DOMAIN, {influxdb.DOMAIN: {"host": "host"}}
+        )
+        await hass.async_block_till_done()
+
+    info = await get_system_health_info(hass, influxdb.DOMAIN)
+    assert info == {"connected": False}
@@ -1,6 +1,8 @@
 """The tests for the logbook component models."""
 from unittest.mock import Mock
 
+import pytest
+
 from homeassistant.components.logbook.models import LazyEventPartialState
 
 
@@ -18,3 +20,13 @@ def test_lazy_event_partial_state_context():
     assert state.context_id == "1H68SK8C9J6CT32CHK6GRK4CSM"
     assert state.context_user_id == "31323334313233343132333431323334"
     assert state.context_parent_id == "1M6GT38D1M6GT38D1M6GT38D1M"
+
+
+def test_lazy_event_partial_state_broken_event_data(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test we handle broken json in event data."""
+    state = LazyEventPartialState(Mock(event_data="{NOT_PARSE}"), {})
+    assert state.data == {}
+    assert "Error converting row to event data" in caplog.text
+    assert "state attributes" not in caplog.text
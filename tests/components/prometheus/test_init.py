@@ -61,6 +61,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_values import EntityValues
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
 
@@ -1801,3 +1802,116 @@ async def test_filtered_denylist(hass: HomeAssistant, mock_client) -> None:
         was_called = mock_client.labels.call_count == 1
         assert test.should_pass == was_called
         mock_client.labels.reset_mock()
+
+
+async def test_render_matches_generate_latest(hass: HomeAssistant) -> None:
+    """Test the cached series render like prometheus_client renders them."""
+    prometheus_cli = mock.Mock(
+        Counter=prometheus_client.Counter,
+        Gauge=prometheus_client.Gauge,
+        REGISTRY=prometheus_client.CollectorRegistry(),
+        generate_latest=prometheus_client.generate_latest,
+    )
+    metrics = prometheus.PrometheusMetrics(
+        prometheus_cli,
+        lambda entity_id: True,
+        "homeassistant",
+        UnitOfTemperature.CELSIUS,
+        EntityValues({}, {}, {}),
+        None,
+        None,
+    )
+
+    def assert_render_matches() -> None:
+        registry = prometheus_client.CollectorRegistry()
+        for metric in metrics._metrics.values():
+            registry.register(metric)
+        assert metrics.render() == prometheus_client.generate_latest(registry)
+
+    hass.states.async_set(
+        "sensor.outside_temperature",
+        "12.5",
+        {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS},
+    )
+    hass.states.async_set(
+        "sensor.escaped",
+        "3",
+        {ATTR_FRIENDLY_NAME: 'Quote " backslash \\ newline \n', ATTR_BATTERY_LEVEL: 9},
+    )
+    hass.states.async_set("switch.heater", STATE_ON, {"current_power_w": 120})
+    hass.states.async_set("cover.garage", STATE_OPEN, {"current_position": 80})
+    hass.states.async_set("automation.lights", STATE_ON)
+    for state in hass.states.async_all():
+        metrics.handle_state(state)
+    assert_render_matches()
+
+    # Unchanged series are reused
+    with mock.patch.object(
+        prometheus, "_render_series", wraps=prometheus._render_series
+    ) as render_series:
+        assert_render_matches()
+        assert render_series.call_count == 0
+
+        hass.states.async_set("switch.heater", STATE_OFF, {"current_power_w": 0})
+        metrics.handle_state(hass.states.get("switch.heater"))
+        assert_render_matches()
+        # state_change, entity_available, last_updated_time_seconds,
+        # switch_state and switch_attr_current_power_w
+        assert render_series.call_count == 5
+
+    metrics._remove_labelsets("cover.garage")
+    assert_render_matches()
+    assert b"cover.garage" not in metrics.render()
+
+
+def test_prometheus_client_series_internals() -> None:
+    """Test the prometheus_client internals used to render series are available.
+
+    When this fails after updating prometheus_client, the series of the
+    metrics are no longer rendered one by one.
+    """
+    counter = prometheus_client.Counter("counter", "Counter", ["entity"], registry=None)
+    counter.labels(entity="sensor.one").inc()
+    gauge = prometheus_client.Gauge("gauge", "Gauge", ["entity"], registry=None)
+    gauge.labels(entity="sensor.one").set(1)
+    for metric in (counter, gauge):
+        assert prometheus._supports_series_rendering(metric)
+        ((labelvalues, child),) = metric._metrics.items()
+        assert labelvalues == ("sensor.one",)
+        for sample in child._samples():
+            # suffix, labels, value, timestamp and exemplar
+            assert len(sample) == 5
+            assert isinstance(sample[0], str)
+            assert isinstance(sample[1], dict)
+
+
+async def test_render_without_series_internals(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test metrics are rendered through collect without the internals."""
+    prometheus_cli = mock.Mock(
+        Counter=prometheus_client.Counter,
+        Gauge=prometheus_client.Gauge,
+        REGISTRY=prometheus_client.CollectorRegistry(),
+        generate_latest=prometheus_client.generate_latest,
+    )
+    metrics = prometheus.PrometheusMetrics(
+        prometheus_cli,
+        lambda entity_id: True,
+        "homeassistant",
+        UnitOfTemperature.CELSIUS,
+        EntityValues({}, {}, {}),
+        None,
+        None,
+    )
+    hass.states.async_set("switch.heater", STATE_ON, {"current_power_w": 120})
+    with mock.patch.object(
+        prometheus, "_supports_series_rendering", return_value=False
+    ), mock.patch.object(prometheus, "_render_series") as render_series:
+        metrics.handle_state(hass.states.get("switch.heater"))
+        registry = prometheus_client.CollectorRegistry()
+        for metric in metrics._metrics.values():
+            registry.register(metric)
+        assert metrics.render() == prometheus_client.generate_latest(registry)
+    assert not render_series.called
+    assert "rendering all metrics on every request" in caplog.text
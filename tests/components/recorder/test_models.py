@@ -15,15 +15,23 @@ from homeassistant.components.recorder.db_schema import (
 from homeassistant.components.recorder.models import (
     LazyState,
     bytes_to_ulid_or_none,
+    decode_json_object,
+    decoded_json_cache_info,
     process_datetime_to_timestamp,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
     ulid_to_bytes_or_none,
 )
+from homeassistant.components.recorder.models.state_attributes import (
+    DECODED_JSON_CACHE,
+    MAX_CACHED_SOURCE_LENGTH,
+    DecodedJsonCache,
+)
 from homeassistant.const import EVENT_STATE_CHANGED
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import InvalidEntityFormatError
+from homeassistant.helpers.json import json_dumps
 from homeassistant.util import dt as dt_util
 
 
@@ -288,6 +296,49 @@ async def test_lazy_state_can_decode_attributes(
     }
 
 
+async def test_lazy_state_shares_decoded_attributes() -> None:
+    """Test identical attributes are decoded once across queries."""
+    DECODED_JSON_CACHE.clear()
+    row = PropertyMock(
+        entity_id="sensor.shared",
+        attributes='{"shared":true,"name":"x"}',
+    )
+    first = LazyState(row, {}, None, row.entity_id, "", 1, False).attributes
+    first["shared"] = False
+    second = LazyState(row, {}, None, row.entity_id, "", 1, False).attributes
+    assert second == {"shared": True, "name": "x"}
+    assert second is not first
+    assert decoded_json_cache_info() == {
+        "size": 1,
+        "length": len(row.attributes),
+        "hits": 1,
+        "misses": 1,
+        "hit_rate": 0.5,
+    }
+
+
+async def test_decoded_json_cache_skips_nested_and_large_objects() -> None:
+    """Test nested and large objects are decoded by every query."""
+    DECODED_JSON_CACHE.clear()
+    nested = '{"list":[1]}'
+    first = decode_json_object(nested)
+    first["list"].append(2)
+    assert decode_json_object(nested) == {"list": [1]}
+    large = json_dumps({"value": "x" * MAX_CACHED_SOURCE_LENGTH})
+    assert decode_json_object(large) == {"value": "x" * MAX_CACHED_SOURCE_LENGTH}
+    assert decoded_json_cache_info()["size"] == 0
+
+
+async def test_decoded_json_cache_bounded_by_length() -> None:
+    """Test the least recently used objects are evicted past the length."""
+    cache = DecodedJsonCache(max_length=20)
+    cache.add('{"a":"1234567"}', {"a": "1234567"})
+    cache.add('{"b":"1234567"}', {"b": "1234567"})
+    assert cache.get('{"a":"1234567"}') is None
+    assert cache.get('{"b":"1234567"}') == {"b": "1234567"}
+    assert cache.info()["length"] == 15
+
+
 async def test_lazy_state_handles_different_last_updated_and_last_changed(
     caplog: pytest.LogCaptureFixture,
 ) -> None:
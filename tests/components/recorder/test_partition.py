@@ -0,0 +1,238 @@
+"""Test partitioned tables of the recorder."""
+from datetime import UTC, date, datetime, timedelta
+import math
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+
+from homeassistant.components.recorder import migration
+from homeassistant.components.recorder.db_schema import Base, StateAttributes, States
+from homeassistant.components.recorder.partition import (
+    Partition,
+    create_default_partition_sql,
+    create_partition_sql,
+    get_partitioned_tables,
+    get_partitions,
+    missing_daily_partitions,
+    partitioned_schema,
+)
+from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+DAY_TS = datetime(2023, 10, 1, tzinfo=UTC).timestamp()
+
+
+def test_get_partitions() -> None:
+    """Test the bounds of the partitions are parsed."""
+    session = MagicMock()
+    session.execute.return_value = [
+        ("states_p20231002", "FOR VALUES FROM ('1696204800') TO ('1696291200')"),
+        ("states_default", "DEFAULT"),
+        ("states_old", "FOR VALUES FROM (MINVALUE) TO ('1696118400')"),
+        ("states_p20231001", "FOR VALUES FROM ('1696118400') TO ('1696204800')"),
+        ("states_future", "FOR VALUES FROM ('1696291200') TO (MAXVALUE)"),
+    ]
+    assert get_partitions(session, "states") == [
+        Partition("states_old", -math.inf, DAY_TS),
+        Partition("states_p20231001", DAY_TS, DAY_TS + 86400),
+        Partition("states_p20231002", DAY_TS + 86400, DAY_TS + 2 * 86400),
+        Partition("states_future", DAY_TS + 2 * 86400, math.inf),
+    ]
+
+
+def test_get_partitioned_tables() -> None:
+    """Test only tables partitioned by their timestamp column are returned."""
+    session = MagicMock()
+    session.execute.return_value = [
+        ("states", "RANGE (last_updated_ts)"),
+        ("events", "LIST (event_type_id)"),
+        ("other", "RANGE (created)"),
+    ]
+    assert get_partitioned_tables(session) == {"states"}
+
+
+def test_missing_daily_partitions() -> None:
+    """Test days covered by existing partitions are skipped."""
+    existing = [Partition("states_manual", DAY_TS + 86400, DAY_TS + 86400 + 3600)]
+    missing = missing_daily_partitions("states", existing, date(2023, 10, 1), 3)
+    assert missing == [
+        Partition("states_p20231001", DAY_TS, DAY_TS + 86400),
+        Partition("states_p20231003", DAY_TS + 2 * 86400, DAY_TS + 3 * 86400),
+    ]
+    assert create_partition_sql("states", missing[0]) == (
+        "CREATE TABLE IF NOT EXISTS states_p20231001 PARTITION OF states"
+        " FOR VALUES FROM (1696118400.0) TO (1696204800.0)"
+    )
+
+
+def test_partitioned_schema() -> None:
+    """Test the states and events tables are partitioned by their timestamp."""
+    metadata = partitioned_schema()
+    states = metadata.tables["states"]
+    assert list(states.primary_key.columns.keys()) == ["state_id", "last_updated_ts"]
+    assert {fk.parent.name for fk in states.foreign_keys} == {
+        "attributes_id",
+        "metadata_id",
+    }
+    events = metadata.tables["events"]
+    assert list(events.primary_key.columns.keys()) == ["event_id", "time_fired_ts"]
+
+    ddl = str(CreateTable(states).compile(dialect=postgresql.dialect()))
+    assert "state_id INTEGER GENERATED BY DEFAULT AS IDENTITY" in ddl
+    assert "PRIMARY KEY (state_id, last_updated_ts)" in ddl
+    assert ddl.rstrip().endswith("PARTITION BY RANGE (last_updated_ts)")
+    assert create_default_partition_sql("states") == (
+        "CREATE TABLE IF NOT EXISTS states_default PARTITION OF states DEFAULT"
+    )
+
+    # The schema of other databases is unchanged
+    assert list(States.__table__.primary_key.columns.keys()) == ["state_id"]
+    assert "old_state_id" in {fk.parent.name for fk in States.__table__.foreign_keys}
+
+
+def test_create_partitioned_schema() -> None:
+    """Test a new database is created with partitions for the next days."""
+    engine = create_engine("sqlite://")
+    # SQLite cannot create partitioned tables, only the statements are replaced
+    with patch.object(
+        migration,
+        "partitioned_schema",
+        return_value=Base.metadata,
+    ), patch.object(
+        migration,
+        "create_default_partition_sql",
+        side_effect=lambda table: f"CREATE TABLE {table}_default (x)",
+    ), patch.object(
+        migration,
+        "create_partition_sql",
+        side_effect=lambda table, partition: f"CREATE TABLE {partition.name} (x)",
+    ) as create_partition:
+        migration.create_partitioned_schema(engine, date(2023, 10, 1))
+        tables = set(inspect(engine).get_table_names())
+        assert set(Base.metadata.tables) < tables
+        assert {
+            "events_default",
+            "events_p20231001",
+            "events_p20231004",
+            "states_default",
+            "states_p20231001",
+            "states_p20231004",
+        } < tables
+
+        # Existing tables are left alone
+        create_partition.reset_mock()
+        migration.create_partitioned_schema(engine, date(2023, 10, 2))
+        assert not create_partition.called
+
+
+async def test_partition_tables_not_new_postgresql(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the partition_tables option only applies to new PostgreSQL databases."""
+    with patch.object(migration, "create_partitioned_schema") as create_schema:
+        instance = await async_setup_recorder_instance(hass, {"partition_tables": True})
+    assert instance.partition_tables
+    assert not create_schema.called
+    assert "The states and events tables are not partitioned" in caplog.text
+
+
+async def test_create_daily_partitions(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the daily partitions are created ahead of time."""
+    instance = await async_setup_recorder_instance(hass)
+    instance.partitioned_tables = {"states"}
+    today = date(2023, 10, 1)
+
+    with patch.object(
+        migration,
+        "get_partitions",
+        return_value=[Partition("states_manual", DAY_TS + 86400, DAY_TS + 2 * 86400)],
+    ), patch.object(
+        migration,
+        "create_partition_sql",
+        side_effect=lambda table, partition: f"CREATE TABLE {partition.name} (x)",
+    ):
+        await instance.async_add_executor_job(
+            migration.create_daily_partitions, instance, today
+        )
+
+    with session_scope(hass=hass, read_only=True) as session:
+        tables = {
+            name
+            for (name,) in session.execute(
+                text("SELECT name FROM sqlite_master WHERE name LIKE 'states_p%'")
+            )
+        }
+    assert tables == {"states_p20231001", "states_p20231003", "states_p20231004"}
+
+
+async def test_purge_drops_partitions(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test partitions older than purge_before are dropped by the purge."""
+    instance = await async_setup_recorder_instance(hass)
+    hass.states.async_set("test.old", "old", {"idx": 0})
+    await async_wait_recording_done(hass)
+    for idx in range(3):
+        hass.states.async_set("test.partition", str(idx), {"idx": idx})
+        await async_wait_recording_done(hass)
+        if idx == 0:
+            # Its state_id is between those of the states moved to the partition
+            hass.states.async_set("test.other", "other", {"idx": 0})
+            await async_wait_recording_done(hass)
+    assert "test.old" in instance.states_manager._last_committed_id
+
+    # Move the first states to a table standing in for an old partition,
+    # the foreign key constraints of a partitioned table have been dropped
+    with session_scope(hass=hass) as session:
+        session.execute(text("PRAGMA foreign_keys = OFF"))
+        session.execute(
+            text(
+                "CREATE TABLE states_p20231001 AS SELECT * FROM states"
+                " WHERE state IN ('0', '1', 'old')"
+            )
+        )
+        session.execute(text("DELETE FROM states WHERE state IN ('0', '1', 'old')"))
+
+    purge_before = dt_util.utcnow() - timedelta(days=1)
+    partitions = [
+        Partition("states_p20231001", -math.inf, purge_before.timestamp()),
+        Partition("states_p20231002", purge_before.timestamp(), math.inf),
+    ]
+    instance.partitioned_tables = {"states"}
+    with patch(
+        "homeassistant.components.recorder.purge.get_partitions",
+        return_value=partitions,
+    ):
+        assert await instance.async_add_executor_job(
+            purge_old_data, instance, purge_before, False
+        )
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert not session.execute(
+            text("SELECT name FROM sqlite_master WHERE name = 'states_p20231001'")
+        ).all()
+        states = session.query(States).all()
+        assert [state.state for state in states] == ["other", "2"]
+        assert states[1].old_state_id is None
+        attributes = {
+            attributes.shared_attrs
+            for attributes in session.query(StateAttributes).all()
+        }
+        assert attributes == {'{"idx":0}', '{"idx":2}'}
+
+    assert "test.partition" in instance.states_manager._last_committed_id
+    assert "test.other" in instance.states_manager._last_committed_id
+    assert "test.old" not in instance.states_manager._last_committed_id
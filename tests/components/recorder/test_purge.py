@@ -10,6 +10,7 @@ from sqlalchemy.exc import DatabaseError, OperationalError
 from sqlalchemy.orm.session import Session
 
 from homeassistant.components import recorder
+from homeassistant.components.recorder import history
 from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.components.recorder.db_schema import (
     Events,
@@ -22,7 +23,7 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import PurgeProgress, purge_old_data
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -999,6 +1000,33 @@ async def test_purge_filtered_states_to_empty(
     await async_wait_purge_done(hass)
 
 
+async def test_purge_filtered_states_evicts_recent_states(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the recent states of filtered entities are dropped with their rows."""
+    instance = await async_setup_recorder_instance(hass)
+    for state in ("on", "off"):
+        start = dt_util.utcnow()
+        hass.states.async_set("sensor.excluded", state)
+        hass.states.async_set("sensor.included", state)
+        await async_wait_recording_done(hass)
+
+    def _get_cached(entity_id: str):
+        return history.get_significant_states_from_cache(hass, start, None, [entity_id])
+
+    assert await instance.async_add_executor_job(_get_cached, "sensor.excluded")
+
+    instance.entity_filter = lambda entity_id: entity_id != "sensor.excluded"
+    await hass.services.async_call(
+        recorder.DOMAIN, SERVICE_PURGE, {"keep_days": 10, "apply_filter": True}
+    )
+    await async_recorder_block_till_done(hass)
+    await async_wait_purge_done(hass)
+
+    assert await instance.async_add_executor_job(_get_cached, "sensor.excluded") is None
+    assert await instance.async_add_executor_job(_get_cached, "sensor.included")
+
+
 @pytest.mark.parametrize("use_sqlite", (True, False), indirect=True)
 async def test_purge_without_state_attributes_filtered_states_to_empty(
     async_setup_recorder_instance: RecorderInstanceGenerator,
@@ -1440,6 +1468,114 @@ async def test_purge_entities(
         assert states.count() == 0
 
 
+def test_purge_progress_tunes_batches() -> None:
+    """Test the batches per purge run are tuned to the time budget."""
+    progress = PurgeProgress()
+    purge_before = dt_util.utcnow()
+
+    progress.record_run(purge_before, 4.0, False)
+    assert (progress.states_batches, progress.events_batches) == (10, 8)
+    progress.record_run(purge_before, 1.0, False)
+    assert (progress.states_batches, progress.events_batches) == (10, 8)
+    progress.record_run(purge_before, 100.0, False)
+    assert (progress.states_batches, progress.events_batches) == (5, 4)
+    # Finished runs include cleanups, their time is not used for tuning
+    progress.record_run(purge_before, 100.0, True)
+    assert (progress.states_batches, progress.events_batches) == (5, 4)
+    assert progress.purged_before == purge_before
+    progress.record_run(purge_before, 0.1, False)
+    assert (progress.states_batches, progress.events_batches) == (10, 8)
+    progress.record_run(purge_before, 0.1, False)
+    assert (progress.states_batches, progress.events_batches) == (20, 15)
+    assert progress.as_dict()["runs"] == 6
+
+
+@pytest.mark.parametrize("enable_nightly_purge", [True])
+async def test_incremental_purge(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test old data is purged incrementally while the recorder is idle."""
+    instance = await async_setup_recorder_instance(hass)
+    await _add_test_states(hass)
+    progress = instance.purge_progress
+
+    instance._async_incremental_purge()
+    assert progress.in_progress
+    await async_wait_recording_done(hass)
+
+    assert not progress.in_progress
+    assert progress.purged_before is not None
+    assert progress.as_dict()["states_purged"] == 2
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 4
+
+    # Nothing is queued until there is an hour of data to purge
+    instance._async_incremental_purge()
+    assert not progress.in_progress
+    with freeze_time(dt_util.utcnow() + timedelta(hours=1)):
+        instance._async_incremental_purge()
+    assert progress.in_progress
+    await async_wait_recording_done(hass)
+    assert not progress.in_progress
+
+
+@pytest.mark.parametrize("enable_nightly_purge", [True])
+async def test_incremental_purge_after_error(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test a purge which raises does not stop later incremental purges."""
+    instance = await async_setup_recorder_instance(hass)
+    progress = instance.purge_progress
+
+    with patch(
+        "homeassistant.components.recorder.purge.purge_old_data",
+        side_effect=ValueError,
+    ), patch("homeassistant.components.recorder.core.Recorder.is_idle", True):
+        instance._async_incremental_purge()
+        assert progress.in_progress
+        await async_wait_recording_done(hass)
+    assert not progress.in_progress
+
+    with patch(
+        "homeassistant.components.recorder.purge.purge_old_data", return_value=True
+    ) as purge_old_data, patch(
+        "homeassistant.components.recorder.core.Recorder.is_idle", True
+    ):
+        instance._async_incremental_purge()
+        await async_wait_recording_done(hass)
+    assert len(purge_old_data.mock_calls) == 1
+    assert not progress.in_progress
+
+
+@pytest.mark.parametrize("enable_nightly_purge", [True])
+async def test_nightly_purge_stops_incremental_purge(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the incremental purge does not run alongside the nightly purge."""
+    instance = await async_setup_recorder_instance(hass)
+    progress = instance.purge_progress
+
+    with patch(
+        "homeassistant.components.recorder.purge.purge_old_data", return_value=True
+    ) as purge_old_data:
+        # An incremental purge run queued before the nightly purge
+        progress.in_progress = progress.nightly_purge = True
+        instance.queue_task(
+            PurgeTask(
+                dt_util.utcnow(), repack=False, apply_filter=False, incremental=True
+            )
+        )
+        instance.queue_task(
+            PurgeTask(dt_util.utcnow(), repack=False, apply_filter=False, nightly=True)
+        )
+        await async_wait_recording_done(hass)
+
+    assert len(purge_old_data.mock_calls) == 1
+    assert purge_old_data.call_args[0][1] == progress.purged_before
+    assert not progress.nightly_purge
+    assert not progress.in_progress
+
+
 async def _add_test_states(hass: HomeAssistant, wait_recording_done: bool = True):
     """Add multiple states to the db for testing."""
     utcnow = dt_util.utcnow()
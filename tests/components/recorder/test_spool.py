@@ -0,0 +1,138 @@
+"""Test the recorder event spool."""
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+from sqlalchemy.exc import OperationalError
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder.db_schema import States, StatesMeta
+from homeassistant.components.recorder.spool import EventSpool
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, HomeAssistant, State
+import homeassistant.util.dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+def test_spool_round_trip(tmp_path: Path) -> None:
+    """Test events are read back from the spool as they were appended."""
+    spool = EventSpool(str(tmp_path / "spool"), max_segment_bytes=1)
+    now = dt_util.utcnow()
+    context = Context(user_id="user", parent_id="parent")
+    new_state = State(
+        "sensor.test",
+        "on",
+        {"friendly_name": "Test", "nested": {"a": [1, 2]}},
+        now - timedelta(minutes=5),
+        now,
+        context,
+    )
+    state_event = Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.test", "old_state": None, "new_state": new_state},
+        EventOrigin.local,
+        now,
+        context,
+    )
+    removed_event = Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.removed", "old_state": new_state, "new_state": None},
+        time_fired=now,
+    )
+    custom_event = Event("custom", {"value": 1.5}, EventOrigin.remote, now)
+
+    for event in (state_event, removed_event, custom_event):
+        spool.append(event)
+
+    segments = spool.segments
+    assert len(segments) == 3
+    events = [event for segment in segments for event in spool.read_segment(segment)]
+
+    assert events[0].data["new_state"].as_dict() == new_state.as_dict()
+    assert events[0].data["new_state"].context.parent_id == "parent"
+    assert events[0].time_fired == now
+    assert events[0].context.as_dict() == context.as_dict()
+    assert events[1].data == {
+        "entity_id": "sensor.removed",
+        "old_state": None,
+        "new_state": None,
+    }
+    assert events[2].as_dict() == custom_event.as_dict()
+
+    for segment in segments:
+        spool.remove_segment(segment)
+    assert spool.segments == []
+    spool.close()
+
+    # Segments left by a previous run are found again
+    spool.append(custom_event)
+    spool.close()
+    assert len(EventSpool(str(tmp_path / "spool")).segments) == 1
+
+
+def test_spool_max_bytes(tmp_path: Path) -> None:
+    """Test events are dropped once the spool is full."""
+    spool = EventSpool(str(tmp_path), max_bytes=200)
+    for idx in range(10):
+        spool.append(Event("custom", {"idx": idx}))
+
+    assert 0 < spool.dropped < 10
+    events = spool.read_segment(spool.segments[0])
+    assert len(events) == 10 - spool.dropped
+    assert [event.data["idx"] for event in events] == list(range(len(events)))
+
+
+async def test_recorder_spools_while_database_unavailable(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    tmp_path: Path,
+) -> None:
+    """Test events are spooled while commits fail and replayed afterwards."""
+    with patch.object(recorder, "DEFAULT_SPOOL_DIR", str(tmp_path)):
+        instance = await async_setup_recorder_instance(
+            hass,
+            {
+                recorder.CONF_COMMIT_INTERVAL: 0,
+                recorder.CONF_DB_RETRY_WAIT: 0,
+                recorder.CONF_SPOOL: True,
+            },
+        )
+    assert instance.spool is not None
+
+    with patch.object(
+        instance,
+        "_commit_event_session",
+        side_effect=OperationalError("statement", {}, []),
+    ):
+        hass.states.async_set("test.spool", "1")
+        await async_wait_recording_done(hass)
+        hass.states.async_set("test.spool", "2")
+        await async_wait_recording_done(hass)
+
+    assert instance.spooling
+    assert len(instance.spool.segments) == 1
+
+    # The spool is only replayed after the probe interval
+    hass.states.async_set("test.spool", "3")
+    await async_wait_recording_done(hass)
+    assert instance.spooling
+
+    instance._next_spool_probe = 0
+    hass.states.async_set("test.spool", "4")
+    await async_wait_recording_done(hass)
+    assert not instance.spooling
+    assert instance.spool.segments == []
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = [
+            state
+            for (state,) in session.query(States.state)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == "test.spool")
+            .order_by(States.last_updated_ts)
+        ]
+    assert states == ["1", "2", "3", "4"]
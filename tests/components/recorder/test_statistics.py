@@ -2393,3 +2393,126 @@ def test_change_with_none(
     assert stats == {}
 
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+
+
+@pytest.mark.parametrize(
+    ("reduce", "period"),
+    [
+        (statistics._reduce_statistics_per_day, "day"),
+        (statistics._reduce_statistics_per_month, "month"),
+    ],
+)
+async def test_reduce_statistics(
+    hass: HomeAssistant, reduce: Callable, period: str
+) -> None:
+    """Test reducing hourly statistics across a DST change."""
+    hass.config.set_time_zone("Europe/Amsterdam")
+    start = dt_util.as_utc(dt_util.parse_datetime("2023-10-28 00:00:00+02:00"))
+    stat_list = []
+    for hour in range(73):
+        row_start = (start + timedelta(hours=hour)).timestamp()
+        stat_list.append(
+            {
+                "start": row_start,
+                "end": row_start + 3600,
+                # Only some hours have a mean
+                "mean": float(hour) if hour % 3 else None,
+                "min": float(hour),
+                "max": float(hour + 1),
+                "last_reset": None,
+                "state": float(hour),
+                "sum": float(hour * 2),
+            }
+        )
+    types = {"last_reset", "max", "mean", "min", "state", "sum"}
+
+    rows = reduce({"sensor.test": stat_list}, types)["sensor.test"]
+
+    # 2023-10-29 has 25 hours in Europe/Amsterdam
+    sizes = [24, 25, 24] if period == "day" else [73]
+    assert len(rows) == len(sizes)
+    first = 0
+    for row, size in zip(rows, sizes):
+        hours = range(first, first + size)
+        means = [float(hour) for hour in hours if hour % 3]
+        assert row == {
+            "start": stat_list[first]["start"]
+            if period == "day"
+            else dt_util.as_utc(
+                dt_util.parse_datetime("2023-10-01 00:00:00+02:00")
+            ).timestamp(),
+            "end": stat_list[first + size - 1]["end"]
+            if period == "day"
+            else dt_util.as_utc(
+                dt_util.parse_datetime("2023-11-01 00:00:00+01:00")
+            ).timestamp(),
+            "mean": pytest.approx(sum(means) / len(means)),
+            "min": float(first),
+            "max": float(first + size),
+            "last_reset": None,
+            "state": float(first + size - 1),
+            "sum": float((first + size - 1) * 2),
+        }
+        first += size
+
+
+@pytest.mark.parametrize("period", ["day", "week", "month"])
+@pytest.mark.parametrize("end_time", ["2023-12-10 12:00:00+01:00", None])
+@pytest.mark.freeze_time("2023-12-20 00:00:00+00:00")
+def test_statistics_during_period_reduced_by_database(
+    hass_recorder: Callable[..., HomeAssistant], period: str, end_time: str | None
+) -> None:
+    """Test statistics reduced by the database match the ones reduced in Python."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Amsterdam"))
+    hass = hass_recorder()
+    wait_recording_done(hass)
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2023-10-20 00:00:00+02:00"))
+    for statistic_id, has_mean, has_sum in (
+        ("test:mean", True, False),
+        ("test:sum", False, True),
+    ):
+        external_statistics = []
+        for hour in range(24 * 50):
+            row = {"start": start + timedelta(hours=hour)}
+            if has_mean:
+                row["mean"] = float(hour % 17) if hour % 5 else None
+                row["min"] = float(hour % 13)
+                row["max"] = float(hour % 19)
+            if has_sum:
+                row["last_reset"] = start + timedelta(days=hour // 240)
+                row["state"] = float(hour % 240)
+                row["sum"] = float(hour)
+            external_statistics.append(row)
+        external_metadata = {
+            "has_mean": has_mean,
+            "has_sum": has_sum,
+            "name": None,
+            "source": "test",
+            "statistic_id": statistic_id,
+            "unit_of_measurement": "kWh",
+        }
+        async_add_external_statistics(hass, external_metadata, external_statistics)
+    wait_recording_done(hass)
+
+    query_start = dt_util.parse_datetime("2023-10-25 12:00:00+02:00")
+    query_end = end_time and dt_util.parse_datetime(end_time)
+    with patch.object(
+        statistics,
+        "_statistics_during_period_reduced_in_python",
+        side_effect=AssertionError,
+    ):
+        stats = statistics_during_period(hass, query_start, query_end, period=period)
+    with patch.object(statistics, "MAX_PERIOD_BUCKETS", 0):
+        expected_stats = statistics_during_period(
+            hass, query_start, query_end, period=period
+        )
+
+    assert stats.keys() == {"test:mean", "test:sum"}
+    assert stats.keys() == expected_stats.keys()
+    for statistic_id, rows in stats.items():
+        assert len(rows) == len(expected_stats[statistic_id])
+        for row, expected_row in zip(rows, expected_stats[statistic_id]):
+            assert row == pytest.approx(expected_row)
+
+    dt_util.set_default_time_zone(ORIG_TZ)
@@ -11,6 +11,7 @@ import pytest
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.db_schema import Statistics, StatisticsShortTerm
+from homeassistant.components.recorder.models.state_attributes import DECODED_JSON_CACHE
 from homeassistant.components.recorder.statistics import (
     async_add_external_statistics,
     get_last_statistics,
@@ -19,6 +20,9 @@ from homeassistant.components.recorder.statistics import (
     get_short_term_statistics_run_cache,
     list_statistic_ids,
 )
+from homeassistant.components.recorder.statistics_cache import (
+    async_get_statistics_cache,
+)
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.recorder.websocket_api import UNIT_SCHEMA
 from homeassistant.components.sensor import UNIT_CONVERTERS
@@ -217,6 +221,144 @@ async def test_statistics_during_period(
     }
 
 
+async def test_statistics_during_period_hourly_cached(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test statistics_during_period serves compiled hours from the cache."""
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+
+    period1 = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 00:00:00"))
+    period2 = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 01:00:00"))
+    metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass,
+        metadata,
+        (
+            {"start": period1, "last_reset": None, "state": 0, "sum": 2},
+            {"start": period2, "last_reset": None, "state": 1, "sum": 3},
+        ),
+    )
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    msg = {
+        "type": "recorder/statistics_during_period",
+        "start_time": period1.isoformat(),
+        "end_time": "2021-09-02T00:00:00+00:00",
+        "statistic_ids": ["test:total_energy_import"],
+        "period": "hour",
+        "types": ["sum"],
+    }
+    expected = {
+        "test:total_energy_import": [
+            {
+                "start": int(period1.timestamp() * 1000),
+                "end": int((period1 + timedelta(hours=1)).timestamp() * 1000),
+                "sum": 2.0,
+            },
+            {
+                "start": int(period2.timestamp() * 1000),
+                "end": int((period2 + timedelta(hours=1)).timestamp() * 1000),
+                "sum": 3.0,
+            },
+        ]
+    }
+    statistics_during_period = recorder.statistics.statistics_during_period
+    with patch.object(
+        recorder.statistics,
+        "statistics_during_period",
+        wraps=statistics_during_period,
+    ) as statistics_during_period_mock:
+        await client.send_json({"id": 1, **msg})
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"] == expected
+        assert statistics_during_period_mock.call_count == 1
+
+        # The whole range has been compiled, it is served from the cache
+        await client.send_json({"id": 2, **msg})
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"] == expected
+        assert statistics_during_period_mock.call_count == 1
+
+        # Importing statistics invalidates the cache
+        async_add_external_statistics(
+            hass,
+            metadata,
+            ({"start": period2, "last_reset": None, "state": 1, "sum": 4},),
+        )
+        await async_wait_recording_done(hass)
+        await client.send_json({"id": 3, **msg})
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"]["test:total_energy_import"][1]["sum"] == 4.0
+        assert statistics_during_period_mock.call_count == 2
+
+
+async def test_statistics_during_period_hourly_cache_bounded(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the hourly statistics cache is bounded by the rows it holds."""
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+
+    period1 = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 00:00:00"))
+    period2 = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 01:00:00"))
+    end = dt_util.as_utc(dt_util.parse_datetime("2021-09-02 00:00:00"))
+    for statistic_id in ("test:one", "test:two"):
+        async_add_external_statistics(
+            hass,
+            {
+                "has_mean": False,
+                "has_sum": True,
+                "name": None,
+                "source": "test",
+                "statistic_id": statistic_id,
+                "unit_of_measurement": "kWh",
+            },
+            (
+                {"start": period1, "last_reset": None, "state": 0, "sum": 2},
+                {"start": period2, "last_reset": None, "state": 1, "sum": 3},
+            ),
+        )
+    await async_wait_recording_done(hass)
+
+    cache = async_get_statistics_cache(hass)
+    cache.max_rows = 12
+
+    async def _query(statistic_ids: set[str], start=period1) -> None:
+        await recorder_mock.async_add_executor_job(
+            cache.hourly_statistics_during_period,
+            start,
+            end,
+            statistic_ids,
+            None,
+            {"sum"},
+        )
+
+    await _query({"test:one"})
+    await _query({"test:two"})
+    assert cache.rows == 4
+    # Results holding more than a share of the rows are not cached
+    await _query({"test:one", "test:two"})
+    assert cache.rows == 4
+    # The least recently used queries are evicted to stay within the rows
+    cache.max_rows = 5
+    await _query({"test:one"}, period2)
+    assert cache.rows == 5
+    await _query({"test:two"}, period2)
+    assert cache.rows == 4
+
+
 @pytest.mark.freeze_time(datetime.datetime(2022, 10, 21, 7, 25, tzinfo=datetime.UTC))
 @pytest.mark.parametrize("offset", (0, 1, 2))
 async def test_statistic_during_period(
@@ -2154,6 +2296,7 @@ async def test_recorder_info(
 
     # Ensure there are no queued events
     await async_wait_recording_done(hass)
+    DECODED_JSON_CACHE.clear()
 
     await client.send_json({"id": 1, "type": "recorder/info"})
     response = await client.receive_json()
@@ -2165,6 +2308,31 @@ async def test_recorder_info(
         "migration_is_live": False,
         "recording": True,
         "thread_running": True,
+        "recent_history_cache": {
+            "entities": 0,
+            "rows": 0,
+            "hits": 0,
+            "misses": 0,
+            "hit_rate": None,
+        },
+        "decoded_attributes_cache": {
+            "size": 0,
+            "length": 0,
+            "hits": 0,
+            "misses": 0,
+            "hit_rate": None,
+        },
+        "purge": {
+            "in_progress": False,
+            "purged_before": None,
+            "runs": 0,
+            "states_purged": 0,
+            "events_purged": 0,
+            "rows_per_second": None,
+            "last_run_seconds": None,
+            "states_batches": 20,
+            "events_batches": 15,
+        },
     }
 
 
@@ -498,6 +498,91 @@ async def test_reload_unchanged_script(
         assert len(calls) == 2
 
 
+@pytest.mark.parametrize(
+    "script_config",
+    (
+        {"sequence": [{"service": "test.script"}]},
+        {
+            "use_blueprint": {
+                "path": "test_service.yaml",
+                "input": {"service_to_call": "test.script"},
+            }
+        },
+    ),
+)
+async def test_reload_reuses_validated_config(
+    hass: HomeAssistant, calls, script_config
+) -> None:
+    """Test only new or changed scripts are validated at reload."""
+    with patch(
+        "homeassistant.components.script.config._async_validate_config_item",
+        wraps=script.config._async_validate_config_item,
+    ) as validate_config_item:
+        config = {script.DOMAIN: {"test": script_config}}
+        assert await async_setup_component(hass, script.DOMAIN, config)
+        assert validate_config_item.call_count == 1
+        validate_config_item.reset_mock()
+
+        # Reload the scripts with an unchanged and an added script
+        added_config = {"sequence": [{"service": "test.script"}]}
+        with patch(
+            "homeassistant.config.load_yaml_config_file",
+            autospec=True,
+            return_value={
+                script.DOMAIN: {"test": dict(script_config), "added": added_config}
+            },
+        ):
+            await hass.services.async_call(script.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+        assert validate_config_item.call_count == 1
+        assert validate_config_item.call_args[0][1] == "added"
+
+    assert hass.states.get(ENTITY_ID) is not None
+    assert hass.states.get("script.added") is not None
+
+
+@pytest.mark.parametrize(
+    ("registry_event", "event_data"),
+    (
+        (
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            {"action": "update", "entity_id": "light.kitchen", "changes": {}},
+        ),
+        (
+            dr.EVENT_DEVICE_REGISTRY_UPDATED,
+            {"action": "remove", "device_id": "abcd"},
+        ),
+    ),
+)
+async def test_reload_revalidates_after_registry_update(
+    hass: HomeAssistant, registry_event, event_data
+) -> None:
+    """Test validated configs are not reused after a registry update."""
+    script_config = {"sequence": [{"service": "test.script"}]}
+    with patch(
+        "homeassistant.components.script.config._async_validate_config_item",
+        wraps=script.config._async_validate_config_item,
+    ) as validate_config_item:
+        config = {script.DOMAIN: {"test": script_config}}
+        assert await async_setup_component(hass, script.DOMAIN, config)
+        assert validate_config_item.call_count == 1
+        validate_config_item.reset_mock()
+
+        hass.bus.async_fire(registry_event, event_data)
+        await hass.async_block_till_done()
+
+        with patch(
+            "homeassistant.config.load_yaml_config_file",
+            autospec=True,
+            return_value={script.DOMAIN: {"test": dict(script_config)}},
+        ):
+            await hass.services.async_call(script.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+        assert validate_config_item.call_count == 1
+
+    assert hass.states.get(ENTITY_ID) is not None
+
+
 async def test_service_descriptions(hass: HomeAssistant) -> None:
     """Test that service descriptions are loaded and reloaded correctly."""
     # Test 1: has "description" but no "fields"
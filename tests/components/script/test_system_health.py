@@ -0,0 +1,38 @@
+"""Test script system health."""
+from unittest.mock import patch
+
+from homeassistant.components import script
+from homeassistant.const import SERVICE_RELOAD
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from tests.common import get_system_health_info
+
+
+async def test_system_health_info(hass: HomeAssistant) -> None:
+    """Test the reload statistics are reported to system health."""
+    assert await async_setup_component(hass, "system_health", {})
+    script_config = {"sequence": [{"service": "test.script"}]}
+    assert await async_setup_component(
+        hass, script.DOMAIN, {script.DOMAIN: {"test": script_config}}
+    )
+    await hass.async_block_till_done()
+
+    info = await get_system_health_info(hass, script.DOMAIN)
+    assert info == {"kept": 0, "removed": 0, "created": 1}
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={script.DOMAIN: {"added": script_config}},
+    ):
+        await hass.services.async_call(script.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    info = await get_system_health_info(hass, script.DOMAIN)
+    assert info == {
+        "kept": 0,
+        "removed": 1,
+        "created": 1,
+        "reload_duration": info["reload_duration"],
+    }
+    assert info["reload_duration"] >= 0
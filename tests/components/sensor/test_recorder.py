@@ -5193,3 +5193,122 @@ async def test_exclude_attributes(
     assert len(states) == 1
     assert ATTR_OPTIONS not in states[0].attributes
     assert ATTR_FRIENDLY_NAME in states[0].attributes
+
+
+async def test_compile_statistics_from_recorded_states(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test statistics are compiled from recorded states without the history."""
+    period0 = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) + timedelta(
+        hours=1
+    )
+    period1 = period0 + timedelta(minutes=5)
+    period2 = period0 + timedelta(minutes=10)
+    energy_attributes = {
+        "device_class": "energy",
+        "state_class": "total_increasing",
+        "unit_of_measurement": "kWh",
+    }
+    freezer.move_to(period0)
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+
+    async def set_states(
+        time: datetime, power: float | None, energy: float | None
+    ) -> None:
+        freezer.move_to(time)
+        if power is not None:
+            hass.states.async_set("sensor.power", power, POWER_SENSOR_ATTRIBUTES)
+        if energy is not None:
+            hass.states.async_set("sensor.energy", energy, energy_attributes)
+        await async_wait_recording_done(hass)
+
+    async def compile_statistics(start: datetime) -> int:
+        freezer.move_to(start + timedelta(minutes=5, seconds=10))
+        with patch.object(
+            history,
+            "get_full_significant_states_with_session",
+            wraps=history.get_full_significant_states_with_session,
+        ) as get_history:
+            do_adhoc_statistics(hass, start=start)
+            await async_wait_recording_done(hass)
+        return get_history.call_count
+
+    await set_states(period0 + timedelta(minutes=1), 10, 10)
+    # Neither sensor was followed from the start of the first period
+    assert await compile_statistics(period0) == 2
+
+    await set_states(period1 + timedelta(minutes=1), 20, 15)
+    await set_states(period1 + timedelta(minutes=2), None, 5)
+    await set_states(period1 + timedelta(minutes=3), 30, None)
+    assert await compile_statistics(period1) == 0
+
+    await set_states(period2 + timedelta(minutes=1), None, 8)
+    assert await compile_statistics(period2) == 0
+
+    stats = statistics_during_period(hass, period0, period="5minute")
+    assert stats["sensor.power"][1:] == [
+        {
+            "start": period1.timestamp(),
+            "end": period2.timestamp(),
+            "mean": pytest.approx(22.0),
+            "min": pytest.approx(10.0),
+            "max": pytest.approx(30.0),
+            "last_reset": None,
+            "state": None,
+            "sum": None,
+        },
+        {
+            "start": period2.timestamp(),
+            "end": (period2 + timedelta(minutes=5)).timestamp(),
+            "mean": pytest.approx(30.0),
+            "min": pytest.approx(30.0),
+            "max": pytest.approx(30.0),
+            "last_reset": None,
+            "state": None,
+            "sum": None,
+        },
+    ]
+    assert [(stat["state"], stat["sum"]) for stat in stats["sensor.energy"]] == [
+        (10.0, 0.0),
+        (5.0, 10.0),
+        (8.0, 13.0),
+    ]
+
+
+async def test_compile_statistics_recorded_states_adjusted_sum(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the sum is compiled from the history after statistics were adjusted."""
+    period0 = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) + timedelta(
+        hours=1
+    )
+    period1 = period0 + timedelta(minutes=5)
+    period2 = period0 + timedelta(minutes=10)
+    freezer.move_to(period0)
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+
+    for time, state in ((period0, 10), (period1, 12), (period2, 15)):
+        freezer.move_to(time + timedelta(minutes=1))
+        hass.states.async_set("sensor.energy", state, ENERGY_SENSOR_ATTRIBUTES)
+        await async_wait_recording_done(hass)
+        freezer.move_to(time + timedelta(minutes=5, seconds=10))
+        if time == period2:
+            recorder_mock.async_adjust_statistics("sensor.energy", period1, 100, "kWh")
+        with patch.object(
+            history,
+            "get_full_significant_states_with_session",
+            wraps=history.get_full_significant_states_with_session,
+        ) as get_history:
+            do_adhoc_statistics(hass, start=time)
+            await async_wait_recording_done(hass)
+        assert get_history.call_count == (0 if time == period1 else 1)
+
+    stats = statistics_during_period(hass, period0, period="5minute")
+    assert [(stat["state"], stat["sum"]) for stat in stats["sensor.energy"]] == [
+        (10.0, 0.0),
+        (12.0, 102.0),
+        (15.0, 105.0),
+    ]
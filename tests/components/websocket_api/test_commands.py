@@ -20,10 +20,11 @@ from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAG
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, update_coordinator
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
+from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -31,6 +32,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -2374,6 +2376,74 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_entity_poll_statistics(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test the poll statistics of the entity platforms."""
+    platform = MockEntityPlatform(hass)
+    ent = MockEntity(should_poll=True)
+    await platform.async_add_entities([ent])
+    async_fire_time_changed(hass, dt_util.utcnow() + datetime.timedelta(seconds=15))
+    await hass.async_block_till_done()
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "entity_platform/poll_statistics"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == {
+        "test_domain.test_platform": {
+            "count": 1,
+            "total": ANY,
+            "skipped": 0,
+            "histogram": ANY,
+        }
+    }
+    assert sum(msg["result"]["test_domain.test_platform"]["histogram"].values()) == 1
+
+
+async def test_update_coordinator_statistics(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test the refresh statistics of the update coordinators."""
+    coordinator = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        logging.getLogger(__name__),
+        name="test",
+        update_method=AsyncMock(return_value=1),
+        update_interval=datetime.timedelta(seconds=30),
+        fetch_key="account",
+    )
+    await coordinator.async_refresh()
+
+    await websocket_client.send_json({"id": 7, "type": "update_coordinator/statistics"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == {
+        "coordinators": [
+            {
+                "name": "test",
+                "domain": None,
+                "entry_id": None,
+                "update_interval": 30.0,
+                "refreshes": 1,
+                "failures": 0,
+                "skipped": 0,
+                "total_duration": ANY,
+                "duration": {"p50": ANY, "p90": ANY, "p99": ANY, "max": ANY},
+                "data_age": ANY,
+            }
+        ],
+        "shared_fetches": {
+            "account": {"coordinators": 1, "fetches": 1, "deduplicated": 0}
+        },
+    }
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     (
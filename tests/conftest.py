@@ -63,6 +63,7 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import BASE_PLATFORMS, async_setup_component
 from homeassistant.util import dt as dt_util, location
 from homeassistant.util.json import json_loads
+from homeassistant.util.yaml.cache import YAML_CACHE
 
 from .ignore_uncaught_exceptions import IGNORE_UNCAUGHT_EXCEPTIONS
 from .syrupy import HomeAssistantSnapshotExtension
@@ -383,6 +384,13 @@ def reset_hass_threading_local_object() -> Generator[None, None, None]:
     ha._hass.__dict__.clear()
 
 
+@pytest.fixture(autouse=True)
+def clear_yaml_cache() -> Generator[None, None, None]:
+    """Clear the YAML cache so files can not leak between test cases."""
+    yield
+    YAML_CACHE.clear()
+
+
 @pytest.fixture(autouse=True)
 def bcrypt_cost() -> Generator[None, None, None]:
     """Run with reduced rounds during tests, to speed up uses."""
@@ -1307,6 +1315,9 @@ def hass_recorder(
 
     hass = get_test_home_assistant()
     nightly = recorder.Recorder.async_nightly_tasks if enable_nightly_purge else None
+    incremental_purge = (
+        recorder.Recorder._async_incremental_purge if enable_nightly_purge else None
+    )
     stats = recorder.Recorder.async_periodic_statistics if enable_statistics else None
     compile_missing = (
         recorder.Recorder._schedule_compile_missing_statistics
@@ -1340,6 +1351,10 @@ def hass_recorder(
         "homeassistant.components.recorder.Recorder.async_nightly_tasks",
         side_effect=nightly,
         autospec=True,
+    ), patch(
+        "homeassistant.components.recorder.Recorder._async_incremental_purge",
+        side_effect=incremental_purge,
+        autospec=True,
     ), patch(
         "homeassistant.components.recorder.Recorder.async_periodic_statistics",
         side_effect=stats,
@@ -1434,6 +1449,9 @@ async def async_setup_recorder_instance(
     from .components.recorder.common import async_recorder_block_till_done
 
     nightly = recorder.Recorder.async_nightly_tasks if enable_nightly_purge else None
+    incremental_purge = (
+        recorder.Recorder._async_incremental_purge if enable_nightly_purge else None
+    )
     stats = recorder.Recorder.async_periodic_statistics if enable_statistics else None
     schema_validate = (
         migration._find_schema_errors
@@ -1467,6 +1485,10 @@ async def async_setup_recorder_instance(
         "homeassistant.components.recorder.Recorder.async_nightly_tasks",
         side_effect=nightly,
         autospec=True,
+    ), patch(
+        "homeassistant.components.recorder.Recorder._async_incremental_purge",
+        side_effect=incremental_purge,
+        autospec=True,
     ), patch(
         "homeassistant.components.recorder.Recorder.async_periodic_statistics",
         side_effect=stats,
@@ -15,6 +15,7 @@ from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    ATTR_ICON,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
@@ -1666,3 +1667,110 @@ async def test_change_entity_id(
     assert len(result) == 2
     assert len(ent.added_calls) == 3
     assert len(ent.remove_calls) == 2
+
+
+async def test_static_attributes(hass: HomeAssistant) -> None:
+    """Test static attributes are cached until an attribute they depend on is set."""
+
+    class StaticEntity(entity.Entity):
+        """Entity with static attributes."""
+
+        _attr_icon = "mdi:one"
+        _attr_name = "Static"
+        calls = 0
+
+        @property
+        def attribution(self) -> str:
+            """Return the attribution, which is not static."""
+            self.calls += 1
+            return f"Attribution {self.calls}"
+
+    ent = StaticEntity()
+    platform = MockEntityPlatform(hass, domain="test")
+    await platform.async_add_entities([ent])
+
+    with patch.object(
+        StaticEntity, "icon", new_callable=PropertyMock, return_value="mdi:two"
+    ) as icon:
+        ent.async_write_ha_state()
+        ent.async_write_ha_state()
+    assert icon.call_count == 0
+    state = hass.states.get(ent.entity_id)
+    assert state.attributes == {
+        ATTR_ATTRIBUTION: "Attribution 3",
+        ATTR_FRIENDLY_NAME: "Static",
+        ATTR_ICON: "mdi:one",
+    }
+
+    ent._attr_icon = "mdi:three"
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes[ATTR_ICON] == "mdi:three"
+
+    ent._attr_extra_state_attributes = {ATTR_FRIENDLY_NAME: "Overridden"}
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes[ATTR_FRIENDLY_NAME] == "Static"
+
+    ent._attr_name = "Renamed"
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes[ATTR_FRIENDLY_NAME] == "Renamed"
+
+    class CustomIconEntity(entity.Entity):
+        """Entity with a static icon property."""
+
+        _static_properties = frozenset({"icon"})
+        custom_icon = "mdi:four"
+
+        @property
+        def icon(self) -> str:
+            """Return the icon, which only changes when invalidated."""
+            return self.custom_icon
+
+    ent = CustomIconEntity()
+    await platform.async_add_entities([ent])
+    assert hass.states.get(ent.entity_id).attributes[ATTR_ICON] == "mdi:four"
+
+    ent.custom_icon = "mdi:five"
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes[ATTR_ICON] == "mdi:four"
+    ent.async_invalidate_static_attributes()
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes[ATTR_ICON] == "mdi:five"
+
+
+async def test_static_attributes_without_platform(hass: HomeAssistant) -> None:
+    """Test static attributes are not cached for entities without a platform."""
+    ent = entity.Entity()
+    ent.entity_id = "test.no_platform"
+    ent.hass = hass
+    ent.async_write_ha_state()
+    assert ATTR_DEVICE_CLASS not in hass.states.get(ent.entity_id).attributes
+
+    with patch.object(
+        entity.Entity, "device_class", new_callable=PropertyMock, return_value="test"
+    ):
+        ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes[ATTR_DEVICE_CLASS] == "test"
+
+
+async def test_static_attributes_shared_between_states(hass: HomeAssistant) -> None:
+    """Test states of entities with only static attributes share their attributes."""
+    ent = entity.Entity()
+    ent._attr_name = "Shared"
+    platform = MockEntityPlatform(hass, domain="test")
+    await platform.async_add_entities([ent])
+    attributes = hass.states.get(ent.entity_id).attributes
+
+    ent._attr_should_poll = False
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes is attributes
+
+    ent._attr_extra_state_attributes = {"extra": 1}
+    ent.async_write_ha_state()
+    state = hass.states.get(ent.entity_id)
+    assert state.attributes is not attributes
+    assert state.attributes == {ATTR_FRIENDLY_NAME: "Shared", "extra": 1}
+
+    ent._attr_extra_state_attributes = None
+    ent._attr_name = "Renamed"
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes == {ATTR_FRIENDLY_NAME: "Renamed"}
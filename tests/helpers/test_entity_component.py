@@ -115,9 +115,9 @@ async def test_setup_does_discovery(
     assert ("platform_test", {}, {"msg": "discovery_info"}) == mock_setup.call_args[0]
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
+@patch("homeassistant.helpers.entity_platform.EntityPollScheduler.async_poll_platform")
 async def test_set_scan_interval_via_config(
-    mock_track: Mock, hass: HomeAssistant
+    mock_poll: Mock, hass: HomeAssistant
 ) -> None:
     """Test the setting of the scan interval via configuration."""
 
@@ -139,8 +139,8 @@ async def test_set_scan_interval_via_config(
     )
 
     await hass.async_block_till_done()
-    assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    assert mock_poll.called
+    assert timedelta(seconds=30) == mock_poll.call_args[0][0].scan_interval
 
 
 async def test_set_entity_namespace_via_config(hass: HomeAssistant) -> None:
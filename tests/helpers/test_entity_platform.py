@@ -3,8 +3,9 @@ import asyncio
 from collections.abc import Iterable
 from datetime import timedelta
 import logging
+import time
 from typing import Any
-from unittest.mock import ANY, Mock, patch
+from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import pytest
 
@@ -76,6 +77,28 @@ async def test_polling_only_updates_entities_it_should_poll(
     assert poll_ent.async_update.called
 
 
+async def test_polling_entity_starts_polling_later(hass: HomeAssistant) -> None:
+    """Test an entity which starts polling after it was added is polled."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    await component.async_setup({})
+
+    later_poll_ent = MockEntity(should_poll=False)
+    later_poll_ent.async_update = AsyncMock()
+    poll_ent = MockEntity(should_poll=True)
+    poll_ent.async_update = AsyncMock()
+
+    await component.async_add_entities([later_poll_ent, poll_ent])
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+    assert not later_poll_ent.async_update.called
+
+    later_poll_ent._values["should_poll"] = True
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=40))
+    await hass.async_block_till_done()
+    assert later_poll_ent.async_update.called
+
+
 async def test_polling_disabled_by_config_entry(hass: HomeAssistant) -> None:
     """Test the polling of only updated entities."""
     entity_platform = MockEntityPlatform(hass)
@@ -125,6 +148,105 @@ async def test_polling_updates_entities_with_exception(hass: HomeAssistant) -> N
     assert len(update_err) == 1
 
 
+async def test_polling_spread_over_interval(hass: HomeAssistant) -> None:
+    """Test the first polls of entities are spread over the scan interval."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    await component.async_setup({})
+
+    updated = set()
+    entities = [MockEntity(should_poll=True) for _ in range(20)]
+    for entity in entities:
+        entity.async_update = AsyncMock(
+            side_effect=lambda entity=entity: updated.add(entity)
+        )
+    await component.async_add_entities(entities)
+
+    now = dt_util.utcnow()
+    async_fire_time_changed(hass, now + timedelta(seconds=9))
+    await hass.async_block_till_done()
+    assert not updated
+
+    async_fire_time_changed(hass, now + timedelta(seconds=15))
+    await hass.async_block_till_done()
+    assert 0 < len(updated) < 20
+
+    async_fire_time_changed(hass, now + timedelta(seconds=20))
+    await hass.async_block_till_done()
+    assert len(updated) == 20
+
+    scheduler = entity_platform.async_get_poll_scheduler(hass)
+    statistics = scheduler.async_get_statistics()[f"{DOMAIN}.{DOMAIN}"]
+    assert statistics["count"] > 20
+    assert sum(statistics["histogram"].values()) == statistics["count"]
+
+
+async def test_polling_entity_added_again(hass: HomeAssistant) -> None:
+    """Test an entity removed and added again with the same id is polled."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    await component.async_setup({})
+
+    ent = MockEntity(should_poll=True, entity_id=f"{DOMAIN}.polled")
+    await component.async_add_entities([ent])
+    await ent.async_remove()
+
+    ent = MockEntity(should_poll=True, entity_id=f"{DOMAIN}.polled")
+    ent.async_update = AsyncMock()
+    await component.async_add_entities([ent])
+
+    for _ in range(3):
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+        await hass.async_block_till_done()
+    assert len(ent.async_update.mock_calls) == 3
+
+
+async def test_polling_backs_off_unchanged_entities(hass: HomeAssistant) -> None:
+    """Test entities which do not change are polled less often."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    await component.async_setup({})
+
+    ent = MockEntity(should_poll=True)
+    ent.async_update = AsyncMock()
+    await component.async_add_entities([ent])
+
+    for _ in range(entity_platform.UNCHANGED_POLLS_BEFORE_BACKOFF):
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+        await hass.async_block_till_done()
+    assert len(ent.async_update.mock_calls) == 10
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+    assert len(ent.async_update.mock_calls) == 10
+
+    # A changed state restores the scan interval
+    ent._values["state"] = "changed"
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=40))
+    await hass.async_block_till_done()
+    assert len(ent.async_update.mock_calls) == 11
+    assert hass.states.get(ent.entity_id).state == "changed"
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+    assert len(ent.async_update.mock_calls) == 12
+
+
+async def test_polling_backoff_disabled_by_platform(hass: HomeAssistant) -> None:
+    """Test platforms can keep polling unchanged entities every scan interval."""
+    platform = MockPlatform()
+    platform.POLL_BACKOFF = False
+    ent_platform = MockEntityPlatform(
+        hass, platform=platform, scan_interval=timedelta(seconds=20)
+    )
+
+    ent = MockEntity(should_poll=True)
+    ent.async_update = AsyncMock()
+    await ent_platform.async_add_entities([ent])
+
+    for _ in range(entity_platform.UNCHANGED_POLLS_BEFORE_BACKOFF + 2):
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+        await hass.async_block_till_done()
+    assert len(ent.async_update.mock_calls) == 12
+
+
 async def test_update_state_adds_entities(hass: HomeAssistant) -> None:
     """Test if updating poll entities cause an entity to be added works."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -177,9 +299,9 @@ async def test_update_state_adds_entities_with_update_before_add_false(
     assert not ent.update.called
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
+@patch("homeassistant.helpers.entity_platform.EntityPollScheduler.async_poll_platform")
 async def test_set_scan_interval_via_platform(
-    mock_track: Mock, hass: HomeAssistant
+    mock_poll: Mock, hass: HomeAssistant
 ) -> None:
     """Test the setting of the scan interval via platform."""
 
@@ -202,8 +324,8 @@ async def test_set_scan_interval_via_platform(
     component.setup({DOMAIN: {"platform": "platform"}})
 
     await hass.async_block_till_done()
-    assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    assert mock_poll.called
+    assert timedelta(seconds=30) == mock_poll.call_args[0][0].scan_interval
 
 
 async def test_adding_entities_with_generator_and_thread_callback(
@@ -318,7 +440,6 @@ async def test_parallel_updates_async_platform(hass: HomeAssistant) -> None:
     entity = AsyncEntity()
     await handle.async_add_entities([entity])
     assert entity.parallel_updates is None
-    assert handle._update_in_sequence is False
 
 
 async def test_parallel_updates_async_platform_with_constant(
@@ -348,7 +469,6 @@ async def test_parallel_updates_async_platform_with_constant(
     await handle.async_add_entities([entity])
     assert entity.parallel_updates is not None
     assert entity.parallel_updates._value == 2
-    assert handle._update_in_sequence is False
 
 
 async def test_parallel_updates_sync_platform(hass: HomeAssistant) -> None:
@@ -467,9 +587,8 @@ async def test_parallel_updates_async_platform_updates_in_parallel(
     assert entity2.parallel_updates is None
     assert entity3.parallel_updates is None
 
-    assert handle._update_in_sequence is False
-
-    await handle._update_entity_states(dt_util.utcnow())
+    async_fire_time_changed(hass, dt_util.utcnow() + DEFAULT_SCAN_INTERVAL)
+    await hass.async_block_till_done()
     assert peak_update_count > 1
 
 
@@ -495,14 +614,10 @@ async def test_parallel_updates_sync_platform_updates_in_sequence(
         """Mock entity that has update."""
 
         def update(self):
-            pass
-
-        async def async_update_ha_state(self, *args: Any, **kwargs: Any) -> None:
             nonlocal peak_update_count
             updating.append(self.entity_id)
-            await asyncio.sleep(0)
+            time.sleep(0.01)
             peak_update_count = max(len(updating), peak_update_count)
-            await asyncio.sleep(0)
             updating.remove(self.entity_id)
 
     entity1 = SyncEntity()
@@ -517,9 +632,8 @@ async def test_parallel_updates_sync_platform_updates_in_sequence(
     assert entity3.parallel_updates is not None
     assert entity3.parallel_updates._value == 1
 
-    assert handle._update_in_sequence is True
-
-    await handle._update_entity_states(dt_util.utcnow())
+    async_fire_time_changed(hass, dt_util.utcnow() + DEFAULT_SCAN_INTERVAL)
+    await hass.async_block_till_done()
     assert peak_update_count == 1
 
 
@@ -15,11 +15,12 @@ import pytest
 
 from homeassistant.const import MATCH_ALL
 import homeassistant.core as ha
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    TRACK_TIME_PATTERN_GROUPS,
     EventStateChangedData,
     TrackStates,
     TrackTemplate,
@@ -1737,6 +1738,129 @@ async def test_track_template_result_super_template_2_initially_false(
     info3.async_remove()
 
 
+async def test_track_template_result_shares_renders(hass: HomeAssistant) -> None:
+    """Test identical templates are rendered once for all trackers."""
+    templates = [
+        Template("{{ is_state('sensor.test', 'on') }}", hass) for _ in range(3)
+    ]
+    runs: list[list[bool]] = [[], [], []]
+    listeners_before = hass.bus.async_listeners()
+
+    def _make_callback(runs: list[bool]) -> Callable:
+        @callback
+        def _run_callback(
+            event: EventType[EventStateChangedData] | None,
+            updates: list[TrackTemplateResult],
+        ) -> None:
+            runs.append(updates.pop().result)
+
+        return _run_callback
+
+    hass.states.async_set("sensor.test", "off")
+    trackers = [
+        async_track_template_result(
+            hass, [TrackTemplate(template, None)], _make_callback(template_runs)
+        )
+        for template, template_runs in zip(templates, runs)
+    ]
+    for tracker in trackers:
+        tracker.async_refresh()
+    await hass.async_block_till_done()
+    assert runs == [[False], [False], [False]]
+    assert [template._renders for template in templates] == [2, 0, 0]
+
+    hass.states.async_set("sensor.other", "on")
+    hass.states.async_set("sensor.test", "on")
+    await hass.async_block_till_done()
+    assert runs == [[False, True], [False, True], [False, True]]
+    assert [template._renders for template in templates] == [4, 0, 0]
+
+    for tracker in trackers:
+        tracker.async_remove()
+    assert hass.bus.async_listeners() == listeners_before
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ range(1000) | random }}",
+        "{{ integration_entities('test') }}",
+        "{{ states | count }}",
+        "{{ states.light.one.state if now() else '' }}",
+    ],
+)
+async def test_track_template_result_shares_only_tracked_renders(
+    hass: HomeAssistant, template_str: str
+) -> None:
+    """Test renders without entity or domain dependencies are not shared."""
+    hass.states.async_set("light.one", "on")
+    templates = [Template(template_str, hass) for _ in range(2)]
+    trackers = [
+        async_track_template_result(
+            hass, [TrackTemplate(template, None)], lambda event, updates: None
+        )
+        for template in templates
+    ]
+    await hass.async_block_till_done()
+    assert all(template._renders for template in templates)
+
+    for tracker in trackers:
+        tracker.async_remove()
+
+
+async def test_track_template_result_render_cache_invalidation(
+    hass: HomeAssistant,
+) -> None:
+    """Test shared renders are dropped when their dependencies change."""
+    runs = []
+
+    @callback
+    def _run_callback(
+        event: EventType[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(updates.pop().result)
+
+    hass.states.async_set("light.one", "on")
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(Template("{{ states.light | count }}", hass), None)],
+        _run_callback,
+    )
+    await hass.async_block_till_done()
+
+    # A domain dependency drops the cached result when an entity is added
+    hass.states.async_set("light.two", "on")
+    template = Template("{{ states.light | count }}", hass)
+    other_info = async_track_template_result(
+        hass, [TrackTemplate(template, None)], _run_callback
+    )
+    await hass.async_block_till_done()
+    assert runs[-1] == 2
+    assert template._renders == 2
+
+    # Registry updates drop all cached results
+    template = Template("{{ states.light | count }}", hass)
+    hass.bus.async_fire(EVENT_ENTITY_REGISTRY_UPDATED, {"action": "create"})
+    third_info = async_track_template_result(
+        hass, [TrackTemplate(template, None)], _run_callback
+    )
+    await hass.async_block_till_done()
+    assert template._renders == 2
+
+    # Templates with variables are never shared
+    template = Template("{{ states.light | count + offset }}", hass)
+    fourth_info = async_track_template_result(
+        hass, [TrackTemplate(template, {"offset": 1})], _run_callback
+    )
+    fourth_info.async_refresh()
+    await hass.async_block_till_done()
+    assert runs[-1] == 3
+
+    for tracker in (info, other_info, third_info, fourth_info):
+        tracker.async_remove()
+
+
 async def test_track_template_result_complex(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
@@ -3851,6 +3975,107 @@ async def test_async_track_time_change(hass: HomeAssistant) -> None:
     assert len(none_runs) == 3
 
 
+async def test_async_track_utc_time_change_shared_timer(hass: HomeAssistant) -> None:
+    """Test listeners of the same time pattern share a timer."""
+    runs = []
+    removing_runs = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+
+    with patch(
+        "homeassistant.util.dt.utcnow", return_value=time_that_will_not_match_right_away
+    ):
+        unsubs: list[CALLBACK_TYPE] = []
+
+        @callback
+        def remove_other(now: datetime) -> None:
+            removing_runs.append(now)
+            unsubs.pop()()
+
+        unsub_removing = async_track_utc_time_change(hass, remove_other, second=[0, 30])
+        unsubs.extend(
+            async_track_utc_time_change(
+                hass, callback(lambda x: runs.append(x)), second=[0, 30]
+            )
+            for _ in range(3)
+        )
+        scheduled = len(hass.loop._scheduled)
+        unsub_other = async_track_utc_time_change(
+            hass, callback(lambda x: None), second=15
+        )
+        assert len(hass.loop._scheduled) == scheduled + 1
+
+    groups = hass.data[TRACK_TIME_PATTERN_GROUPS]
+    assert len(groups) == 2
+    assert len(groups[((0, 30), (*range(60),), (*range(24),), False)].jobs) == 4
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    # The last listener was removed before it ran
+    assert len(runs) == 2
+    assert runs == removing_runs * 2
+
+    unsub_removing()
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 30, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs) == 4
+
+    for unsub in (*unsubs, unsub_other):
+        unsub()
+    assert not groups
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 1, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs) == 4
+
+
+async def test_async_track_utc_time_change_listener_raises(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a raising listener does not stop the others of its pattern."""
+    runs = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+
+    @callback
+    def raising(now: datetime) -> None:
+        raise ValueError("boom")
+
+    with patch(
+        "homeassistant.util.dt.utcnow", return_value=time_that_will_not_match_right_away
+    ):
+        unsub_raising = async_track_utc_time_change(hass, raising, second=0)
+        unsub = async_track_utc_time_change(
+            hass, callback(lambda x: runs.append(x)), second=0
+        )
+
+    for minute in range(2):
+        async_fire_time_changed(
+            hass,
+            datetime(now.year + 1, 5, 24, 12, minute, 0, 999999, tzinfo=dt_util.UTC),
+        )
+        await hass.async_block_till_done()
+    assert len(runs) == 2
+    assert "Error while running time change listener" in caplog.text
+
+    unsub_raising()
+    unsub()
+
+
 async def test_periodic_task_minute(hass: HomeAssistant) -> None:
     """Test periodic tasks per minute."""
     specific_runs = []
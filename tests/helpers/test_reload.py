@@ -7,17 +7,21 @@ import pytest
 from homeassistant import config
 from homeassistant.const import SERVICE_RELOAD
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.entity_platform import async_get_platforms
 from homeassistant.helpers.reload import (
+    async_forget_on_registry_update,
     async_get_platform_without_config_entry,
     async_integration_yaml_config,
     async_reload_integration_platforms,
     async_setup_reload_service,
+    reload_statistics_info,
 )
 from homeassistant.loader import async_get_integration
 
 from tests.common import (
+    MockConfigEntry,
     MockModule,
     MockPlatform,
     get_fixture_path,
@@ -221,3 +225,42 @@ async def test_async_integration_missing_yaml_config(hass: HomeAssistant) -> Non
         config, "YAML_CONFIG_FILE", yaml_path
     ):
         await async_integration_yaml_config(hass, DOMAIN)
+
+
+async def test_async_forget_on_registry_update(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test data is reset when a registry entry is updated or removed."""
+    async_forget_on_registry_update(hass, "test_cache")
+    hass.data["test_cache"] = {"cached": True}
+
+    config_entry = MockConfigEntry(domain=DOMAIN)
+    config_entry.add_to_hass(hass)
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id, identifiers={(DOMAIN, "1234")}
+    )
+    entity = entity_registry.async_get_or_create("light", DOMAIN, "5678")
+    await hass.async_block_till_done()
+    assert hass.data["test_cache"] == {"cached": True}
+
+    entity_registry.async_update_entity(entity.entity_id, name="Renamed")
+    await hass.async_block_till_done()
+    assert hass.data["test_cache"] == {}
+
+    hass.data["test_cache"] = {"cached": True}
+    device_registry.async_remove_device(device.id)
+    await hass.async_block_till_done()
+    assert hass.data["test_cache"] == {}
+
+
+async def test_reload_statistics_info(hass: HomeAssistant) -> None:
+    """Test the reload statistics system health callback."""
+    info_callback = reload_statistics_info("test_reload_statistics")
+    assert await info_callback(hass) == {}
+
+    hass.data["test_reload_statistics"] = statistics = {"kept": 1}
+    info = await info_callback(hass)
+    assert info == {"kept": 1}
+    assert info is not statistics
@@ -1,8 +1,9 @@
 """Tests for the update coordinator."""
 import asyncio
 from datetime import timedelta
+import gc
 import logging
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import ANY, AsyncMock, Mock, patch
 import urllib.error
 
 import aiohttp
@@ -716,3 +717,138 @@ async def test_always_callback_when_always_update_is_true(
     update_callback.reset_mock()
 
     remove_callbacks()
+
+
+async def test_shared_fetch_key(hass: HomeAssistant) -> None:
+    """Test coordinators with the same fetch key share their fetches."""
+    calls = 0
+    release = asyncio.Event()
+
+    async def refresh() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    crd1, crd2, crd3 = (
+        update_coordinator.DataUpdateCoordinator[int](
+            hass,
+            _LOGGER,
+            name=f"test {idx}",
+            update_method=refresh,
+            update_interval=DEFAULT_UPDATE_INTERVAL,
+            fetch_key="account",
+        )
+        for idx in range(3)
+    )
+    other = get_crd(hass, DEFAULT_UPDATE_INTERVAL)
+    update_callback = Mock()
+    remove_callback = crd3.async_add_listener(update_callback)
+
+    # Concurrent refreshes join the fetch in progress
+    refreshes = asyncio.gather(crd1.async_refresh(), crd2.async_refresh())
+    await asyncio.sleep(0)
+    release.set()
+    await refreshes
+    await other.async_refresh()
+    assert calls == 1
+    assert crd1.data == crd2.data == 1
+
+    # The data is passed on to the other coordinators
+    assert crd3.data == 1
+    update_callback.assert_called_once()
+
+    # Refreshes shortly after a fetch reuse its data
+    await crd3.async_refresh()
+    assert calls == 1
+
+    assert update_coordinator.async_get_shared_fetch_statistics(hass) == {
+        "account": {"coordinators": 3, "fetches": 1, "deduplicated": 2}
+    }
+
+    with patch.object(update_coordinator, "SHARED_FETCH_WINDOW", 0):
+        await crd3.async_refresh()
+    assert calls == 2
+    assert crd1.data == crd2.data == crd3.data == 2
+
+    remove_callback()
+
+
+async def test_shared_fetch_removed_without_coordinators(hass: HomeAssistant) -> None:
+    """Test shared fetches are forgotten once no coordinator uses them."""
+    crd1, crd2 = (
+        update_coordinator.DataUpdateCoordinator[int](
+            hass,
+            _LOGGER,
+            name=f"test {idx}",
+            update_method=AsyncMock(return_value=1),
+            update_interval=DEFAULT_UPDATE_INTERVAL,
+            fetch_key=key,
+        )
+        for idx, key in enumerate(("first", "second"))
+    )
+    shared_fetches = hass.data[update_coordinator.DATA_SHARED_FETCHES]
+    assert set(shared_fetches) == {"first", "second"}
+
+    await crd1.async_shutdown()
+    assert set(shared_fetches) == {"second"}
+
+    # Coordinators garbage collected without being shut down are
+    # forgotten when the next coordinator sharing fetches is created
+    del crd2
+    gc.collect()
+    assert update_coordinator.async_get_shared_fetch_statistics(hass) == {}
+    update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        name="test",
+        update_method=AsyncMock(return_value=1),
+        update_interval=DEFAULT_UPDATE_INTERVAL,
+        fetch_key="first",
+    )
+    assert set(shared_fetches) == {"first"}
+
+
+async def test_statistics(
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test the refresh statistics of a coordinator."""
+    assert crd.statistics.as_dict() == {
+        "refreshes": 0,
+        "failures": 0,
+        "skipped": 0,
+        "total_duration": 0.0,
+        "duration": {"p50": None, "p90": None, "p99": None, "max": None},
+        "data_age": None,
+    }
+
+    crd.always_update = False
+    crd.update_method = AsyncMock(return_value=1)
+    await crd.async_refresh()
+    await crd.async_refresh()
+    crd.update_method.side_effect = update_coordinator.UpdateFailed
+    await crd.async_refresh()
+
+    statistics = crd.statistics.as_dict()
+    assert statistics["refreshes"] == 3
+    assert statistics["failures"] == 1
+    assert statistics["skipped"] == 1
+    assert statistics["data_age"] >= 0
+    assert (
+        statistics["duration"]["p50"]
+        <= statistics["duration"]["p99"]
+        == statistics["duration"]["max"]
+    )
+    assert update_coordinator.async_get_coordinator_statistics(crd.hass) == [
+        {
+            "name": "test",
+            "domain": None,
+            "entry_id": None,
+            "update_interval": 10.0,
+            **statistics,
+            "data_age": ANY,
+        }
+    ]
+
+    await crd.async_shutdown()
+    assert update_coordinator.async_get_coordinator_statistics(crd.hass) == []
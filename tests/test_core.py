@@ -1125,6 +1125,32 @@ async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_reuses_attributes(hass: HomeAssistant) -> None:
+    """Test the attributes of the current state are shared, not copied."""
+    hass.states.async_set("media_player.tv", "on", {"source_list": ["a", "b"]})
+    state = hass.states.get("media_player.tv")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    hass.states.async_set("media_player.tv", "on", state.attributes)
+    await hass.async_block_till_done()
+    assert len(events) == 0
+
+    hass.states.async_set("media_player.tv", "off", state.attributes)
+    await hass.async_block_till_done()
+    assert len(events) == 1
+    new_state = hass.states.get("media_player.tv")
+    assert new_state.attributes is state.attributes
+
+    hass.states.async_set("media_player.tv", "off", {"source_list": ["a", "b"]})
+    await hass.async_block_till_done()
+    assert len(events) == 1
+
+    hass.states.async_set("media_player.tv", "off", {"source_list": ["a"]})
+    await hass.async_block_till_done()
+    assert len(events) == 2
+    assert hass.states.get("media_player.tv").attributes is not state.attributes
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -3,6 +3,7 @@ import importlib
 import io
 import os
 import pathlib
+import time
 from typing import Any
 import unittest
 from unittest.mock import patch
@@ -15,6 +16,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.yaml as yaml
 from homeassistant.util.yaml import loader as yaml_loader
+from homeassistant.util.yaml.cache import YamlCache
 
 from tests.common import get_test_config_dir, patch_yaml_files
 
@@ -580,3 +582,145 @@ def test_string_annotated(try_both_loaders) -> None:
             getattr(value, "__config_file__", None) == expected_annotations[key][1][0]
         )
         assert getattr(value, "__line__", None) == expected_annotations[key][1][1]
+
+
+def _age_files(*paths: pathlib.Path) -> None:
+    """Move the mtime of files out of the racy window of the YAML cache."""
+    past = time.time() - 60
+    for path in paths:
+        os.utime(path, (past, past))
+
+
+def test_load_yaml_cache(tmp_path: pathlib.Path) -> None:
+    """Test unchanged files are served from the YAML cache."""
+    cache = yaml_loader.YAML_CACHE
+    cache.clear()
+    packages = tmp_path / "packages"
+    packages.mkdir()
+    (tmp_path / "configuration.yaml").write_text(
+        "automation: !include automations.yaml\n"
+        "homeassistant:\n"
+        "  packages: !include_dir_merge_named packages\n"
+        "password: !secret password\n"
+    )
+    (tmp_path / "automations.yaml").write_text("- alias: first\n")
+    (packages / "one.yaml").write_text("one:\n  sensor: []\n")
+    (tmp_path / "secrets.yaml").write_text("password: secret\n")
+    _age_files(*tmp_path.rglob("*"), tmp_path)
+
+    def _load() -> dict:
+        return load_yaml_config_file(
+            str(tmp_path / "configuration.yaml"), yaml.Secrets(tmp_path)
+        )
+
+    first = _load()
+    hits = cache.hits
+    second = _load()
+    assert cache.hits == hits + 1
+    assert second == first
+    assert second is not first
+    assert second["automation"][0]["alias"].__line__ == 1
+    assert second["password"] == "secret"
+
+    # Changing an included file only re-parses it and the files including it
+    (tmp_path / "automations.yaml").write_text("- alias: second\n")
+    _age_files(tmp_path / "automations.yaml")
+    misses = cache.misses
+    third = _load()
+    assert third["automation"][0]["alias"] == "second"
+    assert third["homeassistant"]["packages"] == first["homeassistant"]["packages"]
+    assert cache.misses == misses + 2
+
+    # Adding a file to an included directory invalidates the tree
+    (packages / "two.yaml").write_text("two:\n  sensor: []\n")
+    _age_files(packages / "two.yaml", packages)
+    assert set(_load()["homeassistant"]["packages"]) == {"one", "two"}
+
+    # Changing a secret invalidates the tree
+    (tmp_path / "secrets.yaml").write_text("password: other\n")
+    _age_files(tmp_path / "secrets.yaml")
+    assert _load()["password"] == "other"
+
+
+def test_load_yaml_cache_stores_included_trees_once(tmp_path: pathlib.Path) -> None:
+    """Test the entry of a file only references the trees it includes."""
+    cache = YamlCache()
+    config = tmp_path / "configuration.yaml"
+    config.write_text("automation: !include automations.yaml\n")
+    (tmp_path / "automations.yaml").write_text("- alias: included_alias\n")
+    _age_files(*tmp_path.rglob("*"))
+
+    with patch.object(yaml_loader, "YAML_CACHE", cache):
+        first = yaml.load_yaml(str(config))
+        entries = dict(cache._entries)
+        assert (
+            b"included_alias"
+            in entries[(str(tmp_path / "automations.yaml"), None)].data
+        )
+        assert b"included_alias" not in entries[(str(config), None)].data
+
+        second = yaml.load_yaml(str(config))
+        assert second == first
+        assert second["automation"] is not first["automation"]
+        assert second["automation"][0]["alias"].__line__ == 1
+        assert second["automation"].__config_file__ == str(config)
+        assert cache.hits == 1
+
+        # The referenced tree was evicted, the including file is loaded again
+        cache._entries.pop((str(tmp_path / "automations.yaml"), None))
+        assert yaml.load_yaml(str(config)) == first
+        assert cache.hits == 1
+        assert cache.misses == 4
+
+
+def test_load_yaml_cache_max_bytes(tmp_path: pathlib.Path) -> None:
+    """Test the YAML cache is bounded by the size of the cached trees."""
+    first = tmp_path / "one.yaml"
+    first.write_text("key: value\n")
+    second = tmp_path / "two.yaml"
+    second.write_text("key: value\n")
+    large = tmp_path / "large.yaml"
+    large.write_text(f"key: {'x' * 1000}\n")
+    _age_files(first, second, large)
+
+    cache = YamlCache(max_bytes=1000)
+    with patch.object(yaml_loader, "YAML_CACHE", cache):
+        yaml.load_yaml(str(first))
+        size = cache.size
+        assert 0 < size <= 500
+        cache.max_bytes = size * 2 - 1
+        yaml.load_yaml(str(second))
+        assert cache.size == size
+        assert list(cache._entries) == [(str(second), None)]
+
+        # Trees larger than the cache are not stored
+        yaml.load_yaml(str(large))
+        assert cache.size == size
+        assert list(cache._entries) == [(str(second), None)]
+
+        cache.clear()
+        assert cache.size == 0
+
+
+def test_load_yaml_cache_env_var(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test changed environment variables invalidate the YAML cache."""
+    config = tmp_path / "configuration.yaml"
+    config.write_text("password: !env_var PASSWORD\n")
+    _age_files(config)
+    monkeypatch.setenv("PASSWORD", "first")
+    assert yaml.load_yaml(str(config)) == {"password": "first"}
+    monkeypatch.setenv("PASSWORD", "second")
+    assert yaml.load_yaml(str(config)) == {"password": "second"}
+
+
+def test_load_yaml_cache_skips_recent_files(tmp_path: pathlib.Path) -> None:
+    """Test files modified within the racy window are not cached."""
+    cache = yaml_loader.YAML_CACHE
+    config = tmp_path / "configuration.yaml"
+    config.write_text("key: value\n")
+    misses = cache.misses
+    yaml.load_yaml(str(config))
+    yaml.load_yaml(str(config))
+    assert cache.misses == misses + 2